@@ -0,0 +1,13 @@
+-- ==========================================
+-- 001: Composite (latitude, longitude) indexes cho truy vấn bán kính
+-- ==========================================
+-- Các bảng mới tạo bằng SQLAlchemy (create_all) đã có sẵn các index này.
+-- Chạy script này một lần cho database đã tồn tại:
+--   mysql -u <user> -p safetravel < migrations/001_geo_lat_lon_indexes.sql
+
+USE safetravel;
+
+CREATE INDEX ix_incidents_lat_lon ON incidents (latitude, longitude);
+CREATE INDEX ix_sos_alerts_lat_lon ON sos_alerts (latitude, longitude);
+CREATE INDEX ix_user_report_incidents_lat_lon ON user_report_incidents (latitude, longitude);
+CREATE INDEX ix_news_incidents_lat_lon ON news_incidents (latitude, longitude);
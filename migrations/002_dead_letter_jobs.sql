@@ -0,0 +1,22 @@
+-- ==========================================
+-- 002: Bảng dead_letter_jobs cho job queue trong process
+-- ==========================================
+-- Job thất bại sau JOB_MAX_ATTEMPTS lần (hoặc còn trong queue khi app tắt) được lưu ở đây.
+-- Chạy script này một lần cho database đã tồn tại:
+--   mysql -u <user> -p safetravel < migrations/002_dead_letter_jobs.sql
+
+USE safetravel;
+
+CREATE TABLE IF NOT EXISTS dead_letter_jobs (
+    id INT NOT NULL AUTO_INCREMENT,
+    job_id VARCHAR(32),
+    name VARCHAR(100),
+    payload TEXT,
+    attempts INT,
+    error TEXT,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    INDEX ix_dead_letter_jobs_id (id),
+    INDEX ix_dead_letter_jobs_job_id (job_id),
+    INDEX ix_dead_letter_jobs_name (name)
+);
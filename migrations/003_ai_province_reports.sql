@@ -0,0 +1,20 @@
+-- ==========================================
+-- 003: Bảng ai_province_reports (tầng SQL của cache báo cáo du lịch AI)
+-- ==========================================
+-- Mỗi (tỉnh đã chuẩn hoá, ngày) một báo cáo, để worker mới khởi động không phải gọi lại Gemini.
+-- Chạy script này một lần cho database đã tồn tại:
+--   mysql -u <user> -p safetravel < migrations/003_ai_province_reports.sql
+
+USE safetravel;
+
+CREATE TABLE IF NOT EXISTS ai_province_reports (
+    id INT NOT NULL AUTO_INCREMENT,
+    province_key VARCHAR(100) NOT NULL,
+    report_date DATE NOT NULL,
+    province_name VARCHAR(255),
+    payload TEXT NOT NULL,
+    generated_at DATETIME NOT NULL,
+    PRIMARY KEY (id),
+    INDEX ix_ai_province_reports_id (id),
+    UNIQUE KEY uq_ai_province_reports_key_date (province_key, report_date)
+);
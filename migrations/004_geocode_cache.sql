@@ -0,0 +1,20 @@
+-- ==========================================
+-- 004: Bảng geocode_cache (tầng SQL của cache geocode tên địa điểm -> tọa độ)
+-- ==========================================
+-- Trích xuất tin tức chỉ gọi Geoapify cho địa điểm chưa có trong bảng này.
+-- Chạy script này một lần cho database đã tồn tại:
+--   mysql -u <user> -p safetravel < migrations/004_geocode_cache.sql
+
+USE safetravel;
+
+CREATE TABLE IF NOT EXISTS geocode_cache (
+    id INT NOT NULL AUTO_INCREMENT,
+    location_hash VARCHAR(64) NOT NULL,
+    location_name VARCHAR(500) NOT NULL,
+    latitude FLOAT NOT NULL,
+    longitude FLOAT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    INDEX ix_geocode_cache_id (id),
+    UNIQUE KEY uq_geocode_cache_location_hash (location_hash)
+);
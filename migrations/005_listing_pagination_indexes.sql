@@ -0,0 +1,15 @@
+-- ==========================================
+-- 005: Composite (owner, created_at, id) indexes cho phân trang keyset
+-- ==========================================
+-- Danh sách notification, SOS, trip và admin log trả về mới nhất trước, theo (created_at, id),
+-- và trang sau tiếp tục từ ?after=<id>; mỗi trang là một lần quét khoảng trên index này.
+-- Các bảng mới tạo bằng SQLAlchemy (create_all) đã có sẵn các index này.
+-- Chạy script này một lần cho database đã tồn tại:
+--   mysql -u <user> -p safetravel < migrations/005_listing_pagination_indexes.sql
+
+USE safetravel;
+
+CREATE INDEX ix_notifications_user_created_id ON notifications (user_id, created_at, id);
+CREATE INDEX ix_sos_alerts_user_created_id ON sos_alerts (user_id, created_at, id);
+CREATE INDEX ix_trips_user_created_id ON trips (user_id, created_at, id);
+CREATE INDEX ix_admin_logs_admin_created_id ON admin_logs (admin_id, created_at, id);
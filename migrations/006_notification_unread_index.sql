@@ -0,0 +1,12 @@
+-- ==========================================
+-- 006: Index (user_id, is_read) cho notifications
+-- ==========================================
+-- GET /api/notifications/unread_count đếm thông báo chưa đọc chỉ từ index này (không đọc bảng),
+-- và POST /api/notifications/mark_read dùng nó để tìm các dòng cần cập nhật.
+-- Các bảng mới tạo bằng SQLAlchemy (create_all) đã có sẵn index này.
+-- Chạy script này một lần cho database đã tồn tại:
+--   mysql -u <user> -p safetravel < migrations/006_notification_unread_index.sql
+
+USE safetravel;
+
+CREATE INDEX ix_notifications_user_read ON notifications (user_id, is_read);
@@ -0,0 +1,22 @@
+-- ==========================================
+-- 007: Bảng notifications_archive cho job lưu trữ thông báo
+-- ==========================================
+-- Job lưu trữ (NOTIFICATION_RETENTION_ENABLED hoặc scripts/archive_notifications.py) chuyển các
+-- thông báo đã đọc cũ hơn NOTIFICATION_RETENTION_DAYS sang bảng này rồi xóa khỏi notifications.
+-- Bảng chỉ có khóa chính (giữ nguyên id gốc), không có khóa ngoại hay index phụ.
+-- Các bảng mới tạo bằng SQLAlchemy (create_all) đã có sẵn bảng này.
+-- Chạy script này một lần cho database đã tồn tại:
+--   mysql -u <user> -p safetravel < migrations/007_notifications_archive.sql
+
+USE safetravel;
+
+CREATE TABLE IF NOT EXISTS notifications_archive (
+    id INT NOT NULL,
+    user_id INT,
+    title VARCHAR(255),
+    message VARCHAR(255),
+    type VARCHAR(50),
+    created_at DATETIME,
+    archived_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id)
+);
@@ -0,0 +1,23 @@
+-- ==========================================
+-- 008: Gộp thông báo theo (người nhận, người gửi, loại)
+-- ==========================================
+-- sender_id: người gây ra thông báo (người gửi SOS). Khi cùng người gửi tạo thông báo cùng loại
+-- trong NOTIFICATION_COALESCE_WINDOW_SECONDS mà người nhận chưa đọc thông báo trước, thông báo cũ
+-- bị xóa và thay bằng một dòng mới (nội dung mới nhất, coalesced_count cộng dồn), để id và created_at
+-- chỉ tăng và cursor của client (after, up_to) không trỏ tới nội dung chưa xem.
+-- Index (sender_id, type, created_at) dùng để tìm thông báo cần gộp.
+-- Các bảng mới tạo bằng SQLAlchemy (create_all) đã có sẵn các cột và index này.
+-- Chạy script này một lần cho database đã tồn tại (sau 007_notifications_archive.sql):
+--   mysql -u <user> -p safetravel < migrations/008_notification_coalescing.sql
+
+USE safetravel;
+
+ALTER TABLE notifications
+    ADD COLUMN sender_id INT NULL,
+    ADD COLUMN coalesced_count INT NOT NULL DEFAULT 1;
+
+CREATE INDEX ix_notifications_sender_type_created ON notifications (sender_id, type, created_at);
+
+ALTER TABLE notifications_archive
+    ADD COLUMN sender_id INT NULL,
+    ADD COLUMN coalesced_count INT NOT NULL DEFAULT 1;
@@ -0,0 +1,20 @@
+-- ==========================================
+-- 009: Bảng ai_report_refresh_leases (lease làm mới báo cáo AI giữa các worker)
+-- ==========================================
+-- Trước khi pre-warm tạo lại báo cáo của một (tỉnh, ngày), worker giữ lease trong bảng này
+-- đến leased_until; các worker khác bỏ qua báo cáo đó thay vì cùng gọi Gemini.
+-- Các bảng mới tạo bằng SQLAlchemy (create_all) đã có sẵn bảng này.
+-- Chạy script này một lần cho database đã tồn tại (sau 003_ai_province_reports.sql):
+--   mysql -u <user> -p safetravel < migrations/009_ai_report_refresh_leases.sql
+
+USE safetravel;
+
+CREATE TABLE IF NOT EXISTS ai_report_refresh_leases (
+    id INT NOT NULL AUTO_INCREMENT,
+    province_key VARCHAR(100) NOT NULL,
+    report_date DATE NOT NULL,
+    leased_until DATETIME NOT NULL,
+    PRIMARY KEY (id),
+    INDEX ix_ai_report_refresh_leases_id (id),
+    UNIQUE KEY uq_ai_report_refresh_leases_key_date (province_key, report_date)
+);
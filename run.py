@@ -1,3 +1,4 @@
+import asyncio
 import os
 import uvicorn
 from fastapi import FastAPI
@@ -9,12 +10,22 @@ from contextlib import asynccontextmanager
 from src.config.settings import get_settings
 from src.infrastructure.database.sql.database import create_db_and_tables
 import src.infrastructure  # Đảm bảo các Model được nạp
+from src.infrastructure.jobs.worker_pool import get_job_queue
+from src.application.jobs.handlers import register_job_handlers
+from src.application.container import get_container
+from src.application.ai.prewarm import get_report_prewarm_scheduler
+from src.application.news_incident.extraction_jobs import get_news_extraction_jobs
+from src.application.notification.retention import get_notification_retention_job
+from src.infrastructure.geo.forward_geocoder import get_forward_geocoder
+from src.infrastructure.geo.reverse_geocoder import boundaries_required, get_reverse_geocoder
+from src.infrastructure.security.password_pool import get_password_hashing_pool
 
 # Import Routers
 from src.presentation import (
     auth_routes, friend_routes, sos_routes, circle_routes,
     notification_routes, admin_log_routes, user_routes,
-    ai_routes, trip_routes, news_incident_routes, incident_routes
+    ai_routes, trip_routes, news_incident_routes, incident_routes,
+    metrics_routes, stream_routes
 )
 
 load_dotenv()
@@ -26,8 +37,45 @@ async def lifespan(app: FastAPI):
     if settings.ENVIRONMENT == "development":
         print(f"--- [ENV: {settings.ENVIRONMENT}] Khởi tạo database và bảng ---")
         # create_db_and_tables()
+
+    # Repository và use case dùng chung cho mọi request, tạo một lần mỗi worker
+    get_container()
+
+    # Dựng chỉ mục ranh giới tỉnh trước request đầu tiên, ngoài event loop;
+    # kiểm tra trước khi khởi động thread nền để lỗi không bỏ lại worker đang chạy
+    if await asyncio.to_thread(get_reverse_geocoder) is None and boundaries_required():
+        raise RuntimeError(
+            "Thiếu file ranh giới tỉnh (GEO_PROVINCE_BOUNDARIES_PATH); tạo bằng scripts/build_province_boundaries.py "
+            "hoặc đặt GEO_PROVINCE_BOUNDARIES_REQUIRED=false để dùng Geoapify"
+        )
+
+    # Worker pool cho các job nền (fan-out SOS); mỗi uvicorn worker có pool riêng
+    job_queue = get_job_queue()
+    if settings.JOB_QUEUE_ENABLED:
+        register_job_handlers(job_queue)
+        job_queue.start()
+
+    # Làm mới nền báo cáo AI của các tỉnh được hỏi nhiều nhất
+    report_prewarm = get_report_prewarm_scheduler()
+    if settings.AI_PREWARM_ENABLED:
+        report_prewarm.start()
+
+    # Worker trích xuất tin tức chạy nền
+    news_extraction = get_news_extraction_jobs()
+    news_extraction.start()
+
+    # Chuyển thông báo đã đọc cũ sang bảng lưu trữ theo lịch
+    notification_retention = get_notification_retention_job()
+    if settings.NOTIFICATION_RETENTION_ENABLED:
+        notification_retention.start()
     yield
     print(f"--- [ENV: {settings.ENVIRONMENT}] Đang tắt ứng dụng ---")
+    await notification_retention.stop()
+    await news_extraction.stop()
+    await report_prewarm.stop()
+    await get_forward_geocoder().aclose()
+    get_password_hashing_pool().shutdown()
+    job_queue.stop()
 
 def create_app() -> FastAPI:
     app = FastAPI(
@@ -63,6 +111,8 @@ def create_app() -> FastAPI:
         (trip_routes.router, "trips"),
         (news_incident_routes.router, "news_incidents"),
         (incident_routes.router, "incidents"),
+        (metrics_routes.router, "metrics"),
+        (stream_routes.router, "stream"),
     ]
 
     for router, tag in routers:
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Archive read notifications older than --days (the app's DATABASE_URL).
+
+Runs one pass of the notification retention job: read notifications created more
+than --days ago are copied to `notifications_archive` and deleted from
+`notifications`, --batch-size rows looked at per transaction. Meant for cron, or
+for a first large cleanup before enabling NOTIFICATION_RETENTION_ENABLED.
+Existing databases need migrations/007_notifications_archive.sql first.
+
+--dry-run only counts what would be archived. --compact reclaims the freed space
+afterwards (OPTIMIZE TABLE on MySQL, VACUUM on SQLite); it rebuilds the table, so
+run it off-peak.
+
+Usage:
+  python scripts/archive_notifications.py --dry-run
+  python scripts/archive_notifications.py --days 90
+  python scripts/archive_notifications.py --days 30 --batch-size 5000 --pause 0 --compact
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+
+def ensure_repo_importable():
+    # Add project root to sys.path so we can import src.* modules
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = os.path.dirname(script_dir)
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+
+
+def main():
+    ensure_repo_importable()
+    from src.config.settings import get_settings
+
+    settings = get_settings()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--days', type=int, default=settings.NOTIFICATION_RETENTION_DAYS)
+    parser.add_argument('--batch-size', type=int, default=settings.NOTIFICATION_RETENTION_BATCH_SIZE)
+    parser.add_argument('--pause', type=float, default=settings.NOTIFICATION_RETENTION_BATCH_PAUSE_SECONDS,
+                        help='Seconds to sleep after each batch that archived rows')
+    parser.add_argument('--max-batches', type=int, default=None)
+    parser.add_argument('--dry-run', action='store_true', help='Only count the notifications that would be archived')
+    parser.add_argument('--compact', action='store_true', help='Reclaim space afterwards (OPTIMIZE TABLE / VACUUM)')
+    args = parser.parse_args()
+
+    from sqlalchemy import func, text, true
+
+    from src.application.notification.retention import NotificationRetentionJob
+    from src.infrastructure.database.sql.database import SessionLocal, engine
+    from src.infrastructure.notification.models import Notification
+    from src.infrastructure.notification.repository_impl import NotificationRepository
+
+    db = SessionLocal()
+    try:
+        if args.dry_run:
+            cutoff = datetime.now() - timedelta(days=args.days)
+            count = db.query(func.count(Notification.id)).filter(
+                Notification.is_read == true(), Notification.created_at < cutoff
+            ).scalar()
+            print(f"{count} read notifications created before {cutoff:%Y-%m-%d %H:%M} would be archived")
+            return
+
+        job = NotificationRetentionJob(
+            NotificationRepository(),
+            retention_days=args.days,
+            batch_size=args.batch_size,
+            batch_pause_seconds=args.pause,
+        )
+        result = job.run(db, max_batches=args.max_batches)
+        print(json.dumps(result))
+    finally:
+        db.close()
+
+    if args.compact:
+        started = time.perf_counter()
+        if engine.dialect.name == "sqlite":
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+                connection.execute(text("VACUUM"))
+        else:
+            with engine.begin() as connection:
+                connection.execute(text("OPTIMIZE TABLE notifications")).all()
+        print(f"Compacted in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Benchmark FastAPI dependency resolution per route.
+
+For each route below, resolves the route's dependencies the way FastAPI does
+for a request (the same `solve_dependencies` call, with an authenticated user
+whose principal is cached), without running the handler, and prints:
+  * us/req   - mean and p99 time to resolve the dependencies
+  * deps     - distinct dependency functions called per request
+  * sessions - database sessions opened per request (get_db, get_db_session,
+               get_async_db_session resolved)
+
+Points DATABASE_URL at its own database (a temporary SQLite file by default)
+before importing the app, so it never touches the app's data.
+
+Usage:
+  python scripts/bench_dependencies.py
+  python scripts/bench_dependencies.py --requests 5000
+  python scripts/bench_dependencies.py --database-url sqlite:////tmp/bench_deps.db
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import AsyncExitStack
+
+
+def ensure_repo_importable():
+    # Add project root to sys.path so we can import src.* modules
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = os.path.dirname(script_dir)
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+
+
+# (method, route path, path params, query string)
+ROUTES = [
+    ("GET", "/api/users/me", {}, ""),
+    ("GET", "/api/users/{user_id}", {"user_id": "1"}, ""),
+    ("GET", "/api/friends", {}, ""),
+    ("GET", "/api/notifications", {}, "limit=20"),
+    ("GET", "/api/notifications/unread_count", {}, ""),
+    ("GET", "/api/sos/my_alerts", {}, ""),
+    ("GET", "/api/incidents", {}, "latitude=10.77&longitude=106.70&radius=5"),
+    ("GET", "/api/users/{user_id}/trips", {"user_id": "1"}, ""),
+    ("GET", "/api/circles", {}, ""),
+    ("GET", "/api/news-incidents", {}, "latitude=10.77&longitude=106.70"),
+    ("GET", "/api/admins/{admin_id}/admin_logs", {"admin_id": "1"}, ""),
+]
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run(args):
+    from fastapi.dependencies.utils import solve_dependencies
+    from fastapi.routing import APIRoute
+    from starlette.requests import Request
+
+    import src.infrastructure  # noqa: F401 - registers the models
+    from run import app
+    from src.application import dependencies
+    from src.infrastructure.database.sql import database
+    from src.infrastructure.database.sql.database import Base, engine
+    from src.infrastructure.security.security_impl import JwtTokenService
+    from src.infrastructure.user.models import User
+    from src.infrastructure.user.repository_impl import UserRepository
+
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        user_id = connection.execute(User.__table__.select().where(User.username == "bench_deps")).scalar()
+        if user_id is None:
+            user_id = connection.execute(
+                User.__table__.insert().values(username="bench_deps", hashed_password="x", full_name="Bench")
+            ).inserted_primary_key[0]
+    token = JwtTokenService(UserRepository()).create_access_token({"sub": user_id})
+    session_providers = {
+        getattr(module, name)
+        for module in (dependencies, database)
+        for name in ("get_db", "get_db_session", "get_async_db_session", "get_async_db")
+        if hasattr(module, name)
+    }
+    routes = {
+        (method, route.path): route
+        for route in app.routes if isinstance(route, APIRoute)
+        for method in route.methods
+    }
+
+    async def resolve(route, path_params, query_string):
+        scope = {
+            "type": "http", "method": "GET", "path": route.path, "path_params": path_params,
+            "query_string": query_string.encode(), "app": app,
+            "headers": [(b"authorization", f"Bearer {token}".encode())],
+        }
+        async with AsyncExitStack() as stack:
+            scope["fastapi_astack"] = stack
+            values, errors, *_, cache = await solve_dependencies(
+                request=Request(scope), dependant=route.dependant, dependency_cache={}
+            )
+        if errors:
+            raise RuntimeError(f"{route.path}: {errors}")
+        return cache
+
+    print(f"{'route':<36}  {'mean us/req':>11}  {'p99 us/req':>10}  {'deps':>4}  {'sessions':>8}")
+    means = []
+    for method, path, path_params, query_string in ROUTES:
+        route = routes.get((method, path))
+        if route is None:
+            print(f"{method} {path:<32}  (not in this tree)")
+            continue
+        for _ in range(args.warmup):
+            cache = await resolve(route, path_params, query_string)
+        samples = []
+        for _ in range(args.requests):
+            started = time.perf_counter()
+            await resolve(route, path_params, query_string)
+            samples.append((time.perf_counter() - started) * 1e6)
+        sessions = sum(1 for (call, _) in cache if call in session_providers)
+        means.append(statistics.mean(samples))
+        print(
+            f"{method} {path:<32}  {means[-1]:>11.1f}  {percentile(samples, 99):>10.1f}  "
+            f"{len(cache):>4}  {sessions:>8}"
+        )
+    print(f"{'mean over routes':<36}  {statistics.mean(means):>11.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=2000, help='Resolutions timed per route')
+    parser.add_argument('--warmup', type=int, default=50)
+    parser.add_argument('--database-url', default=None, help='Defaults to a temporary SQLite file')
+    args = parser.parse_args()
+
+    temp_dir = None
+    if args.database_url is None:
+        temp_dir = tempfile.TemporaryDirectory()
+        args.database_url = f"sqlite:///{os.path.join(temp_dir.name, 'bench.db')}"
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.pop("ASYNC_DATABASE_URL", None)
+    ensure_repo_importable()
+    try:
+        asyncio.run(run(args))
+    finally:
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+
+if __name__ == '__main__':
+    main()
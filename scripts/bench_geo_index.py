@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Benchmark radius queries: full Haversine scan vs. the in-memory grid index.
+
+Generates synthetic points clustered around Ho Chi Minh City and Hanoi, then runs the
+same random radius queries through a linear scan (what MySQL does today for
+`IncidentRepository.get_within_radius`) and through `GridSpatialIndex`.
+
+Usage:
+  python scripts/bench_geo_index.py
+  python scripts/bench_geo_index.py --points 1000000 --radius-km 5 --queries 500 --scan-queries 20
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+CITY_CENTERS = [
+    (10.7769, 106.7009),  # TP.HCM
+    (21.0278, 105.8342),  # Hà Nội
+]
+
+
+def ensure_repo_importable():
+    # Add project root to sys.path so we can import src.* modules
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = os.path.dirname(script_dir)
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+
+
+def synthetic_points(count, spread_deg, rng):
+    points = []
+    for row_id in range(1, count + 1):
+        center_lat, center_lon = CITY_CENTERS[row_id % len(CITY_CENTERS)]
+        points.append((row_id, rng.gauss(center_lat, spread_deg), rng.gauss(center_lon, spread_deg)))
+    return points
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def report(label, samples_ms):
+    print(
+        f"{label:<12} n={len(samples_ms):<5} "
+        f"p50={percentile(samples_ms, 50):9.3f} ms  "
+        f"p99={percentile(samples_ms, 99):9.3f} ms  "
+        f"mean={statistics.fmean(samples_ms):9.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--points', type=int, default=1_000_000, help='Number of synthetic points')
+    parser.add_argument('--spread-deg', type=float, default=0.15, help='Std-dev of points around each city (degrees)')
+    parser.add_argument('--radius-km', type=float, default=5.0, help='Query radius in kilometers')
+    parser.add_argument('--queries', type=int, default=500, help='Queries against the grid index')
+    parser.add_argument('--scan-queries', type=int, default=20, help='Queries against the full scan (slow)')
+    parser.add_argument('--cell-size-deg', type=float, default=0.05, help='Grid cell size in degrees')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    ensure_repo_importable()
+    from src.infrastructure.geo.spatial_index import GridSpatialIndex, haversine_km
+
+    rng = random.Random(args.seed)
+    print(f"Generating {args.points:,} points around TP.HCM / Hà Nội...")
+    points = synthetic_points(args.points, args.spread_deg, rng)
+
+    started = time.perf_counter()
+    index = GridSpatialIndex(args.cell_size_deg)
+    index.bulk_load(points)
+    print(f"Index build: {time.perf_counter() - started:.2f}s ({len(index):,} points)")
+
+    queries = []
+    for _ in range(max(args.queries, args.scan_queries)):
+        center_lat, center_lon = rng.choice(CITY_CENTERS)
+        queries.append((rng.gauss(center_lat, args.spread_deg), rng.gauss(center_lon, args.spread_deg)))
+
+    scan_ms = []
+    scan_hits = []
+    for latitude, longitude in queries[:args.scan_queries]:
+        started = time.perf_counter()
+        hits = [
+            row_id for row_id, lat, lon in points
+            if haversine_km(latitude, longitude, lat, lon) <= args.radius_km
+        ]
+        scan_ms.append((time.perf_counter() - started) * 1000)
+        scan_hits.append(len(hits))
+
+    index_ms = []
+    for i, (latitude, longitude) in enumerate(queries[:args.queries]):
+        started = time.perf_counter()
+        hits = index.query_radius(latitude, longitude, args.radius_km)
+        index_ms.append((time.perf_counter() - started) * 1000)
+        if i < len(scan_hits) and len(hits) != scan_hits[i]:
+            print(f"Mismatch on query {i}: scan={scan_hits[i]} index={len(hits)}")
+            sys.exit(1)
+
+    print(f"Radius {args.radius_km} km, mean hits/query (scan sample): {statistics.fmean(scan_hits):.0f}")
+    report("full scan", scan_ms)
+    report("grid index", index_ms)
+    print(f"p99 speedup: {percentile(scan_ms, 99) / percentile(index_ms, 99):.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Benchmark the offline reverse geocoder against a linear point-in-polygon scan.
+
+Uses the province boundary file when it exists (--boundaries, or the path the app
+loads); otherwise a synthetic jigsaw of 63 provinces with wavy shared borders over
+Vietnam's bounding box. Reports build time, per-lookup latency of both approaches,
+batch throughput, the share of points flagged ambiguous (those would go to
+Geoapify) and disagreements with the linear scan on non-ambiguous points.
+
+Usage:
+  python scripts/bench_reverse_geocoder.py
+  python scripts/bench_reverse_geocoder.py --points 200000 --cell-size 0.1
+  python scripts/bench_reverse_geocoder.py --boundaries /path/to/vn_provinces.geojson
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+
+def ensure_repo_importable():
+    # Add project root to sys.path so we can import src.* modules
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = os.path.dirname(script_dir)
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+
+
+def synthetic_provinces(cols=7, rows=9, points_per_edge=40, seed=7):
+    """A cols x rows jigsaw over 102.1-109.5E / 8.5-23.4N; neighbours share their wavy edges exactly."""
+    rng = random.Random(seed)
+    min_x, max_x, min_y, max_y = 102.1, 109.5, 8.5, 23.4
+    step_x, step_y = (max_x - min_x) / cols, (max_y - min_y) / rows
+    corners = {}
+    for i in range(rows + 1):
+        for j in range(cols + 1):
+            inner = 0 < i < rows and 0 < j < cols
+            jitter_x = rng.uniform(-0.25, 0.25) * step_x if inner else 0.0
+            jitter_y = rng.uniform(-0.25, 0.25) * step_y if inner else 0.0
+            corners[i, j] = (min_x + j * step_x + jitter_x, min_y + i * step_y + jitter_y)
+
+    edges = {}
+
+    def edge(a, b):
+        # Points from corner a to corner b (b excluded), computed once per undirected edge
+        key = (min(a, b), max(a, b))
+        if key not in edges:
+            (x1, y1), (x2, y2) = corners[key[0]], corners[key[1]]
+            length = math.hypot(x2 - x1, y2 - y1)
+            nx, ny = -(y2 - y1) / length, (x2 - x1) / length
+            outer = key[0][0] in (0, rows) and key[1][0] == key[0][0] or key[0][1] in (0, cols) and key[1][1] == key[0][1]
+            amplitude = 0.0 if outer else rng.uniform(0.02, 0.06)
+            waves = rng.randint(2, 6)
+            points = []
+            for k in range(points_per_edge):
+                t = k / points_per_edge
+                offset = amplitude * math.sin(math.pi * waves * t)
+                points.append((x1 + t * (x2 - x1) + offset * nx, y1 + t * (y2 - y1) + offset * ny))
+            edges[key] = points
+        points = edges[key]
+        if key[0] == a:
+            return points
+        return [corners[b]] + points[:0:-1]
+
+    provinces = []
+    for i in range(rows):
+        for j in range(cols):
+            ring = []
+            for a, b in (((i, j), (i, j + 1)), ((i, j + 1), (i + 1, j + 1)), ((i + 1, j + 1), (i + 1, j)), ((i + 1, j), (i, j))):
+                ring.extend(edge(a, b))
+            ring.append(ring[0])
+            provinces.append((f"Province {i * cols + j + 1:02d}", [[ring]]))
+    return provinces
+
+
+class LinearScan:
+    """Bounding-box filter plus even-odd test over every ring: what a naive lookup would do."""
+
+    def __init__(self, provinces):
+        self.entries = []
+        for name, polygons in provinces:
+            rings = [ring for polygon in polygons for ring in polygon]
+            xs = [p[0] for ring in rings for p in ring]
+            ys = [p[1] for ring in rings for p in ring]
+            self.entries.append((name, min(xs), min(ys), max(xs), max(ys), rings))
+
+    def lookup(self, lat, lon):
+        for name, min_x, min_y, max_x, max_y, rings in self.entries:
+            if not (min_x <= lon <= max_x and min_y <= lat <= max_y):
+                continue
+            inside = False
+            for ring in rings:
+                for (x1, y1), (x2, y2) in zip(ring, ring[1:] + ring[:1]):
+                    if (y1 > lat) != (y2 > lat) and lon < x1 + (lat - y1) * (x2 - x1) / (y2 - y1):
+                        inside = not inside
+            if inside:
+                return name
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--boundaries', default=None, help='GeoJSON boundaries (defaults to the bundled file, else synthetic)')
+    parser.add_argument('--points', type=int, default=100000)
+    parser.add_argument('--linear-points', type=int, default=5000, help='Points for the (slow) linear scan')
+    parser.add_argument('--cell-size', type=float, default=0.05)
+    parser.add_argument('--tolerance', type=float, default=0.005)
+    args = parser.parse_args()
+
+    ensure_repo_importable()
+    from src.infrastructure.geo.reverse_geocoder import (
+        DEFAULT_BOUNDARIES_PATH, ProvinceReverseGeocoder, load_province_boundaries,
+    )
+
+    path = args.boundaries or DEFAULT_BOUNDARIES_PATH
+    if os.path.exists(path):
+        provinces = load_province_boundaries(path)
+        source = path
+    else:
+        provinces = synthetic_provinces()
+        source = "synthetic jigsaw"
+    edge_count = sum(len(ring) for _, polygons in provinces for polygon in polygons for ring in polygon)
+    print(f"Boundaries: {source} ({len(provinces)} provinces, {edge_count} edges)")
+
+    started = time.perf_counter()
+    geocoder = ProvinceReverseGeocoder(provinces, cell_size_deg=args.cell_size, border_tolerance_deg=args.tolerance)
+    print(f"Build: {(time.perf_counter() - started) * 1000:.0f} ms, {geocoder.stats()}")
+
+    rng = random.Random(1)
+    points = [(rng.uniform(8.5, 23.4), rng.uniform(102.1, 109.5)) for _ in range(args.points)]
+
+    started = time.perf_counter()
+    single = [geocoder.lookup(lat, lon) for lat, lon in points]
+    elapsed = time.perf_counter() - started
+    print(f"lookup:      {elapsed / len(points) * 1e6:.2f} us/point")
+
+    started = time.perf_counter()
+    batch = geocoder.lookup_many(points)
+    elapsed = time.perf_counter() - started
+    print(f"lookup_many: {elapsed / len(points) * 1e6:.2f} us/point ({len(points) / elapsed:,.0f} points/s)")
+    assert batch == single, "lookup_many disagrees with lookup"
+
+    ambiguous = sum(1 for result in single if result.ambiguous)
+    print(f"Ambiguous (sent to Geoapify): {ambiguous} ({ambiguous / len(points):.2%})")
+
+    linear = LinearScan(provinces)
+    sample = points[:args.linear_points]
+    started = time.perf_counter()
+    expected = [linear.lookup(lat, lon) for lat, lon in sample]
+    elapsed = time.perf_counter() - started
+    print(f"linear scan: {elapsed / len(sample) * 1e6:.2f} us/point")
+
+    mismatches = sum(
+        1 for result, name in zip(single, expected)
+        if not result.ambiguous and result.province_name != name
+    )
+    print(f"Mismatches on non-ambiguous points: {mismatches} / {len(sample)}")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
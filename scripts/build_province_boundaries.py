@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Build the province boundary file used by the offline reverse geocoder.
+
+Reads an ADM1 (province level) GeoJSON for Vietnam, e.g. geoBoundaries VNM ADM1
+or GADM level 1, maps each feature to a name from VIETNAM_PROVINCES, simplifies
+the rings (Douglas-Peucker, --simplify-deg) and rounds coordinates to --precision
+digits, so the bundled file stays small. Features whose name does not match a
+province are reported and kept under their source name.
+
+Usage:
+  python scripts/build_province_boundaries.py geoBoundaries-VNM-ADM1.geojson
+  python scripts/build_province_boundaries.py gadm41_VNM_1.json --name-property NAME_1 --simplify-deg 0.001
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+
+
+def ensure_repo_importable():
+    # Add project root to sys.path so we can import src.* modules
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = os.path.dirname(script_dir)
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+
+
+def simplify(points, tolerance):
+    """Douglas-Peucker on a list of (lon, lat), keeping both end points."""
+    if len(points) < 3 or tolerance <= 0:
+        return list(points)
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        (x1, y1), (x2, y2) = points[first][:2], points[last][:2]
+        dx, dy = x2 - x1, y2 - y1
+        length_sq = dx * dx + dy * dy
+        farthest, max_dist_sq = None, tolerance * tolerance
+        for i in range(first + 1, last):
+            x, y = points[i][:2]
+            t = 0.0 if length_sq == 0 else max(0.0, min(1.0, ((x - x1) * dx + (y - y1) * dy) / length_sq))
+            dist_sq = (x1 + t * dx - x) ** 2 + (y1 + t * dy - y) ** 2
+            if dist_sq > max_dist_sq:
+                farthest, max_dist_sq = i, dist_sq
+        if farthest is not None:
+            keep[farthest] = True
+            stack.extend([(first, farthest), (farthest, last)])
+    return [p for p, kept in zip(points, keep) if kept]
+
+
+def simplify_ring(ring, tolerance, precision):
+    # Split the closed ring in two so the end points of each half are real corners
+    half = len(ring) // 2
+    points = simplify(ring[:half + 1], tolerance)[:-1] + simplify(ring[half:], tolerance)
+    points = [[round(x, precision), round(y, precision)] for x, y, *_ in points]
+    deduped = [p for i, p in enumerate(points) if i == 0 or p != points[i - 1]]
+    return deduped if len(deduped) >= 4 else None
+
+
+def match_key(name):
+    # 'Bà Rịa–Vũng Tàu', 'Ba Ria - Vung Tau' and 'Ho Chi Minh City' compare equal to the canonical names
+    from src.application.ai.provinces import normalize_province_name
+    key = normalize_province_name(name)
+    for suffix in (" city", " province"):
+        if key.endswith(suffix):
+            key = key[:-len(suffix)]
+    key = re.sub(r"[^a-z0-9]", "", key)
+    return {"hue": "thuathienhue"}.get(key, key)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('source', help='GeoJSON FeatureCollection of provinces')
+    parser.add_argument('--name-property', default='shapeName', help='Feature property holding the province name')
+    parser.add_argument('--simplify-deg', type=float, default=0.002, help='Douglas-Peucker tolerance in degrees (~200m)')
+    parser.add_argument('--precision', type=int, default=4, help='Decimal digits kept per coordinate')
+    parser.add_argument('--output', default=None, help='Defaults to the path the app loads')
+    args = parser.parse_args()
+
+    ensure_repo_importable()
+    from src.application.ai.provinces import VIETNAM_PROVINCES
+    from src.infrastructure.geo.reverse_geocoder import DEFAULT_BOUNDARIES_PATH
+
+    provinces_by_key = {match_key(name): name for name in VIETNAM_PROVINCES}
+    with open(args.source, "r", encoding="utf-8") as f:
+        source = json.load(f)
+
+    features, unmatched, points_in, points_out = [], [], 0, 0
+    for feature in source.get("features", []):
+        geometry = feature.get("geometry") or {}
+        if geometry.get("type") == "Polygon":
+            polygons = [geometry["coordinates"]]
+        elif geometry.get("type") == "MultiPolygon":
+            polygons = geometry["coordinates"]
+        else:
+            continue
+        raw_name = feature.get("properties", {}).get(args.name_property, "")
+        name = provinces_by_key.get(match_key(raw_name))
+        if name is None:
+            unmatched.append(raw_name)
+            name = raw_name
+
+        simplified = []
+        for polygon in polygons:
+            rings = []
+            for index, ring in enumerate(polygon):
+                points_in += len(ring)
+                ring = simplify_ring(ring, args.simplify_deg, args.precision)
+                if ring is None:
+                    if index == 0:
+                        break # Outer ring collapsed: drop the islet, holes included
+                    continue
+                points_out += len(ring)
+                rings.append(ring)
+            if rings:
+                simplified.append(rings)
+        if simplified:
+            features.append({
+                "type": "Feature",
+                "properties": {"name": name},
+                "geometry": {"type": "MultiPolygon", "coordinates": simplified},
+            })
+
+    output = args.output or DEFAULT_BOUNDARIES_PATH
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({"type": "FeatureCollection", "features": features}, f, ensure_ascii=False, separators=(",", ":"))
+
+    names = {feature["properties"]["name"] for feature in features}
+    print(f"Wrote {len(features)} features ({len(names)} provinces) to {output}")
+    print(f"Points: {points_in} -> {points_out} ({os.path.getsize(output) / 1024:.0f} KiB)")
+    missing = [name for name in VIETNAM_PROVINCES if name not in names]
+    if unmatched:
+        print(f"Not matched to a province (kept as-is): {', '.join(unmatched)}")
+    if missing:
+        print(f"Provinces without a boundary: {', '.join(missing)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Concurrency regression check for the radius queries behind the async routes.
+
+The async routes call the sync repositories through `AsyncSession.run_sync`, which
+runs them as greenlets on the event-loop thread. Code on that path must not hold a
+thread lock across a query: a second greenlet blocking on the lock stops the loop,
+and the first one never gets to finish its query.
+
+Runs --concurrency radius queries at once for every table behind the spatial index,
+first on a cold index (SQL fallback while the index builds in the background), then
+on a warm one (incremental refresh), then right after the rebuild interval expires. Fails if a round does not finish in
+--timeout seconds. A watchdog thread does the timing, because a blocked loop would
+never fire `asyncio.wait_for`.
+
+Uses its own database (a temporary SQLite file by default).
+
+Usage:
+  python scripts/check_async_geo_concurrency.py
+  python scripts/check_async_geo_concurrency.py --concurrency 16 --rows 5000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+
+
+def ensure_repo_importable():
+    # Add project root to sys.path so we can import src.* modules
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = os.path.dirname(script_dir)
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+
+
+def start_watchdog(timeout: float, label: str) -> threading.Event:
+    done = threading.Event()
+
+    def watch():
+        if not done.wait(timeout):
+            print(f"FAIL  {label}: concurrent queries did not finish within {timeout:.0f}s (event loop blocked)")
+            sys.stdout.flush()
+            os._exit(1)
+
+    threading.Thread(target=watch, daemon=True).start()
+    return done
+
+
+async def run(args):
+    import random
+
+    import src.infrastructure  # noqa: F401 - registers the models
+    from src.infrastructure.database.sql.database import AsyncSessionLocal, Base, SessionLocal, engine
+    from src.infrastructure.geo import spatial_index
+    from src.infrastructure.incident.models import Incident
+    from src.infrastructure.incident.repository_impl import IncidentRepository
+    from src.infrastructure.news_incident.models import NewsIncident
+    from src.infrastructure.news_incident.repository_impl import NewsIncidentRepository
+    from src.infrastructure.sos_alert.models import SOSAlert
+    from src.infrastructure.sos_alert.repository_impl import SOSAlertRepository
+    from src.infrastructure.user.models import User
+
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(7)
+    db = SessionLocal()
+    try:
+        user = User(username="geo_concurrency", hashed_password="x")
+        db.add(user)
+        db.flush()
+        for _ in range(args.rows):
+            latitude, longitude = 10.7 + rng.uniform(-0.2, 0.2), 106.7 + rng.uniform(-0.2, 0.2)
+            db.add(Incident(title="check", latitude=latitude, longitude=longitude))
+            db.add(NewsIncident(title="check", latitude=latitude, longitude=longitude,
+                                source_url=f"https://example.com/{len(db.new)}", source_url_hash=f"{rng.getrandbits(128):032x}"))
+            db.add(SOSAlert(user_id=user.id, latitude=latitude, longitude=longitude))
+        db.commit()
+    finally:
+        db.close()
+
+    queries = [
+        ("incidents", lambda s: IncidentRepository().get_within_radius(s, 10.7, 106.7, 5.0)),
+        ("news_incidents", lambda s: NewsIncidentRepository().get_within_radius(s, 10.7, 106.7, 0.05)),
+        ("sos_alerts", lambda s: SOSAlertRepository().get_sos_alerts_within_radius(s, 10.7, 106.7, 0.05)),
+    ]
+
+    async def one(query):
+        async with AsyncSessionLocal() as session:
+            return await session.run_sync(query)
+
+    async def round_(label):
+        done = start_watchdog(args.timeout, label)
+        started = time.perf_counter()
+        results = await asyncio.gather(*(one(query) for _, query in queries for _ in range(args.concurrency)))
+        done.set()
+        sizes = {len(result) for result in results}
+        print(f"ok    {label}: {len(results)} queries in {(time.perf_counter() - started) * 1000:.0f} ms, hits per query {sorted(sizes)}")
+
+    async def wait_for_builds():
+        deadline = time.monotonic() + args.timeout
+        while any(index._last_rebuild is None or index._rebuilding for index in spatial_index._indexes.values()):
+            if time.monotonic() > deadline:
+                print("FAIL  background index build did not finish")
+                sys.exit(1)
+            await asyncio.sleep(0.05)
+
+    await round_("cold index")
+    await wait_for_builds()
+    await round_("warm index")
+    for index in spatial_index._indexes.values():
+        index._last_rebuild = time.monotonic() - index.rebuild_seconds - 1
+    await round_("rebuild due")
+    await wait_for_builds()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--concurrency', type=int, default=8, help='Concurrent queries per table')
+    parser.add_argument('--rows', type=int, default=2000, help='Rows per table')
+    parser.add_argument('--timeout', type=float, default=30.0)
+    args = parser.parse_args()
+
+    temp_dir = tempfile.TemporaryDirectory()
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(temp_dir.name, 'check.db')}"
+    os.environ.pop("ASYNC_DATABASE_URL", None)
+    os.environ["GEO_INDEX_ENABLED"] = "true"
+    ensure_repo_importable()
+    try:
+        asyncio.run(run(args))
+    finally:
+        temp_dir.cleanup()
+
+
+if __name__ == '__main__':
+    main()
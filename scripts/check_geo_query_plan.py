@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Query-plan regression check for the SQL radius queries.
+
+Runs EXPLAIN on the bounding-box queries built by `src/infrastructure/geo/queries.py`
+for every table with lat/lon columns, and fails if the (latitude, longitude) index
+is not used. Works against MySQL (`EXPLAIN`) and SQLite (`EXPLAIN QUERY PLAN`).
+
+Usage:
+  python scripts/check_geo_query_plan.py              # uses DATABASE_URL from .env
+  python scripts/check_geo_query_plan.py --create-tables
+"""
+
+import argparse
+import os
+import sys
+
+
+def ensure_repo_importable():
+    # Add project root to sys.path so we can import src.* modules
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = os.path.dirname(script_dir)
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+
+
+def explain(session, query):
+    dialect = session.bind.dialect.name
+    sql = str(query.statement.compile(dialect=session.bind.dialect, compile_kwargs={"literal_binds": True}))
+    from sqlalchemy import text
+
+    if dialect == "sqlite":
+        rows = session.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+        return [row[-1] for row in rows]
+    rows = session.execute(text(f"EXPLAIN {sql}")).mappings().all()
+    return [f"key={row.get('key')} possible_keys={row.get('possible_keys')}" for row in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--create-tables', action='store_true', help='Create missing tables before checking')
+    parser.add_argument('--latitude', type=float, default=10.7769)
+    parser.add_argument('--longitude', type=float, default=106.7009)
+    args = parser.parse_args()
+
+    ensure_repo_importable()
+    from src.infrastructure.database.sql.database import Base, SessionLocal, engine
+    from src.infrastructure.geo.queries import select_within_box, select_within_radius_km
+    from src.infrastructure.incident.models import Incident
+    from src.infrastructure.news_incident.models import NewsIncident
+    from src.infrastructure.sos_alert.models import SOSAlert
+    from src.infrastructure.user_report_incident.models import UserReportIncident
+
+    if args.create_tables:
+        Base.metadata.create_all(bind=engine)
+
+    session = SessionLocal()
+    failures = 0
+    try:
+        checks = [
+            (Incident, select_within_radius_km(session, Incident, args.latitude, args.longitude, 5.0)),
+            (SOSAlert, select_within_box(session, SOSAlert, args.latitude, args.longitude, 0.5)),
+            (
+                UserReportIncident,
+                select_within_box(
+                    session, UserReportIncident, args.latitude, args.longitude, 0.5,
+                    UserReportIncident.status == "active",
+                ),
+            ),
+            (NewsIncident, select_within_box(session, NewsIncident, args.latitude, args.longitude, 0.5)),
+        ]
+        for model, query in checks:
+            index_name = f"ix_{model.__tablename__}_lat_lon"
+            plan = explain(session, query)
+            ok = any(index_name in line for line in plan)
+            failures += 0 if ok else 1
+            print(f"[{'OK' if ok else 'FAIL'}] {model.__tablename__}: expected {index_name}")
+            for line in plan:
+                print(f"    {line}")
+    finally:
+        session.close()
+
+    if failures:
+        print(f"{failures} radius quer{'y' if failures == 1 else 'ies'} not using the lat/lon index")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Query-count regression check for the batched user / circle-member lookups.
+
+Counts the SQL statements each call sends (a `before_cursor_execute` listener on
+the engine) for safety networks of --sizes members, and fails if:
+  * `get_users_by_ids` or `get_members_by_circle_ids` takes more than one query, or
+  * `GetIncidentsUseCase.execute` or `SOSAlertUseCases.get_incidents_for_map`
+    sends a different number of queries for different network sizes (N+1).
+
+Runs against its own temporary SQLite file, with the in-memory geo index and the
+safety network cache off so every call goes to SQL.
+
+Usage:
+  python scripts/check_query_counts.py
+  python scripts/check_query_counts.py --sizes 10 100 1000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+
+def ensure_repo_importable():
+    # Add project root to sys.path so we can import src.* modules
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = os.path.dirname(script_dir)
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+
+
+def run(args):
+    from sqlalchemy import event
+
+    import src.infrastructure  # noqa: F401 - registers the models
+    from src.application.incident.dto import GetIncidentsRequestDTO
+    from src.application.incident.use_cases import GetIncidentsUseCase
+    from src.application.notification.use_cases import NotificationUseCases
+    from src.application.sos_alert.use_cases import SOSAlertUseCases
+    from src.infrastructure.circle.member_models import CircleMember
+    from src.infrastructure.circle.member_repository_impl import CircleMemberRepository
+    from src.infrastructure.circle.models import Circle
+    from src.infrastructure.database.sql.database import Base, SessionLocal, engine
+    from src.infrastructure.friend.models import Friendship
+    from src.infrastructure.incident.repository_impl import IncidentRepository
+    from src.infrastructure.notification.repository_impl import NotificationRepository
+    from src.infrastructure.safety_network.resolver_impl import SafetyNetworkResolver
+    from src.infrastructure.sos_alert.models import SOSAlert
+    from src.infrastructure.sos_alert.repository_impl import SOSAlertRepository
+    from src.infrastructure.user.models import User
+    from src.infrastructure.user.repository_impl import UserRepository
+
+    Base.metadata.create_all(bind=engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *a, **kw: statements.append(a[2]))
+
+    def count(call):
+        db = SessionLocal()
+        try:
+            statements.clear()
+            result = call(db)
+            return len(statements), result
+        finally:
+            db.close()
+
+    # One viewer per size, with `size` friends in circles of 10, each friend with an open SOS
+    groups = []
+    db = SessionLocal()
+    try:
+        for group, size in enumerate(args.sizes):
+            latitude, longitude = 10.0 + 3 * group, 106.0
+            viewer = User(username=f"query_counts_{size}", hashed_password="x")
+            db.add(viewer)
+            db.flush()
+            friends = [User(username=f"query_counts_{size}_{i}", hashed_password="x") for i in range(size)]
+            db.add_all(friends)
+            db.flush()
+            circles = [Circle(circle_name=f"qc_{size}_{i}", owner_id=viewer.id, status="active") for i in range(0, size, 10)]
+            db.add_all(circles)
+            db.flush()
+            for i, friend in enumerate(friends):
+                db.add(Friendship(user_id=viewer.id, friend_id=friend.id))
+                db.add(CircleMember(circle_id=circles[i // 10].id, member_id=friend.id, role="member"))
+                db.add(SOSAlert(user_id=friend.id, latitude=latitude, longitude=longitude, status="pending"))
+            groups.append((size, viewer.id, [f.id for f in friends], [c.id for c in circles], latitude, longitude))
+        db.commit()
+    finally:
+        db.close()
+
+    resolver = SafetyNetworkResolver()
+    get_incidents = GetIncidentsUseCase(IncidentRepository(), SOSAlertRepository(), resolver, UserRepository())
+    sos_alerts = SOSAlertUseCases(SOSAlertRepository(), NotificationUseCases(NotificationRepository()), UserRepository(), resolver)
+
+    failures = 0
+    per_size = {"GetIncidentsUseCase.execute": {}, "SOSAlertUseCases.get_incidents_for_map": {}}
+    print(f"{'network':>7}  {'get_users_by_ids':>16}  {'get_members_by_circle_ids':>25}  {'get_incidents':>13}  {'map':>4}")
+    for size, viewer_id, friend_ids, circle_ids, latitude, longitude in groups:
+        users_queries, users = count(lambda db: UserRepository().get_users_by_ids(db, friend_ids))
+        members_queries, members = count(lambda db: CircleMemberRepository().get_members_by_circle_ids(db, circle_ids))
+        incidents_queries, incidents = count(lambda db: get_incidents.execute(
+            db, GetIncidentsRequestDTO(user_id=viewer_id, latitude=latitude, longitude=longitude, radius=0.5)
+        ))
+        map_queries, map_items = count(lambda db: sos_alerts.get_incidents_for_map(db, viewer_id, latitude, longitude, 0.01))
+        per_size["GetIncidentsUseCase.execute"][size] = incidents_queries
+        per_size["SOSAlertUseCases.get_incidents_for_map"][size] = map_queries
+        print(f"{size:>7}  {users_queries:>16}  {members_queries:>25}  {incidents_queries:>13}  {map_queries:>4}")
+
+        if len(users) != size or len(members) != size or len(map_items) != size:
+            print(f"FAIL  network {size}: expected {size} users, members and map items, got {len(users)}, {len(members)}, {len(map_items)}")
+            failures += 1
+        for name, queries in (("get_users_by_ids", users_queries), ("get_members_by_circle_ids", members_queries)):
+            if queries != 1:
+                print(f"FAIL  {name} sent {queries} queries for {size} ids (expected 1)")
+                failures += 1
+
+    for name, counts in per_size.items():
+        if len(set(counts.values())) != 1:
+            print(f"FAIL  {name} query count grows with the network: {counts}")
+            failures += 1
+
+    if failures:
+        sys.exit(1)
+    print("ok    query counts are constant in the network size")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 500], help='Safety network sizes to compare')
+    args = parser.parse_args()
+
+    temp_dir = tempfile.TemporaryDirectory()
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(temp_dir.name, 'check.db')}"
+    os.environ.pop("ASYNC_DATABASE_URL", None)
+    os.environ["GEO_INDEX_ENABLED"] = "false"
+    os.environ["SAFETY_NETWORK_CACHE_ENABLED"] = "false"
+    ensure_repo_importable()
+    try:
+        run(args)
+    finally:
+        temp_dir.cleanup()
+
+
+if __name__ == '__main__':
+    main()
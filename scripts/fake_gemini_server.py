@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Fake Gemini server for exercising the AI gateway without calling Google.
+
+Answers `POST /{version}/models/{model}:generateContent` after --latency seconds
+(plus up to --jitter), and fails a --error-rate share of calls with --error-status
+(429 by default). JSON-mode requests get a canned report for /api/weather, or a canned
+incident list for news extraction jobs (schema with `incidents`), everything else a
+short text. Point the app at it with:
+
+  GEMINI_BASE_URL=http://127.0.0.1:9100 uvicorn run:app
+
+Usage:
+  python scripts/fake_gemini_server.py
+  python scripts/fake_gemini_server.py --latency 5 --error-rate 0.3 --error-status 503
+"""
+
+import argparse
+import asyncio
+import json
+import random
+from datetime import date, timedelta
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+def canned_report(day: date) -> dict:
+    return {
+        "provinces": [{
+            "province_name": "Thành phố Hồ Chí Minh",
+            "report_date": day.isoformat(),
+            "weather_forecast": [
+                {"date": (day + timedelta(days=i)).isoformat(), "temperature": "25-33°C", "condition": "Nắng, chiều có mưa rào"}
+                for i in range(3)
+            ],
+            "travel_advice": [
+                {"category": "Trang phục", "advice": "Mang theo áo mưa mỏng cho các cơn mưa chiều."},
+                {"category": "Di chuyển", "advice": "Tránh các tuyến hay ngập vào giờ cao điểm."},
+                {"category": "An toàn", "advice": "Giữ điện thoại cẩn thận khi đi xe ôm công nghệ."},
+            ],
+            "executive_summary": "Báo cáo giả lập từ fake_gemini_server.",
+            "sources": ["http://127.0.0.1/fake"],
+            "score": 80,
+        }]
+    }
+
+
+def canned_incidents(day: date) -> dict:
+    return {
+        "incidents": [{
+            "title": "Ngập sâu sau mưa lớn",
+            "summary": "Tin giả lập từ fake_gemini_server.",
+            "category": "flood",
+            "location_name": "Quận 1, Thành phố Hồ Chí Minh",
+            "source_url": f"http://127.0.0.1/fake/{day.isoformat()}/{i}",
+            "published_at": f"{day.isoformat()}T08:00:00",
+            "severity": 40,
+        } for i in range(3)]
+    }
+
+
+def build_app(args) -> FastAPI:
+    app = FastAPI()
+    stats = {"requests": 0, "errors": 0, "in_flight": 0, "max_in_flight": 0, "cancelled": 0}
+
+    @app.post("/{api_version}/models/{model_action}")
+    async def generate_content(api_version: str, model_action: str, request: Request):
+        body = await request.json()
+        stats["requests"] += 1
+        stats["in_flight"] += 1
+        stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+        try:
+            await asyncio.sleep(args.latency + random.uniform(0, args.jitter))
+        except asyncio.CancelledError:
+            stats["cancelled"] += 1
+            raise
+        finally:
+            stats["in_flight"] -= 1
+
+        if random.random() < args.error_rate:
+            stats["errors"] += 1
+            return JSONResponse(
+                status_code=args.error_status,
+                content={"error": {"code": args.error_status, "message": "fake failure", "status": "UNAVAILABLE"}},
+            )
+
+        generation_config = body.get("generationConfig") or {}
+        if generation_config.get("responseMimeType") == "application/json":
+            if "incidents" in json.dumps(generation_config):
+                text = json.dumps(canned_incidents(date.today()), ensure_ascii=False)
+            else:
+                text = json.dumps(canned_report(date.today()), ensure_ascii=False)
+        else:
+            text = "Dự báo: nắng nóng, chiều mưa rào. Không có tin tức tiêu cực mới."
+        return {
+            "candidates": [{"content": {"role": "model", "parts": [{"text": text}]}, "finishReason": "STOP"}],
+            "modelVersion": model_action.split(":")[0],
+        }
+
+    @app.get("/stats")
+    async def get_stats():
+        return stats
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=9100)
+    parser.add_argument('--latency', type=float, default=2.0, help='Seconds before each answer')
+    parser.add_argument('--jitter', type=float, default=0.5, help='Extra random latency, up to this many seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Share of calls that fail')
+    parser.add_argument('--error-status', type=int, default=429)
+    args = parser.parse_args()
+
+    uvicorn.run(build_app(args), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == '__main__':
+    main()
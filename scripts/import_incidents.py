@@ -1,23 +1,42 @@
 #!/usr/bin/env python3
-"""Import incidents from a JSON file into the app.
+"""Import incidents from a JSON, JSONL or CSV file into the app.
 
 Usage:
   //python scripts/import_incidents.py --json incidents.json --mode api --url http://10.0.2.2:8000/api
   python scripts/import_incidents.py --json incidents.json --mode db
+  python scripts/import_incidents.py --file incidents.jsonl --mode db --batch-size 5000
+  python scripts/import_incidents.py --file incidents.csv --mode api --token <jwt> --concurrency 8
+  python scripts/import_incidents.py --file /tmp/incidents.jsonl --generate 1000000
 
 Modes:
-  api - POST to the running API's /incidents endpoint (requires server running). You can pass --token for Bearer auth.
-  db  - Insert directly into the database using the repository and SQLAlchemy session.
+  api - POST to the running API's /incidents/batch endpoint (requires server running). You can pass --token for Bearer auth.
+        Each --batch-size rows are one request; up to --concurrency requests are in flight over one pooled async client.
+  db  - Insert directly into the database: one executemany INSERT and one transaction per --batch-size rows.
 
-The JSON file may be either a single object or a list of objects. Each object should match IncidentCreateDTO shape:
+The file is read incrementally, so its size is not limited by memory:
+  .json  - a single object or a list of objects
+  .jsonl - one object per line
+  .csv   - a header row with the field names
+Each object should match IncidentCreateDTO shape:
   title, latitude, longitude are required; description, category, severity optional.
+Rows are validated --batch-size at a time; invalid rows are reported and skipped.
+
+--generate N writes N synthetic incidents around TP.HCM / Hà Nội to --file (format from the extension) and exits.
 """
 
 import argparse
+import asyncio
+import csv
 import json
 import os
+import random
 import sys
-from datetime import datetime
+import time
+from itertools import islice
+
+JSON_READ_SIZE = 1 << 20
+CSV_NUMBER_FIELDS = {'latitude': float, 'longitude': float, 'severity': int}
+
 
 def ensure_repo_importable():
     # Add project root to sys.path so we can import src.* modules
@@ -27,35 +46,150 @@ def ensure_repo_importable():
         sys.path.insert(0, repo_root)
 
 
-def load_json(path):
+def iter_json(path):
+    """Objects of a top-level JSON list (or the single top-level object), decoded one at a time."""
+    decoder = json.JSONDecoder()
     with open(path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    if isinstance(data, dict):
-        return [data]
-    return data
+        buffer, position, eof = '', 0, False
 
+        def fill():
+            # Returns False once the file is exhausted
+            nonlocal buffer, position, eof
+            chunk = f.read(JSON_READ_SIZE)
+            buffer, position = buffer[position:] + chunk, 0
+            eof = not chunk
+            return not eof
 
-def post_to_api(items, base_url, token=None):
-    import requests
+        def skip_whitespace():
+            nonlocal position
+            while True:
+                while position < len(buffer) and buffer[position] in ' \t\r\n':
+                    position += 1
+                if position < len(buffer) or not fill():
+                    return
 
-    url = base_url.rstrip('/') + '/incidents'
-    headers = {'Content-Type': 'application/json'}
-    if token:
-        headers['Authorization'] = f'Bearer {token}'
+        skip_whitespace()
+        if position >= len(buffer):
+            return
+        if buffer[position] != '[':
+            # A single object: small by definition
+            yield decoder.raw_decode(buffer[position:] + f.read())[0]
+            return
+        position += 1
+        while True:
+            skip_whitespace()
+            if position >= len(buffer):
+                raise ValueError('Unexpected end of JSON list')
+            if buffer[position] == ']':
+                return
+            if buffer[position] == ',':
+                position += 1
+                continue
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    # The object runs past the buffer: read more and retry
+                    if not fill():
+                        raise
+                    continue
+                after = end
+                while after < len(buffer) and buffer[after] in ' \t\r\n':
+                    after += 1
+                if after < len(buffer) and buffer[after] in ',]':
+                    break
+                # Only a ',' or ']' proves the value is complete (a number may go on in the next chunk)
+                if not fill():
+                    raise ValueError('Malformed or truncated JSON list')
+            position = end
+            yield item
 
-    for i, item in enumerate(items, 1):
-        resp = requests.post(url, json=item, headers=headers)
-        if resp.status_code in (200, 201):
-            print(f"[{i}] Posted successfully: {resp.status_code}")
-        else:
-            print(f"[{i}] Failed: {resp.status_code} - {resp.text}")
 
+def iter_jsonl(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def iter_csv(path):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            item = {key: (value if value != '' else None) for key, value in row.items()}
+            for field, convert in CSV_NUMBER_FIELDS.items():
+                if item.get(field) is not None:
+                    try:
+                        item[field] = convert(item[field])
+                    except ValueError:
+                        pass # Left as text so validation reports it
+            yield item
+
+
+def iter_items(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.jsonl':
+        return iter_jsonl(path)
+    if extension == '.csv':
+        return iter_csv(path)
+    return iter_json(path)
+
+
+def iter_batches(items, size):
+    items = iter(items)
+    while True:
+        batch = list(islice(items, size))
+        if not batch:
+            return
+        yield batch
+
+
+def validate_batch(adapter, batch, first_row):
+    """Validate a batch at once; returns the valid DTOs and prints the rows that failed."""
+    from pydantic import ValidationError
+
+    try:
+        return adapter.validate_python(batch)
+    except ValidationError as e:
+        invalid = {}
+        for error in e.errors():
+            if error['loc'] and isinstance(error['loc'][0], int):
+                invalid.setdefault(error['loc'][0], f"{'.'.join(str(part) for part in error['loc'][1:])}: {error['msg']}")
+        for index, message in sorted(invalid.items())[:5]:
+            print(f"[{first_row + index}] Invalid: {message}")
+        if len(invalid) > 5:
+            print(f"... and {len(invalid) - 5} more invalid rows in this batch")
+        return adapter.validate_python([item for index, item in enumerate(batch) if index not in invalid])
+
+
+class Progress:
+    def __init__(self, every_seconds=2.0):
+        self.started = time.perf_counter()
+        self.every_seconds = every_seconds
+        self.last_report = self.started
+        self.read = self.written = self.invalid = self.failed = 0
+
+    def report(self, final=False):
+        now = time.perf_counter()
+        if not final and now - self.last_report < self.every_seconds:
+            return
+        self.last_report = now
+        elapsed = now - self.started
+        print(
+            f"{'Done' if final else 'Progress'}: {self.read:,} read, {self.written:,} written, "
+            f"{self.invalid:,} invalid, {self.failed:,} failed in {elapsed:.1f}s "
+            f"({self.written / elapsed if elapsed else 0:,.0f} rows/s)"
+        )
 
-def insert_via_db(items):
+
+def insert_via_db(items, batch_size):
     ensure_repo_importable()
+    from pydantic import TypeAdapter
+    from typing import List
+    from src.application.incident.dto import IncidentCreateDTO
+    from src.domain.incident.entities import Incident as IncidentEntity
     from src.infrastructure.database.sql.database import create_db_and_tables, SessionLocal
     from src.infrastructure.incident.repository_impl import IncidentRepository
-    from src.domain.incident.entities import Incident as IncidentEntity
 
     # ensure DB and tables exist
     try:
@@ -63,36 +197,129 @@ def insert_via_db(items):
     except Exception as e:
         print(f"Warning: could not auto-create DB/tables: {e}")
 
+    adapter = TypeAdapter(List[IncidentCreateDTO])
     repo = IncidentRepository()
+    progress = Progress()
     session = SessionLocal()
-    created = 0
     try:
-        for i, item in enumerate(items, 1):
-            entity = IncidentEntity(
-                title=item.get('title'),
-                description=item.get('description'),
-                category=item.get('category'),
-                latitude=float(item.get('latitude')),
-                longitude=float(item.get('longitude')),
-                severity=item.get('severity'),
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-            )
-            repo.create(session, entity)
-            created += 1
-            print(f"[{i}] Inserted into DB")
-    except Exception as e:
-        print(f"Error inserting: {e}")
+        for batch in iter_batches(items, batch_size):
+            first_row = progress.read + 1
+            progress.read += len(batch)
+            valid = validate_batch(adapter, batch, first_row)
+            progress.invalid += len(batch) - len(valid)
+            try:
+                # One transaction per batch: a failure only loses this batch
+                progress.written += repo.create_many(session, [IncidentEntity(**dto.model_dump()) for dto in valid])
+            except Exception as e:
+                progress.failed += len(valid)
+                print(f"[{first_row}-{progress.read}] Batch failed: {e}")
+            progress.report()
     finally:
         session.close()
+    progress.report(final=True)
+
+
+async def post_to_api(items, base_url, token=None, concurrency=4, batch_size=1000):
+    import httpx
+    from typing import List
+    from pydantic import TypeAdapter
+
+    ensure_repo_importable()
+    from src.application.incident.dto import IncidentCreateDTO
+
+    url = base_url.rstrip('/') + '/incidents/batch'
+    headers = {'Content-Type': 'application/json'}
+    if token:
+        headers['Authorization'] = f'Bearer {token}'
+
+    adapter = TypeAdapter(List[IncidentCreateDTO])
+    progress = Progress()
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(headers=headers, limits=limits, timeout=120) as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def post(first_row, last_row, body):
+            try:
+                resp = await client.post(url, json={'items': body})
+            except httpx.HTTPError as e:
+                progress.failed += len(body)
+                print(f"[{first_row}-{last_row}] Batch failed: {type(e).__name__}: {e}")
+            else:
+                if resp.status_code == 200:
+                    result = resp.json()
+                    progress.written += result['created']
+                    progress.failed += result['invalid']
+                else:
+                    progress.failed += len(body)
+                    print(f"[{first_row}-{last_row}] Batch failed: {resp.status_code} - {resp.text}")
+            finally:
+                semaphore.release()
+            progress.report()
+
+        # Each batch is one POST /incidents/batch (one transaction on the server); up to
+        # `concurrency` are in flight, so at most that many batches are held in memory
+        pending = set()
+        for batch in iter_batches(items, batch_size):
+            first_row = progress.read + 1
+            progress.read += len(batch)
+            valid = validate_batch(adapter, batch, first_row)
+            progress.invalid += len(batch) - len(valid)
+            if not valid:
+                continue
+            await semaphore.acquire()
+            task = asyncio.create_task(post(first_row, progress.read, [dto.model_dump(exclude_none=True) for dto in valid]))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        await asyncio.gather(*pending)
+    progress.report(final=True)
+
+
+def generate_synthetic(path, count, seed=42):
+    """Incidents scattered around TP.HCM and Hà Nội, written as JSON, JSONL or CSV by extension."""
+    rng = random.Random(seed)
+    categories = ['crime', 'accident', 'flood', 'fire', 'scam', 'protest']
+    centers = [(10.7769, 106.7009), (21.0278, 105.8342)]
+    extension = os.path.splitext(path)[1].lower()
+    fields = ['title', 'description', 'category', 'latitude', 'longitude', 'severity']
+
+    def rows():
+        for i in range(count):
+            lat, lon = rng.choice(centers)
+            yield {
+                'title': f'Synthetic incident {i}',
+                'description': 'Generated by scripts/import_incidents.py --generate',
+                'category': rng.choice(categories),
+                'latitude': round(lat + rng.uniform(-0.3, 0.3), 6),
+                'longitude': round(lon + rng.uniform(-0.3, 0.3), 6),
+                'severity': rng.randint(0, 100),
+            }
+
+    started = time.perf_counter()
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        if extension == '.csv':
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(rows())
+        elif extension == '.jsonl':
+            for row in rows():
+                f.write(json.dumps(row, ensure_ascii=False) + '\n')
+        else:
+            f.write('[\n')
+            for i, row in enumerate(rows()):
+                f.write((',\n' if i else '') + json.dumps(row, ensure_ascii=False))
+            f.write('\n]\n')
+    print(f"Wrote {count:,} incidents to {path} in {time.perf_counter() - started:.1f}s")
 
 
 def main():
     parser = argparse.ArgumentParser()
-    parser.add_argument('--json', required=True, help='Path to incidents.json')
+    parser.add_argument('--file', '--json', dest='file', required=True, help='Path to incidents .json / .jsonl / .csv')
     parser.add_argument('--mode', choices=['api', 'db'], default='api', help='Insert mode')
     parser.add_argument('--url', default='http://127.0.0.1:8000/api', help='Base API URL for api mode')
     parser.add_argument('--token', help='Bearer token for API authentication')
+    parser.add_argument('--batch-size', type=int, default=2000, help='Rows validated and inserted together (at most INCIDENT_BATCH_MAX_ITEMS in api mode)')
+    parser.add_argument('--concurrency', type=int, default=4, help='Batch requests in flight in api mode')
+    parser.add_argument('--generate', type=int, metavar='N', help='Write N synthetic incidents to --file and exit')
     parser.add_argument('--create-user', action='store_true', help='Create a user account before posting')
     parser.add_argument('--username', help='Username to create/use for posting')
     parser.add_argument('--password', help='Password for the user (min 8 chars)')
@@ -101,13 +328,14 @@ def main():
 
     args = parser.parse_args()
 
-    items = load_json(args.json)
-    if not items:
-        print('No incidents found in JSON.')
+    if args.generate:
+        generate_synthetic(args.file, args.generate)
         return
 
+    items = iter_items(args.file)
+
     if args.mode == 'api':
-        print(f"Posting {len(items)} incident(s) to {args.url}")
+        print(f"Posting incidents from {args.file} to {args.url} ({args.concurrency} in flight)")
         token = args.token
         if args.create_user:
             # require username and password and full_name
@@ -144,10 +372,10 @@ def main():
                 return
             print('Obtained access token')
 
-        post_to_api(items, args.url, token=token)
+        asyncio.run(post_to_api(items, args.url, token=token, concurrency=args.concurrency, batch_size=args.batch_size))
     else:
-        print(f"Inserting {len(items)} incident(s) directly into DB")
-        insert_via_db(items)
+        print(f"Inserting incidents from {args.file} directly into DB ({args.batch_size} rows per transaction)")
+        insert_via_db(items, args.batch_size)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Load test: does a burst of logins slow down other endpoints?
+
+Logs in once for a token, then probes GET /api/incidents every --probe-interval
+seconds for --baseline seconds on its own and again while --logins logins run
+with up to --concurrency in flight (bcrypt on each). Reports the p50/p99/max
+latency of the probes in both phases and the login outcomes (200, 429, errors).
+With hashing on the event loop the probes stall for the whole burst; with the
+password pool they should stay close to the baseline. Point it at a single
+uvicorn worker.
+
+Usage:
+  python scripts/load_test_login.py --username alice --password secret
+  python scripts/load_test_login.py --username alice --password secret --logins 200 --concurrency 50
+  python scripts/load_test_login.py --base-url http://localhost:8001 --username alice --password secret
+  python scripts/load_test_login.py --username alice --password secret --metrics-token "$METRICS_TOKEN"
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def describe(samples):
+    if not samples:
+        return "no samples"
+    return (
+        f"n={len(samples)} p50={percentile(samples, 50):.1f}ms "
+        f"p99={percentile(samples, 99):.1f}ms max={max(samples):.1f}ms"
+    )
+
+
+async def probe(client, token, interval, stop, samples):
+    params = {"latitude": 10.7769, "longitude": 106.7009, "radius": 5}
+    headers = {"Authorization": f"Bearer {token}"}
+    while not stop.is_set():
+        started = time.perf_counter()
+        response = await client.get("/api/incidents", params=params, headers=headers)
+        response.raise_for_status()
+        samples.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(interval)
+
+
+async def login(client, username, password, semaphore, outcomes, latencies):
+    async with semaphore:
+        started = time.perf_counter()
+        try:
+            response = await client.post("/api/login", data={"username": username, "password": password})
+            key = str(response.status_code)
+        except httpx.HTTPError as e:
+            key = type(e).__name__
+        latencies.append((time.perf_counter() - started) * 1000)
+        outcomes[key] = outcomes.get(key, 0) + 1
+
+
+async def main(args):
+    limits = httpx.Limits(max_connections=args.concurrency + 2)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=120, limits=limits) as client:
+        response = await client.post("/api/login", data={"username": args.username, "password": args.password})
+        response.raise_for_status()
+        token = response.json()["access_token"]
+
+        baseline = []
+        stop = asyncio.Event()
+        task = asyncio.create_task(probe(client, token, args.probe_interval, stop, baseline))
+        await asyncio.sleep(args.baseline)
+        stop.set()
+        await task
+
+        during = []
+        stop = asyncio.Event()
+        task = asyncio.create_task(probe(client, token, args.probe_interval, stop, during))
+        outcomes, latencies = {}, []
+        semaphore = asyncio.Semaphore(args.concurrency)
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            login(client, args.username, args.password, semaphore, outcomes, latencies)
+            for _ in range(args.logins)
+        ))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await task
+
+        metrics = None
+        if args.metrics_token:
+            response = await client.get("/api/metrics", headers={"Authorization": f"Bearer {args.metrics_token}"})
+            response.raise_for_status()
+            metrics = response.json().get("password_hashing")
+
+    print(f"/api/incidents alone:        {describe(baseline)}")
+    print(f"/api/incidents during burst: {describe(during)}")
+    print(f"Logins: {args.logins} in {elapsed:.1f}s, outcomes {outcomes}, latency {describe(latencies)}")
+    if metrics is not None:
+        print(f"password_hashing: {metrics}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+    parser.add_argument('--username', required=True)
+    parser.add_argument('--password', required=True)
+    parser.add_argument('--logins', type=int, default=100, help='Logins in the burst')
+    parser.add_argument('--concurrency', type=int, default=50, help='Logins in flight')
+    parser.add_argument('--baseline', type=float, default=3.0, help='Seconds of probing before the burst')
+    parser.add_argument('--probe-interval', type=float, default=0.05)
+    parser.add_argument('--metrics-token', default='', help='METRICS_TOKEN, to print the password hashing counters')
+    asyncio.run(main(parser.parse_args()))
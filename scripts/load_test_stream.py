@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Load test for /api/stream: open many idle WebSocket connections and hold them.
+
+Logs in (or takes --token), opens --connections sockets at up to --concurrency
+connects in flight, holds them for --hold seconds while answering heartbeats, then
+reports how many stayed open. Point it at a single uvicorn worker to measure
+per-worker capacity. Raise the open-file limit first (`ulimit -n 65536`) on both
+the client and the server side.
+
+Usage:
+  python scripts/load_test_stream.py --username alice --password secret
+  python scripts/load_test_stream.py --token <jwt> --connections 10000 --hold 60
+  python scripts/load_test_stream.py --base-url http://localhost:8001 --connections 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from urllib.parse import urlencode, urlparse, urlunparse
+
+import httpx
+import websockets
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def stream_url(base_url, token, latitude, longitude):
+    parsed = urlparse(base_url)
+    scheme = "wss" if parsed.scheme == "https" else "ws"
+    query = urlencode({"token": token, "latitude": latitude, "longitude": longitude})
+    return urlunparse((scheme, parsed.netloc, "/api/stream", "", query, ""))
+
+
+def login(base_url, username, password):
+    response = httpx.post(f"{base_url}/api/login", data={"username": username, "password": password}, timeout=30)
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def hold_connection(url, semaphore, release, stats):
+    async with semaphore:
+        started = time.perf_counter()
+        try:
+            websocket = await websockets.connect(url, open_timeout=30, ping_interval=None, max_queue=16)
+        except Exception as e:
+            stats["failed"] += 1
+            stats["errors"][type(e).__name__] = stats["errors"].get(type(e).__name__, 0) + 1
+            return
+        stats["connect_ms"].append((time.perf_counter() - started) * 1000)
+        stats["open"] += 1
+
+    try:
+        while not release.is_set():
+            try:
+                message = await asyncio.wait_for(websocket.recv(), timeout=1)
+                stats["messages"] += 1 if message else 0
+            except asyncio.TimeoutError:
+                continue
+    except Exception:
+        stats["dropped"] += 1
+    else:
+        stats["held"] += 1
+    finally:
+        stats["open"] -= 1
+        await websocket.close()
+
+
+async def run(args, token):
+    url = stream_url(args.base_url, token, args.latitude, args.longitude)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    release = asyncio.Event()
+    stats = {"open": 0, "failed": 0, "dropped": 0, "held": 0, "messages": 0, "connect_ms": [], "errors": {}}
+
+    started = time.perf_counter()
+    tasks = [asyncio.create_task(hold_connection(url, semaphore, release, stats)) for _ in range(args.connections)]
+    while stats["open"] + stats["failed"] < args.connections and time.perf_counter() - started < args.connect_timeout:
+        await asyncio.sleep(1)
+        print(f"  connecting... open={stats['open']} failed={stats['failed']}")
+    ramp_seconds = time.perf_counter() - started
+    print(f"Ramp-up: {stats['open']} open, {stats['failed']} failed in {ramp_seconds:.1f}s")
+    if stats["connect_ms"]:
+        print(
+            f"Connect latency: p50={percentile(stats['connect_ms'], 50):.1f} ms "
+            f"p99={percentile(stats['connect_ms'], 99):.1f} ms "
+            f"mean={statistics.fmean(stats['connect_ms']):.1f} ms"
+        )
+
+    print(f"Holding for {args.hold}s...")
+    await asyncio.sleep(args.hold)
+    still_open = stats["open"]
+    release.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    print(f"Still open after hold: {still_open}/{args.connections}")
+    print(f"Dropped during hold: {stats['dropped']}, messages received: {stats['messages']}")
+    if stats["errors"]:
+        print(f"Connect errors: {stats['errors']}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--base-url', default='http://localhost:8000')
+    parser.add_argument('--token', default=None, help='JWT; otherwise --username/--password are used to log in')
+    parser.add_argument('--username', default=None)
+    parser.add_argument('--password', default=None)
+    parser.add_argument('--connections', type=int, default=10000)
+    parser.add_argument('--concurrency', type=int, default=500, help='Connects in flight at once')
+    parser.add_argument('--hold', type=int, default=60, help='Seconds to hold the connections open')
+    parser.add_argument('--connect-timeout', type=int, default=300, help='Max seconds for the ramp-up')
+    parser.add_argument('--latitude', type=float, default=10.7769)
+    parser.add_argument('--longitude', type=float, default=106.7009)
+    args = parser.parse_args()
+
+    token = args.token
+    if token is None:
+        if not (args.username and args.password):
+            parser.error("Pass --token or --username and --password")
+        token = login(args.base_url, args.username, args.password)
+
+    asyncio.run(run(args, token))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Generate today's AI travel reports before a deployment takes traffic.
+
+Regenerates every province whose report is missing or goes stale within
+--lead-seconds, paced by --qps Gemini calls per second. Reports go to the
+`ai_province_reports` table, where the app's workers pick them up, so
+AI_REPORT_CACHE_PERSIST must be enabled. Exits with status 1 if any province failed.
+
+Usage:
+  python scripts/prewarm_ai_reports.py
+  python scripts/prewarm_ai_reports.py --qps 1
+  python scripts/prewarm_ai_reports.py --provinces "Hà Nội" "Đà Nẵng" --lead-seconds 21600
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+
+def ensure_repo_importable():
+    # Add project root to sys.path so we can import src.* modules
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = os.path.dirname(script_dir)
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+
+
+async def run(args):
+    import src.infrastructure  # noqa: F401 - registers the models
+    from src.application.ai.prewarm import ReportPrewarmScheduler
+    from src.application.ai.provinces import VIETNAM_PROVINCES
+    from src.application.ai.use_cases import TravelReportUseCases
+    from src.config.settings import get_settings
+    from src.infrastructure.ai.gemini_gateway import get_ai_gateway
+    from src.infrastructure.ai.report_cache import get_report_cache
+
+    settings = get_settings()
+    if not settings.AI_REPORT_CACHE_PERSIST:
+        print("AI_REPORT_CACHE_PERSIST is off: reports would only live in this process. Aborting.")
+        return 2
+
+    provinces = args.provinces or VIETNAM_PROVINCES
+    scheduler = ReportPrewarmScheduler(
+        TravelReportUseCases(get_ai_gateway(), get_report_cache()),
+        qps=args.qps or settings.AI_PREWARM_QPS,
+        lead_seconds=settings.AI_PREWARM_LEAD_SECONDS if args.lead_seconds is None else args.lead_seconds,
+    )
+    print(f"Warming {len(provinces)} provinces at {scheduler.rate_limiter.rate_per_second:g} Gemini calls/s")
+
+    started = time.perf_counter()
+    result = await scheduler.warm(provinces)
+    elapsed = time.perf_counter() - started
+    print(
+        f"Done in {elapsed:.1f}s: {result['refreshed']} generated, "
+        f"{result['checked'] - result['refreshed'] - result['failed']} already fresh, {result['failed']} failed"
+    )
+    return 1 if result["failed"] else 0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--provinces', nargs='+', default=None, help='Defaults to all 63 provinces')
+    parser.add_argument('--qps', type=float, default=None, help='Gemini calls per second (default AI_PREWARM_QPS)')
+    parser.add_argument('--lead-seconds', type=float, default=None, help='Also regenerate reports that go stale within this many seconds')
+    args = parser.parse_args()
+
+    ensure_repo_importable()
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from src.domain.admin_log.repository_interface import IAdminLogRepository
 from src.application.admin_log.dto import AdminLogCreate, AdminLogUpdate
 from src.domain.admin_log.entities import AdminLog as AdminLogEntity
+from src.domain.pagination.entities import PageRequest
 from datetime import datetime
 
 class AdminLogUseCases:
@@ -13,8 +14,8 @@ class AdminLogUseCases:
     def get_admin_log(self, db: Session, admin_log_id: int) -> Optional[AdminLogEntity]:
         return self.admin_log_repository.get_admin_log(db, admin_log_id)
 
-    def get_admin_logs_by_admin(self, db: Session, admin_id: int) -> List[AdminLogEntity]:
-        return self.admin_log_repository.get_admin_logs_by_admin(db, admin_id)
+    def get_admin_logs_by_admin(self, db: Session, admin_id: int, page: Optional[PageRequest] = None) -> List[AdminLogEntity]:
+        return self.admin_log_repository.get_admin_logs_by_admin(db, admin_id, page)
 
     def create_admin_log(self, db: Session, admin_log_data: AdminLogCreate) -> AdminLogEntity:
         admin_log_entity = AdminLogEntity(
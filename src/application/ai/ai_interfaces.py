@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+class AIGatewayError(Exception):
+    """The model call failed for good; status_code is what the API should answer with."""
+
+    def __init__(self, message: str, status_code: int = 502):
+        super().__init__(message)
+        self.status_code = status_code
+
+class IAIGateway(ABC):
+    @abstractmethod
+    async def generate(self, contents: Any, config: Optional[Any] = None) -> Any: # Raises AIGatewayError
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        pass
+
+# Builds a fresh report for a province name; returns a JSON-serializable dict
+ReportGenerator = Callable[[str], Awaitable[Dict[str, Any]]]
+
+class IReportCache(ABC):
+    @abstractmethod
+    async def get_or_generate(self, province_name: str, generate: ReportGenerator) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    async def needs_refresh(self, province_name: str, lead_seconds: float = 0) -> bool:
+        pass
+
+    @abstractmethod
+    async def refresh(self, province_name: str, generate: ReportGenerator) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    async def claim_refresh(self, province_name: str, lease_seconds: float) -> bool: # False: another worker refreshes it
+        pass
+
+    @abstractmethod
+    def top_provinces(self, limit: int) -> List[str]: # Most requested first
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        pass
@@ -0,0 +1,60 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+class WeatherInfo(BaseModel):
+    date: str = Field(
+        ..., 
+        description="Ngày dự báo, bắt buộc định dạng chuẩn 'YYYY-MM-DD' (Ví dụ: 2024-12-25)"
+    )
+    temperature: str = Field(
+        ..., 
+        description="Khoảng nhiệt độ trong ngày, format 'Thấp-Cao°C' (Ví dụ: 24-31°C)"
+    )
+    condition: str = Field(
+        ..., 
+        description="Mô tả ngắn gọn trạng thái thời tiết (Ví dụ: Mưa rào rải rác, Nắng nóng, Có mây)"
+    )
+
+class TravelTip(BaseModel):
+    category: str = Field(
+        ..., 
+        description="Phân loại lời khuyên. Chỉ chọn trong: [Trang phục, Di chuyển, An toàn, Y tế, Ăn uống]"
+    )
+    advice: str = Field(
+        ..., 
+        description="Lời khuyên hành động cụ thể cho du khách dựa trên tình hình thực tế (Không chung chung)."
+    )
+
+class ProvinceData(BaseModel):
+    province_name: str = Field(..., description="Tên chính thức của tỉnh/thành phố.")
+    report_date: str = Field(..., description="Ngày tạo báo cáo (YYYY-MM-DD).")
+    
+    weather_forecast: List[WeatherInfo] = Field(
+        ..., 
+        description="Danh sách dự báo thời tiết chính xác cho 3 ngày tới."
+    )
+    
+    travel_advice: List[TravelTip] = Field(
+        ..., 
+        description="Tối thiểu 3 lời khuyên quan trọng nhất dựa trên thời tiết và tin tức thu thập được."
+    )
+    
+    executive_summary: str = Field(
+        ..., 
+        description="Đoạn văn khoảng 50-80 từ, tổng hợp ngắn gọn xem có nên đi du lịch lúc này không và tại sao."
+    )
+    
+    sources: List[str] = Field(..., description="Danh sách các URL uy tín đã tham khảo.")
+    
+    score: int = Field(
+        ..., 
+        description="Điểm số an toàn du lịch (0-100). Phải tuân thủ nghiêm ngặt thang điểm quy định trong prompt."
+    )
+
+class VietnamReport(BaseModel):
+    provinces: List[ProvinceData]
+
+class LocationRequest(BaseModel):
+    lat: float
+    long: float
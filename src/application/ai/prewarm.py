@@ -0,0 +1,111 @@
+import asyncio
+import threading
+from typing import Dict, Iterable, Optional
+
+from src.application.ai.use_cases import TravelReportUseCases
+from src.config.settings import get_settings
+from src.infrastructure.ai.gemini_gateway import get_ai_gateway
+from src.infrastructure.ai.report_cache import get_report_cache
+from src.shared.utils.logger import get_logger
+from src.shared.utils.rate_limiter import AsyncRateLimiter
+
+logger = get_logger(__name__)
+
+# A report is a grounded search call followed by a JSON extraction call
+GEMINI_CALLS_PER_REPORT = 2
+
+
+class ReportPrewarmScheduler:
+    """
+    Keeps the reports of the most requested provinces fresh so user requests hit the cache.
+
+    Every `interval_seconds` it takes the `top_provinces` most requested provinces (decaying
+    counts kept by the report cache) and regenerates those whose report is missing or stops
+    being fresh within `lead_seconds`. Before regenerating, a worker takes the report's
+    lease in the database for one interval, so workers sharing the database do not
+    regenerate the same report. Gemini calls are paced by a token bucket of `qps` calls
+    per second in this worker, leaving the rest of the quota to user traffic.
+    """
+
+    def __init__(
+        self,
+        use_cases: TravelReportUseCases,
+        qps: float = 0.2,
+        top_provinces: int = 20,
+        interval_seconds: float = 600,
+        lead_seconds: float = 1800,
+    ):
+        self.use_cases = use_cases
+        self.rate_limiter = AsyncRateLimiter(qps, burst=GEMINI_CALLS_PER_REPORT)
+        self.top_provinces = top_provinces
+        self.interval_seconds = interval_seconds
+        self.lead_seconds = lead_seconds
+        self._task: Optional[asyncio.Task] = None
+        self._counters = {"rounds": 0, "checked": 0, "refreshed": 0, "leased_elsewhere": 0, "failed": 0}
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"Report pre-warm scheduler started (top {self.top_provinces}, every {self.interval_seconds:g}s)")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await self.warm(self.use_cases.popular_provinces(self.top_provinces))
+            self._counters["rounds"] += 1
+            await asyncio.sleep(self.interval_seconds)
+
+    async def warm(self, province_names: Iterable[str]) -> Dict[str, int]:
+        """Refresh the given provinces that need it, in order; returns counts for this round."""
+        result = {"checked": 0, "refreshed": 0, "leased_elsewhere": 0, "failed": 0}
+        for province_name in province_names:
+            result["checked"] += 1
+            try:
+                if not await self.use_cases.report_needs_refresh(province_name, self.lead_seconds):
+                    continue
+                if not await self.use_cases.claim_report_refresh(province_name, self.interval_seconds):
+                    result["leased_elsewhere"] += 1
+                    continue
+                await self.rate_limiter.acquire(GEMINI_CALLS_PER_REPORT)
+                await self.use_cases.refresh_report(province_name)
+                result["refreshed"] += 1
+            except Exception as e:
+                result["failed"] += 1
+                logger.warning(f"Pre-warm of report for '{province_name}' failed: {e}")
+        for name, count in result.items():
+            self._counters[name] += count
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._counters, "running": int(self._task is not None)}
+
+
+_report_prewarm: Optional[ReportPrewarmScheduler] = None
+_report_prewarm_lock = threading.Lock()
+
+
+def get_report_prewarm_scheduler() -> ReportPrewarmScheduler:
+    """Per-process scheduler over the AI gateway and report cache; started in the lifespan handler."""
+    global _report_prewarm
+    if _report_prewarm is None:
+        with _report_prewarm_lock:
+            if _report_prewarm is None:
+                settings = get_settings()
+                _report_prewarm = ReportPrewarmScheduler(
+                    TravelReportUseCases(get_ai_gateway(), get_report_cache()),
+                    # AI_PREWARM_QPS is the budget of the whole deployment, shared by its workers
+                    qps=settings.AI_PREWARM_QPS / max(1, settings.WEB_CONCURRENCY),
+                    top_provinces=settings.AI_PREWARM_TOP_PROVINCES,
+                    interval_seconds=settings.AI_PREWARM_INTERVAL_SECONDS,
+                    lead_seconds=settings.AI_PREWARM_LEAD_SECONDS,
+                )
+    return _report_prewarm
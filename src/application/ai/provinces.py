@@ -0,0 +1,35 @@
+import re
+import unicodedata
+from typing import Optional
+
+# 63 tỉnh/thành phố, dùng để pre-warm toàn bộ báo cáo AI trước khi mở traffic
+VIETNAM_PROVINCES = [
+    "Hà Nội", "Thành phố Hồ Chí Minh", "Hải Phòng", "Đà Nẵng", "Cần Thơ",
+    "An Giang", "Bà Rịa - Vũng Tàu", "Bắc Giang", "Bắc Kạn", "Bạc Liêu",
+    "Bắc Ninh", "Bến Tre", "Bình Định", "Bình Dương", "Bình Phước",
+    "Bình Thuận", "Cà Mau", "Cao Bằng", "Đắk Lắk", "Đắk Nông",
+    "Điện Biên", "Đồng Nai", "Đồng Tháp", "Gia Lai", "Hà Giang",
+    "Hà Nam", "Hà Tĩnh", "Hải Dương", "Hậu Giang", "Hòa Bình",
+    "Hưng Yên", "Khánh Hòa", "Kiên Giang", "Kon Tum", "Lai Châu",
+    "Lâm Đồng", "Lạng Sơn", "Lào Cai", "Long An", "Nam Định",
+    "Nghệ An", "Ninh Bình", "Ninh Thuận", "Phú Thọ", "Phú Yên",
+    "Quảng Bình", "Quảng Nam", "Quảng Ngãi", "Quảng Ninh", "Quảng Trị",
+    "Sóc Trăng", "Sơn La", "Tây Ninh", "Thái Bình", "Thái Nguyên",
+    "Thanh Hóa", "Thừa Thiên Huế", "Tiền Giang", "Trà Vinh", "Tuyên Quang",
+    "Vĩnh Long", "Vĩnh Phúc", "Yên Bái",
+]
+
+_PROVINCE_PREFIXES = re.compile(r"^(tinh|thanh pho|tp\.?)\s+")
+
+def normalize_province_name(province_name: str) -> str:
+    """'Thành phố Hồ Chí Minh', 'TP. Hồ Chí Minh' and 'ho chi minh' all map to 'ho chi minh'."""
+    text = province_name.strip().lower().replace("đ", "d")
+    text = "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+    text = re.sub(r"\s+", " ", text)
+    return _PROVINCE_PREFIXES.sub("", text).strip()
+
+_PROVINCES_BY_KEY = {normalize_province_name(name): name for name in VIETNAM_PROVINCES}
+
+def canonical_province_name(province_name: str) -> Optional[str]:
+    """The VIETNAM_PROVINCES spelling of a province name, or None when it is not a province."""
+    return _PROVINCES_BY_KEY.get(normalize_province_name(province_name))
@@ -0,0 +1,125 @@
+import re
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from google.genai import types
+
+from src.application.ai.ai_interfaces import IAIGateway, IReportCache
+from src.application.ai.dto import VietnamReport
+
+grounding_tool = types.Tool(
+    google_search=types.GoogleSearch()
+)
+
+# Config Search: Cho phép sáng tạo nhẹ để tìm tin đa dạng
+config_search = types.GenerateContentConfig(
+    tools=[grounding_tool],
+    temperature=0.3 
+)
+
+# Config JSON: Nhiệt độ thấp để đảm bảo đúng format
+config_json = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=VietnamReport,
+    temperature=0.1 
+)
+
+class TravelReportUseCases:
+    def __init__(self, ai_gateway: IAIGateway, report_cache: Optional[IReportCache] = None):
+        self.ai_gateway = ai_gateway
+        self.report_cache = report_cache
+
+    async def get_report(self, province_name: str) -> VietnamReport:
+        """
+        Báo cáo du lịch cho tỉnh/thành, lấy từ cache theo (tỉnh, ngày) nếu có.
+        """
+        if self.report_cache is None:
+            return await self.generate_report(province_name)
+        payload = await self.report_cache.get_or_generate(province_name, self._generate_payload)
+        return VietnamReport.model_validate(payload)
+
+    async def report_needs_refresh(self, province_name: str, lead_seconds: float = 0) -> bool:
+        if self.report_cache is None:
+            return True
+        return await self.report_cache.needs_refresh(province_name, lead_seconds)
+
+    async def claim_report_refresh(self, province_name: str, lease_seconds: float) -> bool:
+        if self.report_cache is None:
+            return True
+        return await self.report_cache.claim_refresh(province_name, lease_seconds)
+
+    async def refresh_report(self, province_name: str) -> VietnamReport:
+        """
+        Tạo lại báo cáo ngay và ghi vào cache (dùng cho pre-warm).
+        """
+        if self.report_cache is None:
+            return await self.generate_report(province_name)
+        payload = await self.report_cache.refresh(province_name, self._generate_payload)
+        return VietnamReport.model_validate(payload)
+
+    def popular_provinces(self, limit: int) -> List[str]:
+        if self.report_cache is None:
+            return []
+        return self.report_cache.top_provinces(limit)
+
+    async def _generate_payload(self, province_name: str) -> Dict[str, Any]:
+        report = await self.generate_report(province_name)
+        return report.model_dump(mode="json")
+
+    async def generate_report(self, province_name: str) -> VietnamReport:
+        """
+        Core Logic: Search -> Reason -> JSON Extract
+        """
+        current_date = datetime.now().strftime("%Y-%m-%d")
+        next_3_days = (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d")
+
+        # --- STEP 1: SEARCH PROMPT ---
+        search_prompt = f"""
+        Hôm nay là: {current_date}.
+        Hãy tìm kiếm thông tin mới nhất trên Google cho địa điểm: {province_name}, Việt Nam.
+
+        Yêu cầu thông tin cần tìm:
+        1. Dự báo thời tiết chi tiết từ {current_date} đến {next_3_days} (Nhiệt độ, Mưa/Nắng).
+        2. Các tin tức MỚI NHẤT (trong 7 ngày qua) về: An ninh trật tự, Tai nạn giao thông nghiêm trọng, Dịch bệnh, hoặc Sự kiện văn hóa lớn.
+        3. Cảnh báo thiên tai: Bão, Lũ lụt, Sạt lở đất (nếu có).
+
+        Chỉ cần trả về nội dung tìm thấy, không cần định dạng đẹp.
+        """
+
+        # Gọi AI bước 1
+        response_raw = await self.ai_gateway.generate(search_prompt, config_search)
+        raw_text = response_raw.text
+
+        # --- STEP 2: EXTRACT & SCORING PROMPT ---
+        extract_prompt = f"""
+        Bạn là chuyên gia đánh giá rủi ro du lịch. Dựa vào DỮ LIỆU THÔ bên dưới, hãy lập báo cáo JSON cho {province_name}.
+
+        QUY ĐỊNH CHẤM ĐIỂM AN TOÀN (SCORE) - BẮT BUỘC TUÂN THỦ:
+        - 00 - 30 (NGUY HIỂM - BÁO ĐỘNG ĐỎ): Có thiên tai đang diễn ra (Bão cấp 10+, Lũ quét), Bạo loạn, Dịch bệnh phong tỏa, hoặc Sạt lở nghiêm trọng. -> KHUYẾN CÁO: KHÔNG ĐẾN.
+        - 31 - 50 (RỦI RO CAO - BÁO ĐỘNG CAM): Mưa to kéo dài gây ngập úng cục bộ, Ô nhiễm không khí mức nguy hại, Có tin tức về cướp giật/tội phạm gia tăng đột biến.
+        - 51 - 70 (CẨN TRỌNG - BÁO ĐỘNG VÀNG): Thời tiết xấu (Mưa rào, Giông lốc nhẹ), Tắc đường nghiêm trọng, Giá cả leo thang mùa lễ hội.
+        - 71 - 90 (TỐT - XANH DƯƠNG): Thời tiết ổn định (có thể có mưa nhẹ/mây), Tình hình an ninh bình thường.
+        - 91 - 100 (LÝ TƯỞNG - XANH LÁ): Thời tiết đẹp (Nắng ấm/Mát mẻ), Có sự kiện văn hóa hấp dẫn, Không có tin tiêu cực.
+
+        YÊU CẦU VỀ FORMAT DỮ LIỆU:
+        1. travel_advice: Không được chép lại tin tức. Phải convert thành hành động. 
+           (Ví dụ: Tin "Mưa to" -> Advice: "Mang theo áo mưa và tránh đi đèo dốc").
+        2. weather_forecast: Phải đủ 3 ngày.
+        3. Nếu không có tin tức tiêu cực, mặc định Score > 80.
+
+        DỮ LIỆU THÔ:
+        {raw_text}
+        """
+
+        # Gọi AI bước 2
+        response_json = await self.ai_gateway.generate(extract_prompt, config_json)
+
+        if response_json.parsed:
+            return response_json.parsed
+        else:
+            # Fallback manual parsing (phòng trường hợp AI trả về markdown)
+            try:
+                clean_str = re.sub(r'```json\s*|```', '', response_json.text).strip()
+                return VietnamReport.model_validate_json(clean_str)
+            except Exception:
+                raise ValueError("AI không trả về đúng định dạng JSON.")
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Optional
+
+class ICacheBackend(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def delete_many(self, keys: Iterable[str]) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]: # hits, misses, evictions, size
+        pass
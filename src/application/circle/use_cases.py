@@ -6,11 +6,25 @@ from src.domain.circle.entities import Circle as CircleEntity
 from src.application.circle.dto import CircleCreate, CircleUpdate
 from src.domain.circle.member_repository_interface import ICircleMemberRepository # Assuming this will be created
 from src.domain.circle.member_entities import CircleMember as CircleMemberEntity # Assuming this will be created
+from src.domain.safety_network.repository_interface import ISafetyNetworkResolver
 
 class CircleUseCases:
-    def __init__(self, circle_repository: ICircleRepository, circle_member_repository: ICircleMemberRepository):
+    def __init__(
+        self,
+        circle_repository: ICircleRepository,
+        circle_member_repository: ICircleMemberRepository,
+        safety_network_resolver: Optional[ISafetyNetworkResolver] = None
+    ):
         self.circle_repo = circle_repository
         self.circle_member_repo = circle_member_repository
+        self.safety_network_resolver = safety_network_resolver
+
+    def _invalidate_networks(self, db: Session, circle_ids: List[int], user_ids: List[int] = ()):
+        # Circle status/ownership decides whose safety network contains whom
+        if self.safety_network_resolver is None:
+            return
+        self.safety_network_resolver.invalidate_circles(db, circle_ids)
+        self.safety_network_resolver.invalidate_users(user_ids)
 
     def get_circle(self, db: Session, circle_id: int) -> Optional[CircleEntity]:
         return self.circle_repo.get_circle(db, circle_id)
@@ -21,10 +35,12 @@ class CircleUseCases:
     def create_circle(self, db: Session, circle_data: CircleCreate, owner_id: int) -> CircleEntity:
         # Deactivate all existing active circles for the user
         active_circles = self.circle_repo.get_circles_by_owner(db, owner_id)
+        deactivated_circle_ids = []
         for active_circle in active_circles:
             if active_circle.status == "active":
                 updated_circle_entity = active_circle.model_copy(update={"status": "inactive"})
                 self.circle_repo.update_circle(db, active_circle.id, updated_circle_entity)
+                deactivated_circle_ids.append(active_circle.id)
         
         # Create the new circle
         circle_entity = CircleEntity(
@@ -43,6 +59,7 @@ class CircleUseCases:
         )
         self.circle_member_repo.create_circle_member(db, circle_member_entity)
 
+        self._invalidate_networks(db, deactivated_circle_ids + [new_circle.id], [owner_id])
         return new_circle
 
     def update_circle(self, db: Session, circle_id: int, circle_update: CircleUpdate) -> Optional[CircleEntity]:
@@ -52,9 +69,13 @@ class CircleUseCases:
         
         update_data = circle_update.model_dump(exclude_unset=True)
         updated_circle_entity = existing_circle.model_copy(update=update_data)
-        return self.circle_repo.update_circle(db, circle_id, updated_circle_entity)
+        updated_circle = self.circle_repo.update_circle(db, circle_id, updated_circle_entity)
+        self._invalidate_networks(db, [circle_id], [existing_circle.owner_id])
+        return updated_circle
 
     def delete_circle(self, db: Session, circle_id: int) -> bool:
+        # Members are looked up before the rows go away
+        self._invalidate_networks(db, [circle_id])
         return self.circle_repo.delete_circle(db, circle_id)
 
     # def get_circle_members(self, db: Session, circle_id: int) -> List[CircleMemberEntity]:
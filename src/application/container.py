@@ -0,0 +1,131 @@
+import threading
+from typing import Optional
+
+from src.application.admin_log.use_cases import AdminLogUseCases
+from src.application.ai.use_cases import TravelReportUseCases
+from src.application.circle.member_use_cases import CircleMemberUseCases
+from src.application.circle.use_cases import CircleUseCases
+from src.application.friend.use_cases import FriendUseCases
+from src.application.incident.use_cases import (
+    CreateIncidentUseCase,
+    CreateIncidentsBatchUseCase,
+    DeleteIncidentUseCase,
+    GetIncidentsUseCase,
+)
+from src.application.news_incident.use_cases import NewsIncidentUseCases
+from src.application.notification.use_cases import NotificationUseCases
+from src.application.sos_alert.use_cases import SOSAlertUseCases
+from src.application.trip.use_cases import TripUseCases
+from src.application.user.auth_use_cases import LoginUserUseCase, LogoutUserUseCase, RegisterUserUseCase
+from src.application.user_report_incident.use_cases import UserReportIncidentUseCases
+from src.config.settings import Settings, get_settings
+from src.infrastructure.admin_log.repository_impl import AdminLogRepository
+from src.infrastructure.ai.gemini_gateway import get_ai_gateway
+from src.infrastructure.ai.report_cache import get_report_cache
+from src.infrastructure.circle.member_repository_impl import CircleMemberRepository
+from src.infrastructure.circle.repository_impl import CircleRepository
+from src.infrastructure.events.hub import get_event_hub
+from src.infrastructure.friend.repository_impl import FriendRepository
+from src.infrastructure.geo.forward_geocoder import get_forward_geocoder
+from src.infrastructure.incident.repository_impl import IncidentRepository
+from src.infrastructure.jobs.worker_pool import get_job_queue
+from src.infrastructure.news_incident.repository_impl import NewsIncidentRepository
+from src.infrastructure.notification.repository_impl import NotificationRepository
+from src.infrastructure.safety_network.resolver_impl import get_safety_network_resolver
+from src.infrastructure.security.password_pool import get_password_hashing_pool
+from src.infrastructure.security.security_impl import BcryptPasswordHasher, JwtTokenService
+from src.infrastructure.sos_alert.repository_impl import SOSAlertRepository
+from src.infrastructure.trip.repository_impl import TripRepository
+from src.infrastructure.user.repository_impl import UserRepository
+from src.infrastructure.user_report_incident.repository_impl import UserReportIncidentRepository
+
+
+class Container:
+    """
+    The repositories, services and use cases behind the routes, built once per process.
+
+    None of them keep per-request state (every method takes the session it works with), so
+    one instance of each serves all requests; the providers in dependencies.py hand them out
+    and the request only brings its session.
+    """
+
+    def __init__(self, settings: Settings):
+        # Repositories
+        self.user_repository = UserRepository()
+        self.friend_repository = FriendRepository()
+        self.sos_alert_repository = SOSAlertRepository()
+        self.notification_repository = NotificationRepository()
+        self.admin_log_repository = AdminLogRepository()
+        self.circle_repository = CircleRepository()
+        self.circle_member_repository = CircleMemberRepository()
+        self.news_incident_repository = NewsIncidentRepository()
+        self.user_report_incident_repository = UserReportIncidentRepository()
+        self.trip_repository = TripRepository()
+        self.incident_repository = IncidentRepository()
+
+        # Process-wide services
+        self.password_hasher = BcryptPasswordHasher(get_password_hashing_pool())
+        self.token_service = JwtTokenService(self.user_repository)
+        self.safety_network_resolver = get_safety_network_resolver()
+        self.job_queue = get_job_queue()
+        self.event_publisher = get_event_hub()
+
+        # Use cases
+        self.login_user_use_case = LoginUserUseCase(self.user_repository, self.password_hasher, self.token_service)
+        self.register_user_use_case = RegisterUserUseCase(self.user_repository, self.password_hasher)
+        self.logout_user_use_case = LogoutUserUseCase(self.user_repository)
+        self.friend_use_cases = FriendUseCases(self.friend_repository)
+        self.notification_use_cases = NotificationUseCases(
+            self.notification_repository,
+            coalesce_window_seconds=settings.NOTIFICATION_COALESCE_WINDOW_SECONDS
+        )
+        self.admin_log_use_cases = AdminLogUseCases(self.admin_log_repository)
+        self.circle_use_cases = CircleUseCases(
+            self.circle_repository, self.circle_member_repository, self.safety_network_resolver
+        )
+        self.circle_member_use_cases = CircleMemberUseCases(self.circle_member_repository)
+        self.sos_alert_use_cases = SOSAlertUseCases(
+            self.sos_alert_repository,
+            self.notification_use_cases,
+            self.user_repository,
+            self.safety_network_resolver,
+            self.job_queue,
+            self.event_publisher
+        )
+        self.travel_report_use_cases = TravelReportUseCases(get_ai_gateway(), get_report_cache())
+        self.news_incident_use_cases = NewsIncidentUseCases(
+            self.news_incident_repository, get_forward_geocoder(), get_ai_gateway()
+        )
+        self.user_report_incident_use_cases = UserReportIncidentUseCases(
+            self.user_report_incident_repository, self.event_publisher
+        )
+        self.trip_use_cases = TripUseCases(self.trip_repository)
+        self.get_incidents_use_case = GetIncidentsUseCase(
+            incident_repository=self.incident_repository,
+            sos_alert_repository=self.sos_alert_repository,
+            safety_network_resolver=self.safety_network_resolver,
+            user_repository=self.user_repository
+        )
+        self.create_incident_use_case = CreateIncidentUseCase(
+            incident_repository=self.incident_repository, event_publisher=self.event_publisher
+        )
+        self.create_incidents_batch_use_case = CreateIncidentsBatchUseCase(
+            incident_repository=self.incident_repository,
+            event_publisher=self.event_publisher,
+            max_items=settings.INCIDENT_BATCH_MAX_ITEMS,
+        )
+        self.delete_incident_use_case = DeleteIncidentUseCase(incident_repository=self.incident_repository)
+
+
+_container: Optional[Container] = None
+_container_lock = threading.Lock()
+
+
+def get_container() -> Container:
+    """Per-process container; built in the lifespan handler, or by the first request that needs it."""
+    global _container
+    if _container is None:
+        with _container_lock:
+            if _container is None:
+                _container = Container(get_settings())
+    return _container
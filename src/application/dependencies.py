@@ -1,6 +1,9 @@
-from fastapi import Depends, HTTPException, status
+import hmac
+from datetime import datetime
+from typing import Optional
+from fastapi import Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from fastapi.security import OAuth2PasswordBearer
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer, OAuth2PasswordBearer
 
 from src.application.trip.use_cases import TripUseCases
 from src.application.security.security_interfaces import IPasswordHasher, ITokenService
@@ -10,235 +13,171 @@ from src.application.user.auth_use_cases import (
     LogoutUserUseCase
 )
 from src.domain.user.repository_interface import IUserRepository
-from src.infrastructure.database.sql.database import get_db
-from src.infrastructure.security.security_impl import BcryptPasswordHasher, JwtTokenService
-from src.infrastructure.user.repository_impl import UserRepository
-from src.application.user.dto import TokenData
-from src.domain.friend.repository_interface import IFriendRepository
-from src.infrastructure.friend.repository_impl import FriendRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.database.sql.database import SessionLocal, get_async_db, get_db
+from src.infrastructure.user.principal_cache import cache_principal, get_cached_principal
 from src.application.friend.use_cases import FriendUseCases
 from src.domain.user.entities import User as UserEntity
-from src.domain.sos_alert.repository_interface import ISOSAlertRepository
-from src.infrastructure.sos_alert.repository_impl import SOSAlertRepository
-from src.application.sos_alert.use_cases import SOSAlertUseCases # Import SOSAlertUseCases
-from src.domain.notification.repository_interface import INotificationRepository
-from src.infrastructure.notification.repository_impl import NotificationRepository
+from src.application.sos_alert.use_cases import SOSAlertUseCases
 from src.application.notification.use_cases import NotificationUseCases
-from src.domain.admin_log.repository_interface import IAdminLogRepository
-from src.infrastructure.admin_log.repository_impl import AdminLogRepository
 from src.application.admin_log.use_cases import AdminLogUseCases
-from src.domain.circle.repository_interface import ICircleRepository # Import ICircleRepository
-from src.infrastructure.circle.repository_impl import CircleRepository # Import CircleRepository
-from src.domain.circle.member_repository_interface import ICircleMemberRepository # Import ICircleMemberRepository
-from src.infrastructure.circle.member_repository_impl import CircleMemberRepository # Import CircleMemberRepository
-from src.application.circle.use_cases import CircleUseCases # Import CircleUseCases
-from src.domain.news_incident.repository_interface import INewsIncidentRepository
-from src.infrastructure.news_incident.repository_impl import NewsIncidentRepository
+from src.application.circle.use_cases import CircleUseCases
+from src.application.circle.member_use_cases import CircleMemberUseCases
 from src.application.news_incident.use_cases import NewsIncidentUseCases
-from src.domain.user_report_incident.repository_interface import IUserReportIncidentRepository
-from src.infrastructure.user_report_incident.repository_impl import UserReportIncidentRepository
+from src.application.news_incident.extraction_jobs import NewsExtractionJobManager, get_news_extraction_jobs
 from src.application.user_report_incident.use_cases import UserReportIncidentUseCases
+from src.application.ai.use_cases import TravelReportUseCases
+from src.application.incident.use_cases import (
+    CreateIncidentUseCase,
+    CreateIncidentsBatchUseCase,
+    DeleteIncidentUseCase,
+    GetIncidentsUseCase,
+)
+from src.application.container import get_container
+from src.config.settings import get_settings
+from src.domain.pagination.entities import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, PageRequest
+
+# Repositories and use cases come from the per-process container, so resolving them costs a
+# lookup and no request gets its own object graph. The providers are `async def` so FastAPI
+# calls them inline instead of through its thread pool. The only per-request resource is the
+# session: routes take one (`get_async_db_session`, or `get_db_session` for sync routes) and
+# FastAPI shares it with `get_current_user` within the request.
+
+async def get_page_request(
+    after: Optional[int] = Query(None, ge=1, description="Id of the last item of the previous page"),
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    since: Optional[datetime] = Query(None, description="Only items created at or after this time"),
+    until: Optional[datetime] = Query(None, description="Only items created before this time"),
+) -> PageRequest:
+    return PageRequest(after=after, limit=limit, since=since, until=until)
 
 def get_db_session() -> Session:
     yield from get_db()
 
-def get_user_repository_impl(db: Session = Depends(get_db_session)) -> UserRepository:
-    return UserRepository(db)
-
-def get_friend_repository_impl(db: Session = Depends(get_db_session)) -> FriendRepository:
-    return FriendRepository()
-
-def get_friend_use_cases(
-    friend_repo: IFriendRepository = Depends(get_friend_repository_impl)
-) -> FriendUseCases:
-    return FriendUseCases(friend_repo)
-
-def get_sos_alert_repository_impl(db: Session = Depends(get_db_session)) -> SOSAlertRepository:
-    return SOSAlertRepository()
-
-def get_notification_repository_impl(db: Session = Depends(get_db_session)) -> NotificationRepository:
-    return NotificationRepository()
-
-def get_notification_use_cases(
-    notification_repo: INotificationRepository = Depends(get_notification_repository_impl)
-) -> NotificationUseCases:
-    return NotificationUseCases(notification_repo)
-
-def get_admin_log_repository_impl(db: Session = Depends(get_db_session)) -> AdminLogRepository:
-    return AdminLogRepository()
-
-def get_admin_log_use_cases(
-    admin_log_repo: IAdminLogRepository = Depends(get_admin_log_repository_impl)
-) -> AdminLogUseCases:
-    return AdminLogUseCases(admin_log_repo)
-
-def get_password_hasher_impl() -> BcryptPasswordHasher:
-    return BcryptPasswordHasher()
-
-def get_token_service_impl(
-    user_repo_impl: UserRepository = Depends(get_user_repository_impl)
-) -> JwtTokenService:
-    return JwtTokenService(user_repo_impl)
-
-def provide_user_repository(
-    user_repo_impl: UserRepository = Depends(get_user_repository_impl)
-) -> IUserRepository:
-    return user_repo_impl
-
-def provide_password_hasher(
-    hasher_impl: BcryptPasswordHasher = Depends(get_password_hasher_impl)
-) -> IPasswordHasher:
-    return hasher_impl
-
-def provide_token_service(
-    token_service_impl: JwtTokenService = Depends(get_token_service_impl)
-) -> ITokenService:
-    return token_service_impl
-
-def provide_login_user_use_case(
-    user_repo: IUserRepository = Depends(provide_user_repository),
-    password_hasher: IPasswordHasher = Depends(provide_password_hasher),
-    token_service: ITokenService = Depends(provide_token_service)
-) -> LoginUserUseCase:
-    return LoginUserUseCase(user_repo, password_hasher, token_service)
-
-def provide_register_user_use_case(
-    user_repo: IUserRepository = Depends(provide_user_repository),
-    password_hasher: IPasswordHasher = Depends(provide_password_hasher)
-) -> RegisterUserUseCase:
-    return RegisterUserUseCase(user_repo, password_hasher)
-
-def provide_logout_user_use_case(
-    user_repo: IUserRepository = Depends(provide_user_repository)
-) -> LogoutUserUseCase:
-    return LogoutUserUseCase(user_repo)
-
-def get_circle_repository_impl(db: Session = Depends(get_db_session)) -> CircleRepository:
-    return CircleRepository()
-
-def get_circle_member_repository_impl(db: Session = Depends(get_db_session)) -> CircleMemberRepository:
-    return CircleMemberRepository()
-
-from src.application.circle.member_use_cases import CircleMemberUseCases # Import CircleMemberUseCases
-
-def get_circle_use_cases(
-    circle_repo: ICircleRepository = Depends(get_circle_repository_impl),
-    circle_member_repo: ICircleMemberRepository = Depends(get_circle_member_repository_impl)
-) -> CircleUseCases:
-    return CircleUseCases(circle_repo, circle_member_repo)
-
-def get_circle_member_use_cases(
-    circle_member_repo: ICircleMemberRepository = Depends(get_circle_member_repository_impl)
-) -> CircleMemberUseCases:
-    return CircleMemberUseCases(circle_member_repo)
-
-def get_sos_alert_use_cases(
-    sos_alert_repo: ISOSAlertRepository = Depends(get_sos_alert_repository_impl),
-    notification_use_cases: NotificationUseCases = Depends(get_notification_use_cases),
-    user_repository: IUserRepository = Depends(provide_user_repository),
-    friend_repository: IFriendRepository = Depends(get_friend_repository_impl),
-    circle_repository: ICircleRepository = Depends(get_circle_repository_impl),
-    circle_member_repository: ICircleMemberRepository = Depends(get_circle_member_repository_impl)
-) -> SOSAlertUseCases:
-    return SOSAlertUseCases(
-        sos_alert_repo,
-        notification_use_cases,
-        user_repository,
-        friend_repository,
-        circle_repository,
-        circle_member_repository
-    )
-
-def get_news_incident_repository_impl(db: Session = Depends(get_db_session)) -> NewsIncidentRepository:
-    return NewsIncidentRepository()
-
-def get_news_incident_use_cases(
-    repo: INewsIncidentRepository = Depends(get_news_incident_repository_impl)
-) -> NewsIncidentUseCases:
-    return NewsIncidentUseCases(repo)
-
-def get_user_report_incident_repository_impl(db: Session = Depends(get_db_session)) -> UserReportIncidentRepository:
-    return UserReportIncidentRepository()
-
-def get_user_report_incident_use_cases(
-    repo: IUserReportIncidentRepository = Depends(get_user_report_incident_repository_impl)
-) -> UserReportIncidentUseCases:
-    return UserReportIncidentUseCases(repo)
+async def get_async_db_session() -> AsyncSession:
+    async for db in get_async_db():
+        yield db
+
+async def provide_user_repository() -> IUserRepository:
+    return get_container().user_repository
+
+async def provide_password_hasher() -> IPasswordHasher:
+    return get_container().password_hasher
+
+async def provide_token_service() -> ITokenService:
+    return get_container().token_service
+
+async def provide_login_user_use_case() -> LoginUserUseCase:
+    return get_container().login_user_use_case
+
+async def provide_register_user_use_case() -> RegisterUserUseCase:
+    return get_container().register_user_use_case
+
+async def provide_logout_user_use_case() -> LogoutUserUseCase:
+    return get_container().logout_user_use_case
+
+async def get_friend_use_cases() -> FriendUseCases:
+    return get_container().friend_use_cases
+
+async def get_notification_use_cases() -> NotificationUseCases:
+    return get_container().notification_use_cases
+
+async def get_admin_log_use_cases() -> AdminLogUseCases:
+    return get_container().admin_log_use_cases
+
+async def get_circle_use_cases() -> CircleUseCases:
+    return get_container().circle_use_cases
+
+async def get_circle_member_use_cases() -> CircleMemberUseCases:
+    return get_container().circle_member_use_cases
+
+async def get_travel_report_use_cases() -> TravelReportUseCases:
+    return get_container().travel_report_use_cases
+
+async def get_sos_alert_use_cases() -> SOSAlertUseCases:
+    return get_container().sos_alert_use_cases
+
+async def get_news_incident_use_cases() -> NewsIncidentUseCases:
+    return get_container().news_incident_use_cases
+
+async def get_news_extraction_jobs_impl() -> NewsExtractionJobManager:
+    return get_news_extraction_jobs()
+
+async def get_user_report_incident_use_cases() -> UserReportIncidentUseCases:
+    return get_container().user_report_incident_use_cases
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/login")
+metrics_scheme = HTTPBearer(auto_error=False)
 
 async def get_current_user(
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     token: str = Depends(oauth2_scheme),
     token_service: ITokenService = Depends(provide_token_service),
     user_repo: IUserRepository = Depends(provide_user_repository)
 ) -> UserEntity:
-    user_id = token_service.verify_token(db, token)
-    if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    user = user_repo.get_user_by_id(db, user_id)
+    user_id = token_service.verify_token(token)
+    # The principal cache usually answers, so most requests authenticate without a query
+    user = get_cached_principal(user_id)
     if user is None:
+        user = await db.run_sync(user_repo.get_user_by_id, user_id)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not validate credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        cache_principal(user)
+    return user
+
+async def require_metrics_token(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(metrics_scheme),
+) -> None:
+    # Metrics expose queue depths, cache sizes and login rejections, so they take a
+    # shared scraper token instead of a user login; with no token set they stay closed
+    expected = get_settings().METRICS_TOKEN
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Metrics are disabled (METRICS_TOKEN is not set)")
+    if credentials is None or not hmac.compare_digest(credentials.credentials.encode(), expected.encode()):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
+            detail="Invalid metrics token",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    return user
 
-def get_trip_repository_impl(db: Session = Depends(get_db_session)):
-    from src.infrastructure.trip.repository_impl import TripRepository
-    return TripRepository()
+def authenticate_stream_token(token: str) -> Optional[UserEntity]:
+    # Stream connections live for minutes, so they authenticate with a short-lived
+    # session instead of holding a pooled DB connection for the whole connection
+    container = get_container()
+    try:
+        user_id = container.token_service.verify_token(token)
+    except HTTPException:
+        return None
+    user = get_cached_principal(user_id)
+    if user is not None:
+        return user
+    db = SessionLocal()
+    try:
+        user = container.user_repository.get_user_by_id(db, user_id)
+    finally:
+        db.close()
+    if user is not None:
+        cache_principal(user)
+    return user
 
-def get_trip_use_cases(
-    trip_repo = Depends(get_trip_repository_impl)
-):
-    from src.application.trip.use_cases import TripUseCases
-    return TripUseCases(trip_repo)
+async def get_trip_use_cases() -> TripUseCases:
+    return get_container().trip_use_cases
 
-def provide_trip_use_cases(
-    trip_use_cases: TripUseCases = Depends(get_trip_use_cases)
-) -> TripUseCases:
-    return trip_use_cases
+async def provide_trip_use_cases() -> TripUseCases:
+    return get_container().trip_use_cases
 
+async def get_incidents_use_cases() -> GetIncidentsUseCase:
+    return get_container().get_incidents_use_case
 
-from src.application.incident.use_cases import GetIncidentsUseCase
-from src.domain.incident.repository_interface import IIncidentRepository
-from src.infrastructure.incident.repository_impl import IncidentRepository
+async def get_create_incident_use_case() -> CreateIncidentUseCase:
+    return get_container().create_incident_use_case
 
-def get_incident_repository_impl(db: Session = Depends(get_db_session)) -> IncidentRepository:
-    return IncidentRepository()
+async def get_create_incidents_batch_use_case() -> CreateIncidentsBatchUseCase:
+    return get_container().create_incidents_batch_use_case
 
-def get_incidents_use_cases(
-    incident_repo: IIncidentRepository = Depends(get_incident_repository_impl),
-    sos_alert_repo: ISOSAlertRepository = Depends(get_sos_alert_repository_impl),
-    friend_repo: IFriendRepository = Depends(get_friend_repository_impl),
-    circle_repo: ICircleRepository = Depends(get_circle_repository_impl),
-    circle_member_repo: ICircleMemberRepository = Depends(get_circle_member_repository_impl),
-    user_repo: IUserRepository = Depends(provide_user_repository)
-) -> GetIncidentsUseCase:
-    return GetIncidentsUseCase(
-        incident_repository=incident_repo,
-        sos_alert_repository=sos_alert_repo,
-        friend_repository=friend_repo,
-        circle_repository=circle_repo,
-        circle_member_repository=circle_member_repo,
-        user_repository=user_repo
-    )
-
-from src.application.incident.use_cases import CreateIncidentUseCase
-
-def get_create_incident_use_case(
-    incident_repo: IIncidentRepository = Depends(get_incident_repository_impl),
-) -> CreateIncidentUseCase:
-    return CreateIncidentUseCase(incident_repository=incident_repo)
-
-from src.application.incident.use_cases import DeleteIncidentUseCase
-
-def get_delete_incident_use_case(
-    incident_repo: IIncidentRepository = Depends(get_incident_repository_impl),
-) -> DeleteIncidentUseCase:
-    return DeleteIncidentUseCase(incident_repository=incident_repo)
+async def get_delete_incident_use_case() -> DeleteIncidentUseCase:
+    return get_container().delete_incident_use_case
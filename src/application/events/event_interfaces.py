@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable
+
+class IEventPublisher(ABC):
+    @abstractmethod
+    def publish_to_users(self, user_ids: Iterable[int], event: Dict[str, Any]) -> int: # Returns deliveries
+        pass
+
+    @abstractmethod
+    def publish_nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        event: Dict[str, Any],
+        exclude_user_ids: Iterable[int] = ()
+    ) -> int:
+        pass
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Optional, Tuple
+
+Coordinates = Tuple[float, float] # (latitude, longitude)
+
+class IForwardGeocoder(ABC):
+    @abstractmethod
+    async def geocode_many(self, location_names: Iterable[str]) -> Dict[str, Optional[Coordinates]]:
+        """Coordinates for each distinct name; None when the name could not be placed."""
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        pass
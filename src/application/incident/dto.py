@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 # DTO for user information associated with an SOS alert
 class UserInfoDTO(BaseModel):
@@ -65,3 +65,19 @@ class IncidentCreateDTO(BaseModel):
     longitude: float
 
     severity: Optional[int] = None
+
+
+# DTOs for creating many Incidents at once (POST /incidents/batch)
+class IncidentBatchCreateDTO(BaseModel):
+    items: List[Dict[str, Any]] # Validated one by one, so an invalid item does not reject the whole batch
+
+class IncidentBatchItemResultDTO(BaseModel):
+    index: int
+    status: str # "created" | "invalid"
+    incident: Optional[IncidentDTO] = None
+    errors: Optional[List[str]] = None
+
+class IncidentBatchResponseDTO(BaseModel):
+    created: int
+    invalid: int
+    results: List[IncidentBatchItemResultDTO]
@@ -1,4 +1,4 @@
-from typing import List, Set
+from typing import Dict, List, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
 from src.application.incident.dto import (
@@ -11,10 +11,9 @@ from src.application.incident.dto import (
 )
 from src.domain.incident.repository_interface import IIncidentRepository
 from src.domain.sos_alert.repository_interface import ISOSAlertRepository
-from src.domain.friend.repository_interface import IFriendRepository
-from src.domain.circle.repository_interface import ICircleRepository
-from src.domain.circle.member_repository_interface import ICircleMemberRepository
+from src.domain.safety_network.repository_interface import ISafetyNetworkResolver
 from src.domain.user.repository_interface import IUserRepository
+from src.application.events.event_interfaces import IEventPublisher
 
 
 class GetIncidentsUseCase:
@@ -22,16 +21,12 @@ class GetIncidentsUseCase:
         self,
         incident_repository: IIncidentRepository,
         sos_alert_repository: ISOSAlertRepository,
-        friend_repository: IFriendRepository,
-        circle_repository: ICircleRepository,
-        circle_member_repository: ICircleMemberRepository,
+        safety_network_resolver: ISafetyNetworkResolver,
         user_repository: IUserRepository,
     ):
         self.incident_repository = incident_repository
         self.sos_alert_repository = sos_alert_repository
-        self.friend_repository = friend_repository
-        self.circle_repository = circle_repository
-        self.circle_member_repository = circle_member_repository
+        self.safety_network_resolver = safety_network_resolver
         self.user_repository = user_repository
 
     def execute(self, db: Session, request_dto: GetIncidentsRequestDTO) -> GetIncidentsResponseDTO:
@@ -41,56 +36,40 @@ class GetIncidentsUseCase:
         radius = request_dto.radius
 
         # P0: SOS from friends and circles
-        friend_ids = {friend.id for friend in self.friend_repository.get_friends_by_user_id(db, user_id)}
-        
-        circle_ids = {circle.id for circle in self.circle_repository.get_circles_by_owner(db, user_id)}
-        
-        member_ids: Set[int] = set()
-        for circle_id in circle_ids:
-            members = self.circle_member_repository.get_circle_members_by_circle(db, circle_id)
-            member_ids.update({member.member_id for member in members})
-
-        related_user_ids = list(friend_ids.union(member_ids))
+        network = self.safety_network_resolver.resolve(db, user_id)
+        related_user_ids = list(network.user_ids())
         
         p0_sos_alerts_entities = self.sos_alert_repository.get_sos_alerts_by_user_ids(db, related_user_ids) if related_user_ids else []
-        
-        p0_items: List[PrioritizedItem] = []
-        for alert in p0_sos_alerts_entities:
-            user_entity = self.user_repository.get_user_by_id(db, alert.user_id)
-            user_dto = UserInfoDTO.model_validate(user_entity.__dict__) if user_entity else None
-            if user_dto:
-                p0_items.append(
-                    PrioritizedItem(
-                        priority=0,
-                        item=SOSAlertDTO(
-                            **alert.model_dump(),
-                            user=user_dto
-                        )
-                    )
-                )
-
         p0_alert_ids = {alert.id for alert in p0_sos_alerts_entities}
 
         # P1: SOS from nearby users
-        p1_sos_alerts_entities = self.sos_alert_repository.get_sos_alerts_within_radius(
-            db, latitude, longitude, radius
-        )
-        
-        p1_items: List[PrioritizedItem] = []
-        for alert in p1_sos_alerts_entities:
-            if alert.id not in p0_alert_ids:
-                user_entity = self.user_repository.get_user_by_id(db, alert.user_id)
-                user_dto = UserInfoDTO.model_validate(user_entity.__dict__) if user_entity else None
-                if user_dto:
-                    p1_items.append(
-                        PrioritizedItem(
-                            priority=1,
-                            item=SOSAlertDTO(
-                                **alert.model_dump(),
-                                user=user_dto
-                            )
-                        )
+        p1_sos_alerts_entities = [
+            alert for alert in self.sos_alert_repository.get_sos_alerts_within_radius(db, latitude, longitude, radius)
+            if alert.id not in p0_alert_ids
+        ]
+
+        # Load every alert owner in one query
+        alert_user_ids = {alert.user_id for alert in p0_sos_alerts_entities + p1_sos_alerts_entities}
+        user_dtos: Dict[int, UserInfoDTO] = {
+            user.id: UserInfoDTO.model_validate(user.__dict__)
+            for user in self.user_repository.get_users_by_ids(db, list(alert_user_ids))
+        }
+
+        def to_items(alerts, priority: int) -> List[PrioritizedItem]:
+            return [
+                PrioritizedItem(
+                    priority=priority,
+                    item=SOSAlertDTO(
+                        **alert.model_dump(),
+                        user=user_dtos[alert.user_id]
                     )
+                )
+                for alert in alerts
+                if alert.user_id in user_dtos
+            ]
+
+        p0_items = to_items(p0_sos_alerts_entities, 0)
+        p1_items = to_items(p1_sos_alerts_entities, 1)
 
         # P2: Incidents from reports
         p2_incident_entities = self.incident_repository.get_within_radius(
@@ -108,13 +87,20 @@ class GetIncidentsUseCase:
         return GetIncidentsResponseDTO(items=all_items)
 
 
-from src.application.incident.dto import IncidentCreateDTO
+from pydantic import TypeAdapter, ValidationError
+from src.application.incident.dto import (
+    IncidentBatchCreateDTO,
+    IncidentBatchItemResultDTO,
+    IncidentBatchResponseDTO,
+    IncidentCreateDTO,
+)
 from src.domain.incident.entities import Incident as IncidentEntity
 from datetime import datetime
 
 class CreateIncidentUseCase:
-    def __init__(self, incident_repository: IIncidentRepository):
+    def __init__(self, incident_repository: IIncidentRepository, event_publisher: Optional[IEventPublisher] = None):
         self.incident_repository = incident_repository
+        self.event_publisher = event_publisher
 
     def execute(self, db: Session, incident_create_dto: IncidentCreateDTO) -> IncidentDTO:
         incident_entity = IncidentEntity(
@@ -123,7 +109,73 @@ class CreateIncidentUseCase:
             updated_at=datetime.utcnow()
         )
         created_incident = self.incident_repository.create(db, incident_entity)
-        return IncidentDTO.model_validate(created_incident.__dict__)
+        incident_dto = IncidentDTO.model_validate(created_incident.__dict__)
+        if self.event_publisher is not None:
+            self.event_publisher.publish_nearby(
+                incident_dto.latitude,
+                incident_dto.longitude,
+                {"type": "incident_created", "data": incident_dto.model_dump(mode="json")}
+            )
+        return incident_dto
+
+
+class CreateIncidentsBatchUseCase:
+    """
+    Creates up to `max_items` incidents in one call: the items are validated together,
+    the valid ones are inserted in one transaction and each item gets its own result.
+    """
+
+    _adapter = TypeAdapter(List[IncidentCreateDTO])
+
+    def __init__(
+        self,
+        incident_repository: IIncidentRepository,
+        event_publisher: Optional[IEventPublisher] = None,
+        max_items: int = 5000,
+    ):
+        self.incident_repository = incident_repository
+        self.event_publisher = event_publisher
+        self.max_items = max_items
+
+    def execute(self, db: Session, batch_dto: IncidentBatchCreateDTO) -> IncidentBatchResponseDTO:
+        if not batch_dto.items:
+            raise ValueError("At least one incident is required.")
+        if len(batch_dto.items) > self.max_items:
+            raise ValueError(f"At most {self.max_items} incidents can be created per batch.")
+
+        errors: Dict[int, List[str]] = {}
+        try:
+            dtos = self._adapter.validate_python(batch_dto.items)
+        except ValidationError as e:
+            for error in e.errors():
+                location = ".".join(str(part) for part in error["loc"][1:])
+                errors.setdefault(error["loc"][0], []).append(f"{location}: {error['msg']}" if location else error["msg"])
+            dtos = self._adapter.validate_python([item for i, item in enumerate(batch_dto.items) if i not in errors])
+        valid_indexes = [i for i in range(len(batch_dto.items)) if i not in errors]
+
+        now = datetime.utcnow()
+        created = self.incident_repository.create_batch(
+            db, [IncidentEntity(**dto.model_dump(), created_at=now, updated_at=now) for dto in dtos]
+        )
+        incident_dtos = [IncidentDTO.model_validate(incident.__dict__) for incident in created]
+
+        results: List[IncidentBatchItemResultDTO] = [
+            IncidentBatchItemResultDTO(index=i, status="invalid", errors=messages) for i, messages in errors.items()
+        ]
+        results.extend(
+            IncidentBatchItemResultDTO(index=i, status="created", incident=incident_dto)
+            for i, incident_dto in zip(valid_indexes, incident_dtos)
+        )
+        results.sort(key=lambda result: result.index)
+
+        if self.event_publisher is not None:
+            for incident_dto in incident_dtos:
+                self.event_publisher.publish_nearby(
+                    incident_dto.latitude,
+                    incident_dto.longitude,
+                    {"type": "incident_created", "data": incident_dto.model_dump(mode="json")}
+                )
+        return IncidentBatchResponseDTO(created=len(incident_dtos), invalid=len(errors), results=results)
 
 
 class DeleteIncidentUseCase:
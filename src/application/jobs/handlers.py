@@ -0,0 +1,17 @@
+from typing import Any, Dict
+
+from src.application.container import get_container
+from src.application.sos_alert.use_cases import SOS_FANOUT_JOB
+from src.infrastructure.database.sql.database import SessionLocal
+from src.infrastructure.jobs.worker_pool import JobWorkerPool
+
+def run_sos_fan_out(payload: Dict[str, Any]) -> None:
+    # Workers run outside a request, so each job gets its own session
+    db = SessionLocal()
+    try:
+        get_container().sos_alert_use_cases.fan_out_sos_alert(db, payload["sos_alert_id"])
+    finally:
+        db.close()
+
+def register_job_handlers(job_queue: JobWorkerPool) -> None:
+    job_queue.register(SOS_FANOUT_JOB, run_sos_fan_out)
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional
+from pydantic import BaseModel
+
+class Job(BaseModel):
+    id: str
+    name: str
+    payload: Dict[str, Any] = {}
+    attempts: int = 0
+    available_at: float = 0.0 # time.monotonic() before which the job must not run
+
+JobHandler = Callable[[Dict[str, Any]], None]
+
+class IJobBroker(ABC):
+    @abstractmethod
+    def put(self, job: Job) -> bool: # False when the broker is full
+        pass
+
+    @abstractmethod
+    def get(self, timeout: float) -> Optional[Job]:
+        pass
+
+    @abstractmethod
+    def drain(self) -> List[Job]: # Remove and return every queued job
+        pass
+
+    @abstractmethod
+    def size(self) -> int:
+        pass
+
+class IJobQueue(ABC):
+    @abstractmethod
+    def enqueue(self, name: str, payload: Dict[str, Any]) -> bool: # False if the job was not accepted
+        pass
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -29,3 +29,20 @@ class NewsIncidentExtractRequest(BaseModel):
     days: int = Field(3, ge=1, le=30, description="Lookback window in days")
     max_items: int = Field(20, ge=1, le=100, description="Maximum incidents to extract")
 
+
+
+class NewsExtractionJob(BaseModel):
+    id: str
+    status: str = "queued" # queued | running | succeeded | failed
+    stage: Optional[str] = None # extracting | geocoding | storing | done; where a failed job stopped
+    query: str
+    days: int
+    max_items: int
+    extracted: int = 0 # Incidents returned by the model
+    stored: int = 0
+    skipped: int = 0 # Incidents whose location could not be geocoded
+    incidents: List[NewsIncidentInDB] = [] # Filled in as incidents are stored
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
@@ -0,0 +1,163 @@
+import asyncio
+import re
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from src.application.news_incident.dto import NewsExtractionJob
+from src.application.news_incident.use_cases import NewsIncidentUseCases
+from src.config.settings import get_settings
+from src.infrastructure.ai.gemini_gateway import get_ai_gateway
+from src.infrastructure.database.sql.database import AsyncSessionLocal
+from src.infrastructure.geo.forward_geocoder import get_forward_geocoder
+from src.infrastructure.news_incident.repository_impl import NewsIncidentRepository
+from src.shared.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class NewsExtractionJobManager:
+    """
+    Runs news incident extractions in the background so the request returns right away.
+
+    `workers` tasks on the event loop take jobs from a queue of at most `max_queued` and
+    run `NewsIncidentUseCases.extract_and_store`, which updates the job's stage, counts
+    and stored incidents as it goes. A job for the same (query, days) as one still
+    queued or running is not created again: the existing job is returned. Finished jobs
+    are kept for `retention_seconds`. Jobs live in this worker's memory only.
+    """
+
+    def __init__(
+        self,
+        use_cases: NewsIncidentUseCases,
+        workers: int = 2,
+        max_queued: int = 100,
+        retention_seconds: float = 3600,
+    ):
+        if workers <= 0:
+            raise ValueError("workers must be greater than 0.")
+        self.use_cases = use_cases
+        self.workers = workers
+        self.max_queued = max_queued
+        self.retention_seconds = retention_seconds
+        self._jobs: Dict[str, NewsExtractionJob] = {}
+        self._finished_at: Dict[str, float] = {} # job id -> time.monotonic()
+        self._active: Dict[Tuple[str, int], str] = {} # (query, days) -> job id still queued or running
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._counters = {"submitted": 0, "deduplicated": 0, "rejected": 0, "succeeded": 0, "failed": 0}
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queued)
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+        logger.info(f"News extraction workers started ({self.workers} workers)")
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        # Whatever had not started will never run
+        while self._queue is not None and not self._queue.empty():
+            self._finish(self._queue.get_nowait(), error="Server shut down before the job ran")
+
+    def submit(self, query: str, days: int, max_items: int) -> Optional[Tuple[NewsExtractionJob, bool]]:
+        """(job, created); created is False for a duplicate. None when the queue is full or stopped."""
+        self._prune()
+        key = self._dedupe_key(query, days)
+        active_id = self._active.get(key)
+        if active_id is not None:
+            self._counters["deduplicated"] += 1
+            return self._jobs[active_id], False
+        if not self._tasks or self._queue.full():
+            self._counters["rejected"] += 1
+            return None
+
+        job = NewsExtractionJob(
+            id=uuid.uuid4().hex, query=query, days=days, max_items=max_items, created_at=datetime.utcnow()
+        )
+        self._jobs[job.id] = job
+        self._active[key] = job.id
+        self._queue.put_nowait(job)
+        self._counters["submitted"] += 1
+        return job, True
+
+    def get(self, job_id: str) -> Optional[NewsExtractionJob]:
+        return self._jobs.get(job_id)
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._queue.get()
+            job.status = "running"
+            job.started_at = datetime.utcnow()
+            try:
+                async with AsyncSessionLocal() as db:
+                    await self.use_cases.extract_and_store(db, job.query, job.days, job.max_items, job=job)
+            except asyncio.CancelledError:
+                self._finish(job, error="Server shut down while the job was running")
+                raise
+            except Exception as e:
+                logger.warning(f"News extraction job {job.id} failed: {e}")
+                self._finish(job, error=str(e))
+            else:
+                self._finish(job)
+
+    def _finish(self, job: NewsExtractionJob, error: Optional[str] = None) -> None:
+        job.status = "failed" if error else "succeeded"
+        if not error:
+            job.stage = "done"
+        job.error = error
+        job.finished_at = datetime.utcnow()
+        self._counters[job.status] += 1
+        self._finished_at[job.id] = time.monotonic()
+        key = self._dedupe_key(job.query, job.days)
+        if self._active.get(key) == job.id:
+            del self._active[key]
+
+    @staticmethod
+    def _dedupe_key(query: str, days: int) -> Tuple[str, int]:
+        return re.sub(r"\s+", " ", query).strip().casefold(), days
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - self.retention_seconds
+        for job_id in [job_id for job_id, finished in self._finished_at.items() if finished < cutoff]:
+            del self._finished_at[job_id]
+            self._jobs.pop(job_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        # Only touched from the event loop, so no lock around the counters
+        return {
+            **self._counters,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "running": sum(1 for job in self._jobs.values() if job.status == "running"),
+            "kept": len(self._jobs),
+            "workers": len(self._tasks),
+        }
+
+
+_news_extraction_jobs: Optional[NewsExtractionJobManager] = None
+_news_extraction_jobs_lock = threading.Lock()
+
+
+def get_news_extraction_jobs() -> NewsExtractionJobManager:
+    """Per-process extraction job manager; started in the lifespan handler."""
+    global _news_extraction_jobs
+    if _news_extraction_jobs is None:
+        with _news_extraction_jobs_lock:
+            if _news_extraction_jobs is None:
+                settings = get_settings()
+                _news_extraction_jobs = NewsExtractionJobManager(
+                    NewsIncidentUseCases(NewsIncidentRepository(), get_forward_geocoder(), get_ai_gateway()),
+                    workers=settings.NEWS_EXTRACTION_WORKERS,
+                    max_queued=settings.NEWS_EXTRACTION_QUEUE_SIZE,
+                    retention_seconds=settings.NEWS_EXTRACTION_JOB_RETENTION_SECONDS,
+                )
+    return _news_extraction_jobs
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional
 import os
 
-import httpx
+from google.genai import types
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field, HttpUrl
 
-from src.application.news_incident.dto import NewsIncidentInDB
+from src.application.ai.ai_interfaces import IAIGateway
+from src.application.geo.geocoder_interfaces import Coordinates, IForwardGeocoder
+from src.application.news_incident.dto import NewsExtractionJob, NewsIncidentInDB
 from src.domain.news_incident.entities import NewsIncident as NewsIncidentEntity
 from src.domain.news_incident.repository_interface import INewsIncidentRepository
 
 
+# Incidents geocoded and stored per round, so a running job shows results as it goes
+STORE_CHUNK_SIZE = 10
+
+
 class ExtractedIncident(BaseModel):
     title: str
     summary: Optional[str] = None
@@ -29,9 +36,19 @@ class ExtractedIncidentsReport(BaseModel):
     incidents: List[ExtractedIncident]
 
 
+config_search = types.GenerateContentConfig(tools=[types.Tool(google_search=types.GoogleSearch())])
+config_json = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=ExtractedIncidentsReport,
+    temperature=0.1,
+)
+
+
 class NewsIncidentUseCases:
-    def __init__(self, repo: INewsIncidentRepository):
+    def __init__(self, repo: INewsIncidentRepository, geocoder: IForwardGeocoder, ai_gateway: IAIGateway):
         self.repo = repo
+        self.geocoder = geocoder
+        self.ai_gateway = ai_gateway
 
     def get_news_incidents_within_radius(
         self,
@@ -45,29 +62,52 @@ class NewsIncidentUseCases:
         incidents = self.repo.get_within_radius(db, latitude, longitude, radius)
         return [NewsIncidentInDB.model_validate(i.model_dump()) for i in incidents]
 
-    def extract_and_store(
+    async def extract_and_store(
         self,
-        db: Session,
+        db: AsyncSession,
         query: str,
         days: int = 3,
-        max_items: int = 20
+        max_items: int = 20,
+        job: Optional[NewsExtractionJob] = None
     ) -> List[NewsIncidentInDB]:
-        geoapify_key = os.getenv("GEOAPIFY_KEY")
-        gemini_key = os.getenv("GEMINI_API_KEY")
-        if not geoapify_key:
+        """
+        `job`, when given, is updated with the current stage and counts, and gets each chunk of
+        STORE_CHUNK_SIZE incidents appended to `job.incidents` as soon as the chunk is stored.
+        """
+        job = job or NewsExtractionJob(id="", query=query, days=days, max_items=max_items, created_at=datetime.utcnow())
+        if not os.getenv("GEOAPIFY_KEY"):
             raise ValueError("Missing GEOAPIFY_KEY in environment.")
-        if not gemini_key:
-            raise ValueError("Missing GEMINI_API_KEY in environment.")
 
-        report = self._extract_incidents_via_gemini(query=query, days=days, max_items=max_items, api_key=gemini_key)
+        job.stage = "extracting"
+        # Through the shared gateway: its concurrency limit, deadlines and retries cover these calls too
+        report = await self._extract_incidents_via_gemini(query=query, days=days, max_items=max_items)
+        job.extracted = len(report.incidents)
 
-        stored: List[NewsIncidentInDB] = []
-        for incident in report.incidents:
-            coords = self._geocode_location(incident.location_name, geoapify_key=geoapify_key)
+        for start in range(0, len(report.incidents), STORE_CHUNK_SIZE):
+            chunk = report.incidents[start:start + STORE_CHUNK_SIZE]
+            job.stage = "geocoding"
+            # The chunk's locations at once: cache hits are free, misses are looked up concurrently
+            coordinates = await self.geocoder.geocode_many(incident.location_name for incident in chunk)
+
+            job.stage = "storing"
+            await db.run_sync(self._store_incidents, chunk, coordinates, job)
+        return job.incidents
+
+    def _store_incidents(
+        self,
+        db: Session,
+        incidents: List[ExtractedIncident],
+        coordinates: Dict[str, Optional[Coordinates]],
+        job: NewsExtractionJob
+    ) -> List[NewsIncidentInDB]:
+        entities: List[NewsIncidentEntity] = []
+        for incident in incidents:
+            coords = coordinates.get(incident.location_name)
             if not coords:
+                job.skipped += 1
                 continue
             lat, lon = coords
-            entity = NewsIncidentEntity(
+            entities.append(NewsIncidentEntity(
                 title=incident.title,
                 summary=incident.summary,
                 category=incident.category,
@@ -77,43 +117,21 @@ class NewsIncidentUseCases:
                 source_url=str(incident.source_url),
                 published_at=incident.published_at,
                 severity=incident.severity,
-            )
-            saved = self.repo.upsert_by_source_url(db, entity)
-            stored.append(NewsIncidentInDB.model_validate(saved.model_dump()))
-
-        return stored
-
-    def _geocode_location(self, location_name: str, geoapify_key: str) -> Optional[tuple[float, float]]:
-        url = "https://api.geoapify.com/v1/geocode/search"
-        params = {
-            "text": location_name,
-            "format": "json",
-            "apiKey": geoapify_key,
-            "limit": 1,
-        }
-        with httpx.Client(timeout=8) as client:
-            r = client.get(url, params=params)
-            r.raise_for_status()
-            data = r.json()
-            results = data.get("results") or []
-            if not results:
-                return None
-            return float(results[0]["lat"]), float(results[0]["lon"])
-
-    def _extract_incidents_via_gemini(self, query: str, days: int, max_items: int, api_key: str) -> ExtractedIncidentsReport:
-        from google import genai
-        from google.genai import types
-
-        client = genai.Client(api_key=api_key)
-
-        grounding_tool = types.Tool(google_search=types.GoogleSearch())
-        config_search = types.GenerateContentConfig(tools=[grounding_tool])
-        config_json = types.GenerateContentConfig(
-            response_mime_type="application/json",
-            response_schema=ExtractedIncidentsReport,
-            temperature=0.1,
-        )
-
+            ))
+
+        saved = self.repo.bulk_upsert(db, entities)
+        # A source URL repeated in a later chunk updates the row already listed
+        positions = {incident.id: i for i, incident in enumerate(job.incidents)}
+        for stored in saved:
+            item = NewsIncidentInDB.model_validate(stored.model_dump())
+            if item.id in positions:
+                job.incidents[positions[item.id]] = item
+            else:
+                job.incidents.append(item)
+        job.stored = len(job.incidents)
+        return job.incidents
+
+    async def _extract_incidents_via_gemini(self, query: str, days: int, max_items: int) -> ExtractedIncidentsReport:
         since = (datetime.utcnow() - timedelta(days=days)).date().isoformat()
 
         prompt_search = f"""
@@ -126,11 +144,7 @@ class NewsIncidentUseCases:
         Return a short bullet list with: title, location (district/province/city), date, and source URL.
         """
 
-        response_raw = client.models.generate_content(
-            model="gemini-2.5-flash",
-            contents=prompt_search,
-            config=config_search,
-        )
+        response_raw = await self.ai_gateway.generate(prompt_search, config_search)
 
         prompt_extract = f"""
         Convert the text below into JSON matching the schema `ExtractedIncidentsReport`.
@@ -145,11 +159,7 @@ class NewsIncidentUseCases:
         {response_raw.text}
         """
 
-        response_json = client.models.generate_content(
-            model="gemini-2.5-flash",
-            contents=prompt_extract,
-            config=config_json,
-        )
+        response_json = await self.ai_gateway.generate(prompt_extract, config_json)
 
         if not response_json.parsed:
             raise ValueError("AI extraction failed to produce structured output.")
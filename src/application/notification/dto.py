@@ -1,6 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+
+MAX_MARK_READ_IDS = 1000
 
 class NotificationBase(BaseModel):
     user_id: int
@@ -8,6 +10,7 @@ class NotificationBase(BaseModel):
     message: str
     type: str
     is_read: bool = False
+    sender_id: Optional[int] = None
 
 class NotificationCreate(NotificationBase):
     pass
@@ -22,6 +25,19 @@ class NotificationUpdate(NotificationBase):
 class NotificationInDB(NotificationBase):
     id: int
     created_at: datetime
+    coalesced_count: int = 1 # How many notifications this one stands for
 
     class Config:
         from_attributes = True
+
+class NotificationMarkReadDTO(BaseModel):
+    # Exactly one of: the ids to mark, or the id of the newest item to mark (it and everything older)
+    ids: Optional[List[int]] = Field(None, max_length=MAX_MARK_READ_IDS)
+    up_to: Optional[int] = None
+
+class NotificationMarkReadResultDTO(BaseModel):
+    updated: int
+    unread_count: int
+
+class NotificationUnreadCountDTO(BaseModel):
+    unread_count: int
@@ -0,0 +1,153 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from src.config.settings import get_settings
+from src.domain.notification.repository_interface import INotificationRepository
+from src.infrastructure.database.sql.database import SessionLocal
+from src.infrastructure.notification.repository_impl import NotificationRepository
+from src.shared.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class NotificationRetentionJob:
+    """
+    Moves read notifications older than `retention_days` to the archive table.
+
+    Each batch looks at `batch_size` rows by id and archives and deletes the matching ones
+    in its own transaction, so row locks are held for one batch only; `batch_pause_seconds`
+    between batches leaves room for other writers. `run` is the whole pass (used by the CLI);
+    `start` runs a pass every `interval_seconds` in the background.
+    """
+
+    def __init__(
+        self,
+        notification_repository: INotificationRepository,
+        retention_days: int = 90,
+        batch_size: int = 1000,
+        batch_pause_seconds: float = 0.05,
+        interval_seconds: float = 3600,
+    ):
+        if retention_days <= 0:
+            raise ValueError("retention_days must be greater than 0.")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0.")
+        self.notification_repo = notification_repository
+        self.retention_days = retention_days
+        self.batch_size = batch_size
+        self.batch_pause_seconds = batch_pause_seconds
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = threading.Event() # Ends a pass running on a worker thread at the next batch
+        self._lock = threading.Lock()
+        self._counters = {"runs": 0, "batches": 0, "archived": 0, "failed": 0}
+        self._max_batch_ms = 0.0
+        self._last_run: Optional[Dict[str, Any]] = None
+
+    def run(self, db: Session, now: Optional[datetime] = None, max_batches: Optional[int] = None) -> Dict[str, Any]:
+        """One pass over the table; returns what it did."""
+        cutoff = (now or datetime.now()) - timedelta(days=self.retention_days)
+        started = time.perf_counter()
+        result = {"cutoff": cutoff.isoformat(), "batches": 0, "archived": 0, "max_batch_ms": 0.0}
+        after_id = 0
+        try:
+            while max_batches is None or result["batches"] < max_batches:
+                batch_started = time.perf_counter()
+                archived, after_id = self.notification_repo.archive_read_notifications(
+                    db, cutoff, after_id, self.batch_size
+                )
+                batch_ms = (time.perf_counter() - batch_started) * 1000
+                result["batches"] += 1
+                result["archived"] += archived
+                result["max_batch_ms"] = max(result["max_batch_ms"], round(batch_ms, 1))
+                with self._lock:
+                    self._counters["batches"] += 1
+                    self._counters["archived"] += archived
+                    self._max_batch_ms = max(self._max_batch_ms, batch_ms)
+                if after_id is None or self._stopping.is_set():
+                    break
+                if archived and self.batch_pause_seconds > 0:
+                    time.sleep(self.batch_pause_seconds)
+        except Exception:
+            with self._lock:
+                self._counters["failed"] += 1
+            raise
+        finally:
+            result["seconds"] = round(time.perf_counter() - started, 2)
+            with self._lock:
+                self._counters["runs"] += 1
+                self._last_run = {**result, "finished_at": datetime.now().isoformat()}
+        return result
+
+    def _run_in_own_session(self) -> Dict[str, Any]:
+        db = SessionLocal()
+        try:
+            return self.run(db)
+        finally:
+            db.close()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._loop())
+            logger.info(
+                f"Notification retention started (read notifications older than {self.retention_days} days, "
+                f"every {self.interval_seconds:g}s)"
+            )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopping.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                result = await asyncio.to_thread(self._run_in_own_session)
+                if result["archived"]:
+                    logger.info(f"Archived {result['archived']} notifications in {result['seconds']}s")
+            except Exception as e:
+                logger.error(f"Notification retention run failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._counters,
+                "max_batch_ms": round(self._max_batch_ms, 1),
+                "last_run": self._last_run,
+                "running": int(self._task is not None),
+                "retention_days": self.retention_days,
+            }
+
+
+_notification_retention: Optional[NotificationRetentionJob] = None
+_notification_retention_lock = threading.Lock()
+
+
+def get_notification_retention_job() -> NotificationRetentionJob:
+    """Per-process job; started in the lifespan handler when NOTIFICATION_RETENTION_ENABLED."""
+    global _notification_retention
+    if _notification_retention is None:
+        with _notification_retention_lock:
+            if _notification_retention is None:
+                settings = get_settings()
+                _notification_retention = NotificationRetentionJob(
+                    NotificationRepository(),
+                    retention_days=settings.NOTIFICATION_RETENTION_DAYS,
+                    batch_size=settings.NOTIFICATION_RETENTION_BATCH_SIZE,
+                    batch_pause_seconds=settings.NOTIFICATION_RETENTION_BATCH_PAUSE_SECONDS,
+                    interval_seconds=settings.NOTIFICATION_RETENTION_INTERVAL_SECONDS,
+                )
+    return _notification_retention
@@ -2,19 +2,31 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from sqlalchemy.orm import Session
 from src.domain.notification.repository_interface import INotificationRepository
-from src.application.notification.dto import NotificationCreate, NotificationUpdate
+from src.application.notification.dto import NotificationCreate, NotificationUpdate, NotificationMarkReadDTO, NotificationMarkReadResultDTO
 from src.domain.notification.entities import Notification as NotificationEntity
-from datetime import datetime
+from src.domain.pagination.entities import PageRequest
+from datetime import datetime, timedelta
 
 class NotificationUseCases:
-    def __init__(self, notification_repository: INotificationRepository):
+    def __init__(self, notification_repository: INotificationRepository, coalesce_window_seconds: int = 0):
         self.notification_repo = notification_repository
+        # Bulk notifications from a sender merge into the recipient's unread one of the same type from this window
+        self.coalesce_window_seconds = coalesce_window_seconds
 
     def get_notification(self, db: Session, notification_id: int) -> Optional[NotificationEntity]:
         return self.notification_repo.get_notification(db, notification_id)
 
-    def get_notifications_by_user(self, db: Session, user_id: int) -> List[NotificationEntity]:
-        return self.notification_repo.get_notifications_by_user(db, user_id)
+    def get_notifications_by_user(self, db: Session, user_id: int, page: Optional[PageRequest] = None) -> List[NotificationEntity]:
+        return self.notification_repo.get_notifications_by_user(db, user_id, page)
+
+    def count_unread(self, db: Session, user_id: int) -> int:
+        return self.notification_repo.count_unread(db, user_id)
+
+    def mark_read(self, db: Session, user_id: int, dto: NotificationMarkReadDTO) -> NotificationMarkReadResultDTO:
+        if (dto.ids is None) == (dto.up_to is None):
+            raise ValueError("Provide exactly one of 'ids' or 'up_to'.")
+        updated = self.notification_repo.mark_read(db, user_id, ids=dto.ids, up_to=dto.up_to)
+        return NotificationMarkReadResultDTO(updated=updated, unread_count=self.notification_repo.count_unread(db, user_id))
 
     def create_notification(self, db: Session, notification_data: NotificationCreate) -> NotificationEntity:
         notification_entity = NotificationEntity(
@@ -23,10 +35,32 @@ class NotificationUseCases:
             message=notification_data.message,
             type=notification_data.type,
             is_read=notification_data.is_read,
-            created_at=datetime.now()
+            created_at=datetime.now(),
+            sender_id=notification_data.sender_id
         ) # Added missing parenthesis
         return self.notification_repo.create_notification(db, notification_entity)
 
+    def create_notifications_bulk(self, db: Session, notifications: List[NotificationCreate]) -> int:
+        """Returns the number of notifications delivered, whether inserted or coalesced."""
+        created_at = datetime.now()
+        notification_entities = [
+            NotificationEntity(
+                user_id=notification_data.user_id,
+                title=notification_data.title,
+                message=notification_data.message,
+                type=notification_data.type,
+                is_read=notification_data.is_read,
+                created_at=created_at,
+                sender_id=notification_data.sender_id
+            )
+            for notification_data in notifications
+        ]
+        if self.coalesce_window_seconds > 0:
+            since = created_at - timedelta(seconds=self.coalesce_window_seconds)
+            inserted, coalesced = self.notification_repo.coalesce_notifications_bulk(db, notification_entities, since)
+            return inserted + coalesced
+        return self.notification_repo.create_notifications_bulk(db, notification_entities)
+
     def update_notification(self, db: Session, notification_id: int, notification_update: NotificationUpdate) -> Optional[NotificationEntity]:
         existing_notification = self.notification_repo.get_notification(db, notification_id)
         if not existing_notification:
@@ -2,6 +2,13 @@ from abc import ABC, abstractmethod
 from datetime import timedelta
 from typing import Optional
 
+class PasswordHasherBusyError(Exception):
+    """Too many hashes are queued; the API answers 429 and the client should retry later."""
+
+    def __init__(self, message: str, retry_after_seconds: int = 1):
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
 class IPasswordHasher(ABC):
     @abstractmethod
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
@@ -11,6 +18,14 @@ class IPasswordHasher(ABC):
     def get_password_hash(self, password: str) -> str:
         pass
 
+    @abstractmethod
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool: # Off the event loop
+        pass
+
+    @abstractmethod
+    async def get_password_hash_async(self, password: str) -> str: # Off the event loop
+        pass
+
 class ITokenService(ABC):
     @abstractmethod
     def create_access_token(self, data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -9,9 +9,11 @@ from src.application.sos_alert.dto import (
     SOSAlertInDB
 )
 from src.domain.sos_alert.entities import SOSAlert as SOSAlertEntity
+from src.domain.pagination.entities import PageRequest
 from datetime import datetime
 
 MAX_SOS_MESSAGE_LEN = 255
+SOS_FANOUT_JOB = "sos_alert.fan_out"
 
 
 def _truncate_message(message: str | None) -> str | None:
@@ -23,12 +25,26 @@ def _truncate_message(message: str | None) -> str | None:
     return message[: MAX_SOS_MESSAGE_LEN - 1].rstrip() + "…"
 
 
+def _sos_event(event_type: str, sos_alert: SOSAlertEntity, sender_username: str, source: str) -> dict:
+    return {
+        "type": event_type,
+        "data": {
+            "alert": SOSAlertInDB.model_validate(sos_alert.model_dump()).model_dump(mode="json"),
+            "sender": {"id": sos_alert.user_id, "username": sender_username},
+            "source": source,
+        },
+    }
+
+
 from src.application.notification.use_cases import NotificationUseCases
 from src.application.notification.dto import NotificationCreate
 from src.domain.user.repository_interface import IUserRepository
-from src.domain.friend.repository_interface import IFriendRepository
-from src.domain.circle.repository_interface import ICircleRepository
-from src.domain.circle.member_repository_interface import ICircleMemberRepository
+from src.domain.safety_network.repository_interface import ISafetyNetworkResolver
+from src.application.jobs.job_interfaces import IJobQueue
+from src.application.events.event_interfaces import IEventPublisher
+from src.shared.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 class SOSAlertUseCases:
     def __init__(
@@ -36,22 +52,22 @@ class SOSAlertUseCases:
         sos_alert_repository: ISOSAlertRepository,
         notification_use_cases: NotificationUseCases,
         user_repository: IUserRepository,
-        friend_repository: IFriendRepository,
-        circle_repository: ICircleRepository,
-        circle_member_repository: ICircleMemberRepository
+        safety_network_resolver: ISafetyNetworkResolver,
+        job_queue: Optional[IJobQueue] = None,
+        event_publisher: Optional[IEventPublisher] = None
     ):
         self.sos_alert_repo = sos_alert_repository
         self.notification_use_cases = notification_use_cases
         self.user_repo = user_repository
-        self.friend_repo = friend_repository
-        self.circle_repo = circle_repository
-        self.circle_member_repo = circle_member_repository
+        self.safety_network_resolver = safety_network_resolver
+        self.job_queue = job_queue
+        self.event_publisher = event_publisher
 
     def get_sos_alert(self, db: Session, sos_alert_id: int) -> Optional[SOSAlertEntity]:
         return self.sos_alert_repo.get_sos_alert(db, sos_alert_id)
 
-    def get_sos_alerts_by_user(self, db: Session, user_id: int) -> List[SOSAlertEntity]:
-        return self.sos_alert_repo.get_sos_alerts_by_user(db, user_id)
+    def get_sos_alerts_by_user(self, db: Session, user_id: int, page: Optional[PageRequest] = None) -> List[SOSAlertEntity]:
+        return self.sos_alert_repo.get_sos_alerts_by_user(db, user_id, page)
 
     def get_incidents_for_map(
         self,
@@ -64,30 +80,11 @@ class SOSAlertUseCases:
         if radius <= 0:
             raise ValueError("Radius must be greater than 0.")
 
-        friend_users = self.friend_repo.get_friends_by_user_id(db, user_id)
-        friend_ids = {friend.id for friend in friend_users if friend and friend.id is not None}
-        friend_ids.discard(user_id)
-
-        active_circle_ids = {
-            circle.id for circle in self.circle_repo.get_circles_by_owner(db, user_id)
-            if circle.status == "active"
-        }
-
-        member_entries = self.circle_member_repo.get_circle_members_by_member(db, user_id)
-        for membership in member_entries:
-            if membership.circle_id in active_circle_ids:
-                continue
-            circle = self.circle_repo.get_circle(db, membership.circle_id)
-            if circle and circle.status == "active":
-                active_circle_ids.add(circle.id)
-
-        circle_member_ids = set()
-        for circle_id in active_circle_ids:
-            members = self.circle_member_repo.get_circle_members_by_circle(db, circle_id)
-            circle_member_ids.update(member.member_id for member in members if member.member_id is not None)
-        circle_member_ids.discard(user_id)
+        network = self.safety_network_resolver.resolve(db, user_id)
+        friend_ids = network.friend_ids
+        circle_member_ids = network.circle_member_ids
 
-        target_user_ids = list(friend_ids.union(circle_member_ids))
+        target_user_ids = list(network.user_ids())
         network_alerts = self.sos_alert_repo.get_sos_alerts_by_user_ids(db, target_user_ids)
         nearby_alerts = self.sos_alert_repo.get_sos_alerts_within_radius(db, latitude, longitude, radius)
 
@@ -109,18 +106,12 @@ class SOSAlertUseCases:
                 add_alert(alert, "friend")
             if alert.user_id in circle_member_ids:
                 add_alert(alert, "circle")
-            if alert.user_id not in friend_ids and alert.user_id not in circle_member_ids:
-                add_alert(alert, "friend_or_circle")
 
         for alert in nearby_alerts:
             add_alert(alert, "nearby")
 
         user_ids = {entry["alert"].user_id for entry in incident_store.values()}
-        user_map = {}
-        for uid in user_ids:
-            user = self.user_repo.get_user_by_id(db, uid)
-            if user:
-                user_map[uid] = user
+        user_map = {user.id: user for user in self.user_repo.get_users_by_ids(db, list(user_ids))}
 
         incidents: List[SOSIncidentResponse] = []
         for entry in incident_store.values():
@@ -157,40 +148,78 @@ class SOSAlertUseCases:
         )
         created_alert = self.sos_alert_repo.create_sos_alert(db, sos_alert_entity)
 
-        # Get the sender's username once
-        sender_user = self.user_repo.get_user_by_id(db, sos_alert_data.user_id)
+        # The alert row is committed; notifying the network happens off the request path
+        payload = {"sos_alert_id": created_alert.id}
+        if self.job_queue is None or not self.job_queue.enqueue(SOS_FANOUT_JOB, payload):
+            # No worker pool running (scripts, JOB_QUEUE_ENABLED=false) or the queue is full
+            self.fan_out_sos_alert(db, created_alert.id)
+
+        return created_alert
+
+    def fan_out_sos_alert(self, db: Session, sos_alert_id: int) -> int:
+        """Notify the sender's friends and active circle. Returns the number of notifications."""
+        sos_alert = self.sos_alert_repo.get_sos_alert(db, sos_alert_id)
+        if not sos_alert:
+            return 0
+
+        sender_user = self.user_repo.get_user_by_id(db, sos_alert.user_id)
         sender_username = sender_user.username if sender_user else "Unknown User"
 
-        # Send notifications to friends
-        friends = self.friend_repo.get_friends_by_user_id(db, sos_alert_data.user_id)
-        for friend in friends:
-            notification_message = f"Your friend {sender_username} has sent an SOS alert!"
-            notification_data = NotificationCreate(
-                user_id=friend.id,
-                title="SOS Alert from Friend", # Added title
-                message=notification_message,
-                type="SOS_FRIEND", # Added type
-                is_read=False
+        network = self.safety_network_resolver.resolve(db, sos_alert.user_id)
+        notifications: List[NotificationCreate] = []
+
+        # Notify friends
+        for friend_id in sorted(network.friend_ids):
+            notifications.append(NotificationCreate(
+                user_id=friend_id,
+                title="SOS Alert from Friend",
+                message=f"Your friend {sender_username} has sent an SOS alert!",
+                type="SOS_FRIEND",
+                is_read=False,
+                sender_id=sos_alert.user_id
+            ))
+
+        # Notify active circle members (the sender is never part of their own network)
+        for member_id in sorted(network.own_circle_member_ids):
+            notifications.append(NotificationCreate(
+                user_id=member_id,
+                title="SOS Alert from Circle",
+                message="A member of your active circle has sent an SOS alert!",
+                type="SOS_CIRCLE",
+                is_read=False,
+                sender_id=sos_alert.user_id
+            ))
+
+        # One multi-row INSERT in a single transaction: the job fails (and is retried) only
+        # before this commits. Nothing after it may raise, or the retry inserts them all again.
+        created = self.notification_use_cases.create_notifications_bulk(db, notifications)
+
+        # Push to connected clients: the same recipients, then anyone watching the area
+        if self.event_publisher is not None:
+            recipient_ids = network.friend_ids | network.own_circle_member_ids
+            self._publish(
+                self.event_publisher.publish_to_users,
+                sos_alert.id,
+                recipient_ids,
+                _sos_event("sos_created", sos_alert, sender_username, "network")
             )
-            self.notification_use_cases.create_notification(db, notification_data)
-
-        # Send notifications to active circle members
-        active_circle = self.circle_repo.get_active_circle_by_owner_id(db, sos_alert_data.user_id)
-        if active_circle:
-            circle_members = self.circle_member_repo.get_circle_members_by_circle(db, active_circle.id)
-            for member in circle_members:
-                if member.member_id != sos_alert_data.user_id: # Don't notify the sender
-                    notification_message = f"A member of your active circle has sent an SOS alert!"
-                    notification_data = NotificationCreate(
-                        user_id=member.member_id,
-                        title="SOS Alert from Circle", # Added title
-                        message=notification_message,
-                        type="SOS_CIRCLE", # Added type
-                        is_read=False
-                    )
-                    self.notification_use_cases.create_notification(db, notification_data)
+            self._publish(
+                self.event_publisher.publish_nearby,
+                sos_alert.id,
+                sos_alert.latitude,
+                sos_alert.longitude,
+                _sos_event("sos_created", sos_alert, sender_username, "nearby"),
+                exclude_user_ids=recipient_ids | {sos_alert.user_id}
+            )
+        return created
 
-        return created_alert
+    def _publish(self, publish, sos_alert_id: int, *args, **kwargs) -> None:
+        # Live events are best effort: the notifications are already committed and show up on
+        # the recipients' next notification fetch, so a failed push is logged, never raised
+        try:
+            publish(*args, **kwargs)
+        except Exception:
+            logger.warning("Could not push %s for SOS alert %s", publish.__name__, sos_alert_id, exc_info=True)
 
     def update_sos_alert(self, db: Session, sos_alert_id: int, sos_alert_update: SOSAlertUpdate) -> Optional[SOSAlertEntity]:
         existing_alert = self.sos_alert_repo.get_sos_alert(db, sos_alert_id)
@@ -203,5 +232,30 @@ class SOSAlertUseCases:
         updated_alert_entity = existing_alert.model_copy(update=update_data)
         return self.sos_alert_repo.update_sos_alert(db, sos_alert_id, updated_alert_entity)
 
+    def notify_sos_resolved(self, db: Session, sos_alert: SOSAlertEntity, sender_username: str) -> int:
+        """Tell the sender's friends that the alert is resolved. Returns the number of notifications."""
+        network = self.safety_network_resolver.resolve(db, sos_alert.user_id)
+        notifications = [
+            NotificationCreate(
+                user_id=friend_id,
+                title="SOS Alert Resolved",
+                message=f"Your friend {sender_username}'s SOS alert has been resolved.",
+                type="SOS_RESOLVED",
+                is_read=False,
+                sender_id=sos_alert.user_id
+            )
+            for friend_id in sorted(network.friend_ids)
+        ]
+        created = self.notification_use_cases.create_notifications_bulk(db, notifications)
+        # Everyone in the network who was pushed the SOS also gets the resolved event
+        if self.event_publisher is not None:
+            self._publish(
+                self.event_publisher.publish_to_users,
+                sos_alert.id,
+                network.friend_ids | network.own_circle_member_ids,
+                _sos_event("sos_resolved", sos_alert, sender_username, "network")
+            )
+        return created
+
     def delete_sos_alert(self, db: Session, sos_alert_id: int) -> bool:
         return self.sos_alert_repo.delete_sos_alert(db, sos_alert_id)
@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from src.infrastructure.trip.models import Trip
 from src.domain.trip.repository_interface import ITripRepository
 from src.domain.trip.entities import Trip as TripEntity
+from src.domain.pagination.entities import PageRequest
 from typing import List, Optional
 from src.application.trip.dto import TripBase
 
@@ -12,8 +13,8 @@ class TripUseCases:
     def get_trip(self, db: Session, trip_id: int) -> Optional[TripEntity]:
         return self.trip_repo.get_trip(db, trip_id)
 
-    def get_trips_by_user(self, db: Session, user_id: int) -> List[TripEntity]:
-        return self.trip_repo.get_trips_by_user(db, user_id)
+    def get_trips_by_user(self, db: Session, user_id: int, page: Optional[PageRequest] = None) -> List[TripEntity]:
+        return self.trip_repo.get_trips_by_user(db, user_id, page)
 
     def create_trip(self, db: Session, trip_data: TripBase) -> TripEntity:
         trip_entity = TripEntity(
@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session # Thêm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.domain.user.repository_interface import IUserRepository
 from src.domain.user.entities import User
 from src.application.user.dto import UserLoginDTO, UserRegisterDTO, UserDTO, AuthTokenDTO
@@ -13,15 +14,16 @@ class LoginUserUseCase:
         self.password_hasher = password_hasher
         self.token_service = token_service
 
-    def execute(self, db: Session, login_dto: UserLoginDTO) -> AuthTokenDTO:
-        logger.info(f"Attempting to log in user with username: {login_dto.username}")
-        user = self.user_repo.get_user_by_username(db, username=login_dto.username)
+    async def execute(self, db: AsyncSession, login_dto: UserLoginDTO) -> AuthTokenDTO:
+        # bcrypt runs on the password pool, so the lookup and the check are awaited separately
+        logger.debug(f"Attempting to log in user with username: {login_dto.username}")
+        user = await db.run_sync(self.user_repo.get_user_by_username, login_dto.username)
         if not user:
             logger.warning(f"Login failed for username: {login_dto.username} - User not found")
             raise ValueError("Invalid credentials")
         
         logger.debug(f"Login attempt for {login_dto.username}. Provided password: {login_dto.password}, Stored hash: {user.hashed_password}") # Debug log
-        if not self.password_hasher.verify_password(login_dto.password, user.hashed_password):
+        if not await self.password_hasher.verify_password_async(login_dto.password, user.hashed_password):
             logger.warning(f"Login failed for username: {login_dto.username} - Password mismatch")
             raise ValueError("Invalid credentials")
         
@@ -34,14 +36,14 @@ class RegisterUserUseCase:
         self.user_repo = user_repo
         self.password_hasher = password_hasher
 
-    def execute(self, db: Session, register_dto: UserRegisterDTO) -> UserDTO:
-        logger.info(f"Attempting to register new user with username: {register_dto.username}")
-        existing_user = self.user_repo.get_user_by_username(db, username=register_dto.username)
+    async def execute(self, db: AsyncSession, register_dto: UserRegisterDTO) -> UserDTO:
+        logger.debug(f"Attempting to register new user with username: {register_dto.username}")
+        existing_user = await db.run_sync(self.user_repo.get_user_by_username, register_dto.username)
         if existing_user:
             logger.warning(f"Registration failed for username: {register_dto.username} - Username already registered")
             raise ValueError("Username already registered")
         
-        password_hash = self.password_hasher.get_password_hash(register_dto.password)
+        password_hash = await self.password_hasher.get_password_hash_async(register_dto.password)
         logger.debug(f"Generated password hash for {register_dto.username}: {password_hash}") # Debug log
         new_user = User(
             username=register_dto.username,
@@ -52,7 +54,7 @@ class RegisterUserUseCase:
             full_name=register_dto.full_name,
             disabled=False # Default value
         )
-        created_user = self.user_repo.create_user(db, user_data=new_user)
+        created_user = await db.run_sync(self.user_repo.create_user, new_user)
         logger.info(f"User {created_user.username} registered successfully with ID: {created_user.id}")
         return UserDTO(
             id=created_user.id,
@@ -69,7 +71,7 @@ class LogoutUserUseCase:
         self.user_repo = user_repo
 
     def execute(self, db: Session, user_id: int):
-        logger.info(f"Attempting to log out user with ID: {user_id}")
+        logger.debug(f"Attempting to log out user with ID: {user_id}")
         user = self.user_repo.get_user_by_id(db, user_id=user_id)
         if user:
             logger.info(f"User {user.username} (ID: {user_id}) logged out successfully.")
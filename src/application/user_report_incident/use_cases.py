@@ -1,15 +1,17 @@
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
 
 from src.domain.user_report_incident.repository_interface import IUserReportIncidentRepository
 from src.domain.user_report_incident.entities import UserReportIncident as UserReportIncidentEntity
 from src.application.user_report_incident.dto import UserReportIncidentCreate, UserReportIncidentInDB
+from src.application.events.event_interfaces import IEventPublisher
 
 
 class UserReportIncidentUseCases:
-    def __init__(self, repo: IUserReportIncidentRepository):
+    def __init__(self, repo: IUserReportIncidentRepository, event_publisher: Optional[IEventPublisher] = None):
         self.repo = repo
+        self.event_publisher = event_publisher
 
     def create_report(
         self,
@@ -29,7 +31,15 @@ class UserReportIncidentUseCases:
             created_at=datetime.utcnow(),
         )
         created = self.repo.create(db, entity)
-        return UserReportIncidentInDB.model_validate(created.model_dump())
+        report = UserReportIncidentInDB.model_validate(created.model_dump())
+        if self.event_publisher is not None:
+            self.event_publisher.publish_nearby(
+                report.latitude,
+                report.longitude,
+                {"type": "user_report_created", "data": report.model_dump(mode="json")},
+                exclude_user_ids={reporter_id}
+            )
+        return report
 
     def get_reports_within_radius(
         self,
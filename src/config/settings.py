@@ -4,27 +4,118 @@ from functools import lru_cache
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
+    ASYNC_DATABASE_URL: str = "" # Mặc định suy ra từ DATABASE_URL (aiomysql / aiosqlite)
     
     # Security
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    METRICS_TOKEN: str = "" # Bearer token cho GET /api/metrics; để trống = tắt endpoint
     
     # API
     ENVIRONMENT: str = "development"
+    WEB_CONCURRENCY: int = 1 # Số uvicorn worker; uvicorn cũng đọc biến này làm mặc định cho --workers
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
     
     # Gemini AI
     GEMINI_API_KEY: str
     GEMINI_MODEL: str = "gemini-2.5-flash"
+    GEMINI_BASE_URL: str = "" # Để trống = endpoint mặc định của Google; trỏ tới server giả lập khi test
+    AI_MAX_CONCURRENCY: int = 8 # Số lời gọi Gemini đồng thời tối đa mỗi worker
+    AI_CALL_TIMEOUT_SECONDS: float = 45.0 # Deadline cho mỗi lần gọi
+    AI_DEADLINE_SECONDS: float = 120.0 # Deadline cho cả lời gọi kể cả chờ slot và retry
+    AI_MAX_RETRIES: int = 3
+    AI_RETRY_BACKOFF_SECONDS: float = 1.0
+
+    # Cache báo cáo du lịch AI theo (tỉnh, ngày)
+    AI_REPORT_CACHE_TTL_SECONDS: int = 21600 # Còn "tươi" trong 6 giờ
+    AI_REPORT_CACHE_STALE_SECONDS: int = 21600 # Sau đó vẫn trả bản cũ thêm 6 giờ trong khi làm mới nền
+    AI_REPORT_CACHE_MAX_ENTRIES: int = 512
+    AI_REPORT_CACHE_PERSIST: bool = True # Lưu thêm vào bảng ai_province_reports cho worker mới khởi động
+
+    # Pre-warm báo cáo AI cho các tỉnh được hỏi nhiều nhất
+    AI_PREWARM_ENABLED: bool = True
+    AI_PREWARM_QPS: float = 0.2 # Ngân sách lời gọi Gemini/giây dành cho pre-warm, chia đều cho các worker
+    AI_PREWARM_TOP_PROVINCES: int = 20
+    AI_PREWARM_INTERVAL_SECONDS: int = 600
+    AI_PREWARM_LEAD_SECONDS: int = 1800 # Làm mới trước khi báo cáo hết "tươi" 30 phút
+    AI_PREWARM_DEMAND_HALF_LIFE_SECONDS: int = 86400
 
     # Geoapify
     GEOAPIFY_KEY: str   
+    GEOAPIFY_BASE_URL: str = "https://api.geoapify.com"
+
+    # Cache geocode xuôi (tên địa điểm -> tọa độ) cho trích xuất tin tức: LRU trong RAM + bảng geocode_cache
+    GEOCODE_CACHE_MAX_ENTRIES: int = 10000
+    GEOCODE_CACHE_TTL_SECONDS: int = 604800 # Tọa độ của một địa danh hầu như không đổi
+    GEOCODE_NEGATIVE_TTL_SECONDS: int = 3600 # Nhớ tên không tìm thấy trong 1 giờ (chỉ trong RAM)
+    GEOCODE_CACHE_PERSIST: bool = True
+    GEOCODE_MAX_CONCURRENCY: int = 8
+    GEOCODE_RATE_PER_SECOND: float = 5.0 # Giới hạn của gói Geoapify miễn phí
+    GEOCODE_TIMEOUT_SECONDS: float = 8.0
+
+    # Job trích xuất tin tức chạy nền (POST /api/news-incidents/extract trả về job id)
+    NEWS_EXTRACTION_WORKERS: int = 2
+    NEWS_EXTRACTION_QUEUE_SIZE: int = 100
+    NEWS_EXTRACTION_JOB_RETENTION_SECONDS: int = 3600 # Giữ kết quả job đã xong trong 1 giờ
+
+    # Reverse geocode offline (tọa độ -> tỉnh) từ ranh giới tỉnh, xem scripts/build_province_boundaries.py
+    GEO_PROVINCE_BOUNDARIES_PATH: str = "" # Mặc định: src/infrastructure/geo/data/vn_provinces.geojson
+    GEO_REVERSE_CELL_SIZE_DEG: float = 0.05
+    GEO_REVERSE_BORDER_TOLERANCE_DEG: float = 0.005 # ~500m; gần biên hơn thì hỏi lại Geoapify
+    GEO_PROVINCE_BOUNDARIES_REQUIRED: bool = False # true = thiếu file ranh giới tỉnh thì không khởi động
 
     # Logging
     LOG_LEVEL: str = "INFO" # Thêm cấu hình cấp độ log
 
+    # Geo index (in-memory grid per worker cho các truy vấn bán kính)
+    GEO_INDEX_ENABLED: bool = True
+    GEO_INDEX_CELL_SIZE_DEG: float = 0.05
+    GEO_INDEX_REBUILD_SECONDS: int = 300
+    # Id bị bỏ qua do transaction commit không theo thứ tự id được kiểm tra lại trong khoảng này
+    GEO_INDEX_GAP_SECONDS: int = 60
+
+    # Cache mạng lưới an toàn (bạn bè + thành viên circle) theo từng user
+    SAFETY_NETWORK_CACHE_ENABLED: bool = True
+    SAFETY_NETWORK_CACHE_TTL_SECONDS: int = 60
+    SAFETY_NETWORK_CACHE_MAX_ENTRIES: int = 10000
+
+    # Cache user đã xác thực (principal) theo user id, để get_current_user thường không cần query DB
+    PRINCIPAL_CACHE_ENABLED: bool = True
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 50000
+
+    # Pool băm/kiểm tra mật khẩu bcrypt (login/register), ngoài event loop
+    PASSWORD_HASH_WORKERS: int = 0 # 0 = min(4, số CPU)
+    PASSWORD_HASH_MAX_PENDING: int = 32 # Vượt quá thì trả 429
+
+    # Job queue trong process (fan-out thông báo SOS chạy nền)
+    JOB_QUEUE_ENABLED: bool = True
+    JOB_WORKERS: int = 4
+    JOB_QUEUE_MAX_SIZE: int = 10000
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BACKOFF_SECONDS: float = 0.5
+
+    # Gộp thông báo: SOS lặp lại từ cùng người gửi cập nhật thông báo chưa đọc cùng loại thay vì tạo mới
+    NOTIFICATION_COALESCE_WINDOW_SECONDS: int = 1800 # 0 = tắt
+
+    # Lưu trữ thông báo: chuyển thông báo đã đọc cũ sang bảng notifications_archive
+    NOTIFICATION_RETENTION_ENABLED: bool = False # Chạy song song nhiều worker vẫn an toàn; hoặc chạy scripts/archive_notifications.py bằng cron
+    NOTIFICATION_RETENTION_DAYS: int = 90
+    NOTIFICATION_RETENTION_BATCH_SIZE: int = 1000 # Số dòng xét trong mỗi transaction
+    NOTIFICATION_RETENTION_BATCH_PAUSE_SECONDS: float = 0.05
+    NOTIFICATION_RETENTION_INTERVAL_SECONDS: int = 3600
+
+    # Tạo incident hàng loạt (POST /api/incidents/batch)
+    INCIDENT_BATCH_MAX_ITEMS: int = 5000
+
+    # Realtime stream (/api/stream WebSocket + SSE)
+    STREAM_QUEUE_SIZE: int = 100
+    STREAM_HEARTBEAT_SECONDS: int = 25
+    STREAM_DEFAULT_RADIUS_KM: float = 5.0
+    STREAM_MAX_RADIUS_KM: float = 50.0
+
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -3,6 +3,7 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 from datetime import datetime
 from src.domain.admin_log.entities import AdminLog as AdminLogEntity
+from src.domain.pagination.entities import PageRequest
 
 class IAdminLogRepository(ABC):
     @abstractmethod
@@ -10,7 +11,7 @@ class IAdminLogRepository(ABC):
         pass
 
     @abstractmethod
-    def get_admin_logs_by_admin(self, db: Session, admin_id: int) -> List[AdminLogEntity]:
+    def get_admin_logs_by_admin(self, db: Session, admin_id: int, page: Optional[PageRequest] = None) -> List[AdminLogEntity]: # Newest first
         pass
 
     @abstractmethod
@@ -12,6 +12,10 @@ class ICircleMemberRepository(ABC):
     # def get_circle_members_by_circle(self, db: Session, circle_id: int) -> List[CircleMemberEntity]:
     #     pass
 
+    @abstractmethod
+    def get_members_by_circle_ids(self, db: Session, circle_ids: List[int]) -> List[CircleMemberEntity]:
+        pass
+
     @abstractmethod
     def get_circle_members_as_users(self, db: Session, circle_id: int):
         pass
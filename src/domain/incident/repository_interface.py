@@ -9,6 +9,14 @@ class IIncidentRepository(ABC):
     def create(self, db: Session, incident: IncidentEntity) -> IncidentEntity:
         pass
 
+    @abstractmethod
+    def create_many(self, db: Session, incidents: List[IncidentEntity]) -> int:
+        pass
+
+    @abstractmethod
+    def create_batch(self, db: Session, incidents: List[IncidentEntity]) -> List[IncidentEntity]:
+        pass
+
     @abstractmethod
     def get_by_id(self, db: Session, incident_id: int) -> Optional[IncidentEntity]:
         pass
@@ -9,6 +9,10 @@ class INewsIncidentRepository(ABC):
     def upsert_by_source_url(self, db: Session, incident: NewsIncidentEntity) -> NewsIncidentEntity:
         pass
 
+    @abstractmethod
+    def bulk_upsert(self, db: Session, incidents: List[NewsIncidentEntity]) -> List[NewsIncidentEntity]:
+        pass
+
     @abstractmethod
     def get_within_radius(
         self,
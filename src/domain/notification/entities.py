@@ -10,3 +10,5 @@ class Notification(BaseModel):
     type: str
     is_read: bool = False
     created_at: Optional[datetime] = None
+    sender_id: Optional[int] = None # User whose action caused it; repeats from one sender are coalesced
+    coalesced_count: int = 1
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 from src.domain.notification.entities import Notification as NotificationEntity
+from src.domain.pagination.entities import PageRequest
 
 class INotificationRepository(ABC):
     @abstractmethod
@@ -9,13 +11,33 @@ class INotificationRepository(ABC):
         pass
 
     @abstractmethod
-    def get_notifications_by_user(self, db: Session, user_id: int) -> List[NotificationEntity]:
+    def get_notifications_by_user(self, db: Session, user_id: int, page: Optional[PageRequest] = None) -> List[NotificationEntity]: # Newest first
+        pass
+
+    @abstractmethod
+    def count_unread(self, db: Session, user_id: int) -> int:
+        pass
+
+    @abstractmethod
+    def mark_read(self, db: Session, user_id: int, ids: Optional[List[int]] = None, up_to: Optional[int] = None) -> int:
+        pass
+
+    @abstractmethod
+    def archive_read_notifications(self, db: Session, older_than: datetime, after_id: int, batch_size: int) -> Tuple[int, Optional[int]]:
         pass
 
     @abstractmethod
     def create_notification(self, db: Session, notification_data: NotificationEntity) -> NotificationEntity:
         pass
 
+    @abstractmethod
+    def create_notifications_bulk(self, db: Session, notifications: List[NotificationEntity]) -> int:
+        pass
+
+    @abstractmethod
+    def coalesce_notifications_bulk(self, db: Session, notifications: List[NotificationEntity], since: datetime) -> Tuple[int, int]:
+        pass
+
     @abstractmethod
     def update_notification(self, db: Session, notification_id: int, notification_data: NotificationEntity) -> Optional[NotificationEntity]:
         pass
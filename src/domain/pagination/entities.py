@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 200
+
+class PageRequest(BaseModel):
+    """
+    One page of a per-user listing, newest first. `after` is the id of the last item of
+    the previous page; `since` (inclusive) and `until` (exclusive) bound created_at.
+    """
+    after: Optional[int] = None
+    limit: int = DEFAULT_PAGE_LIMIT
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
@@ -0,0 +1,27 @@
+from typing import Dict, Optional, Set
+from pydantic import BaseModel
+
+# Provenance bits: why a user is part of someone's safety network
+NETWORK_FRIEND = 1
+NETWORK_CIRCLE = 2       # shares an active circle with the user (owned or joined)
+NETWORK_OWN_CIRCLE = 4   # member of the user's own active circle
+
+class SafetyNetwork(BaseModel):
+    user_id: int
+    active_circle_id: Optional[int] = None  # the user's own active circle, if any
+    members: Dict[int, int] = {}  # user id -> provenance bitmask
+
+    def user_ids(self, mask: int = NETWORK_FRIEND | NETWORK_CIRCLE) -> Set[int]:
+        return {uid for uid, sources in self.members.items() if sources & mask}
+
+    @property
+    def friend_ids(self) -> Set[int]:
+        return self.user_ids(NETWORK_FRIEND)
+
+    @property
+    def circle_member_ids(self) -> Set[int]:
+        return self.user_ids(NETWORK_CIRCLE)
+
+    @property
+    def own_circle_member_ids(self) -> Set[int]:
+        return self.user_ids(NETWORK_OWN_CIRCLE)
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+from sqlalchemy.orm import Session
+from src.domain.safety_network.entities import SafetyNetwork
+
+class ISafetyNetworkResolver(ABC):
+    @abstractmethod
+    def resolve(self, db: Session, user_id: int) -> SafetyNetwork:
+        pass
+
+    @abstractmethod
+    def invalidate_users(self, user_ids: Iterable[int]) -> None:
+        pass
+
+    @abstractmethod
+    def invalidate_circles(self, db: Session, circle_ids: Iterable[int]) -> None:
+        pass
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from sqlalchemy.orm import Session
 from src.domain.sos_alert.entities import SOSAlert as SOSAlertEntity
+from src.domain.pagination.entities import PageRequest
 
 class ISOSAlertRepository(ABC):
     @abstractmethod
@@ -9,7 +10,7 @@ class ISOSAlertRepository(ABC):
         pass
 
     @abstractmethod
-    def get_sos_alerts_by_user(self, db: Session, user_id: int) -> List[SOSAlertEntity]:
+    def get_sos_alerts_by_user(self, db: Session, user_id: int, page: Optional[PageRequest] = None) -> List[SOSAlertEntity]: # Newest first
         pass
 
     @abstractmethod
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from sqlalchemy.orm import Session
 from src.domain.trip.entities import Trip as TripEntity
+from src.domain.pagination.entities import PageRequest
 
 class ITripRepository(ABC):
     @abstractmethod
@@ -9,7 +10,7 @@ class ITripRepository(ABC):
         pass
 
     @abstractmethod
-    def get_trips_by_user(self, db: Session, user_id: int) -> List[TripEntity]:
+    def get_trips_by_user(self, db: Session, user_id: int, page: Optional[PageRequest] = None) -> List[TripEntity]: # Newest first
         pass
 
     @abstractmethod
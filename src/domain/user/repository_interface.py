@@ -8,6 +8,10 @@ class IUserRepository(ABC):
     def get_user_by_id(self, db: Session, user_id: int) -> Optional[UserEntity]:
         pass
 
+    @abstractmethod
+    def get_users_by_ids(self, db: Session, user_ids: List[int]) -> List[UserEntity]:
+        pass
+
     @abstractmethod
     def get_user_by_username(self, db: Session, username: str) -> Optional[UserEntity]:
         pass
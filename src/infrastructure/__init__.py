@@ -11,5 +11,8 @@ from .trip import models as trip_models
 from .news_incident import models as news_incident_models
 from .user_report_incident import models as user_report_incident_models
 from .incident import models as incident_models
+from .jobs import models as job_models
+from .ai import models as ai_models
+from .geo import models as geo_models
 
 # Add other model imports as needed
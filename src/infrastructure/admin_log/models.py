@@ -1,10 +1,11 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from src.infrastructure.database.sql.database import Base
 
 class AdminLog(Base):
     __tablename__ = "admin_logs"
+    __table_args__ = (Index("ix_admin_logs_admin_created_id", "admin_id", "created_at", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     admin_id = Column(Integer, ForeignKey("users.id"))
@@ -3,6 +3,8 @@ from src.infrastructure.admin_log.models import AdminLog
 from src.domain.admin_log.repository_interface import IAdminLogRepository
 from src.domain.admin_log.entities import AdminLog as AdminLogEntity
 from src.application.admin_log.dto import AdminLogCreate, AdminLogUpdate
+from src.domain.pagination.entities import PageRequest
+from src.infrastructure.database.sql.pagination import keyset_page
 from typing import List, Optional
 from datetime import datetime
 
@@ -13,8 +15,9 @@ class AdminLogRepository(IAdminLogRepository):
             return AdminLogEntity.model_validate(db_admin_log.__dict__)
         return None
 
-    def get_admin_logs_by_admin(self, db: Session, admin_id: int) -> List[AdminLogEntity]:
-        db_admin_logs = db.query(AdminLog).filter(AdminLog.admin_id == admin_id).all()
+    def get_admin_logs_by_admin(self, db: Session, admin_id: int, page: Optional[PageRequest] = None) -> List[AdminLogEntity]:
+        query = db.query(AdminLog).filter(AdminLog.admin_id == admin_id)
+        db_admin_logs = keyset_page(db, query, AdminLog, page).all()
         return [AdminLogEntity.model_validate(log.__dict__) for log in db_admin_logs]
 
     def create_admin_log(self, db: Session, admin_log_data: AdminLogEntity) -> AdminLogEntity:
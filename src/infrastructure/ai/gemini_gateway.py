@@ -0,0 +1,140 @@
+import asyncio
+import random
+import threading
+from typing import Any, Dict, Optional
+
+import httpx
+from google import genai
+from google.genai import errors, types
+
+from src.application.ai.ai_interfaces import AIGatewayError, IAIGateway
+from src.config.settings import get_settings
+from src.shared.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class GeminiGateway(IAIGateway):
+    """
+    Async access to Gemini for request handlers.
+
+    Calls go through the SDK's async client (`client.aio`), so a slow model never holds
+    the event loop. A semaphore caps the calls in flight per worker; each attempt gets
+    `call_timeout_seconds` and the whole call, including the wait for a slot and the
+    retries, must finish within `deadline_seconds`. Rate limits (429), 5xx, network
+    errors and timeouts are retried with jittered exponential backoff. Cancelling the
+    awaiting task (e.g. the client went away) cancels the HTTP request to the model.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        base_url: Optional[str] = None,
+        max_concurrency: int = 8,
+        call_timeout_seconds: float = 45.0,
+        deadline_seconds: float = 120.0,
+        max_retries: int = 3,
+        backoff_seconds: float = 1.0,
+        max_backoff_seconds: float = 10.0,
+    ):
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be greater than 0.")
+        http_options = types.HttpOptions(base_url=base_url) if base_url else None
+        self.client = genai.Client(api_key=api_key, http_options=http_options)
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.call_timeout_seconds = call_timeout_seconds
+        self.deadline_seconds = deadline_seconds
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._in_flight = 0
+        self._waiting = 0
+        self._counters = {"calls": 0, "succeeded": 0, "retried": 0, "timed_out": 0, "failed": 0, "cancelled": 0}
+
+    async def generate(self, contents: Any, config: Optional[Any] = None) -> Any:
+        self._counters["calls"] += 1
+        try:
+            return await asyncio.wait_for(self._generate_with_retry(contents, config), timeout=self.deadline_seconds)
+        except asyncio.TimeoutError:
+            self._counters["timed_out"] += 1
+            raise AIGatewayError(f"AI call exceeded its {self.deadline_seconds:g}s deadline.", status_code=504)
+        except asyncio.CancelledError:
+            self._counters["cancelled"] += 1
+            raise
+
+    async def _generate_with_retry(self, contents: Any, config: Optional[Any]) -> Any:
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self._call(contents, config)
+                self._counters["succeeded"] += 1
+                return response
+            except asyncio.TimeoutError:
+                error, status_code = f"attempt timed out after {self.call_timeout_seconds:g}s", 504
+            except errors.APIError as e:
+                if e.code != 429 and (e.code or 0) < 500:
+                    self._counters["failed"] += 1
+                    raise AIGatewayError(f"AI Error: {e}", status_code=500)
+                error, status_code = f"{e.code} {e.status}", 429 if e.code == 429 else 500
+            except httpx.TransportError as e:
+                error, status_code = f"{type(e).__name__}: {e}", 500
+
+            if attempt >= self.max_retries:
+                self._counters["failed"] += 1
+                logger.error(f"Gemini call failed after {attempt} attempts: {error}")
+                if status_code == 429:
+                    raise AIGatewayError("Hệ thống AI đang quá tải, vui lòng thử lại sau.", status_code=429)
+                raise AIGatewayError(f"AI Error: {error}", status_code=status_code)
+
+            delay = min(self.max_backoff_seconds, self.backoff_seconds * 2 ** (attempt - 1))
+            self._counters["retried"] += 1
+            logger.warning(f"Gemini attempt {attempt}/{self.max_retries} failed ({error}), retrying")
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+
+    async def _call(self, contents: Any, config: Optional[Any]) -> Any:
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        self._in_flight += 1
+        try:
+            return await asyncio.wait_for(
+                self.client.aio.models.generate_content(model=self.model, contents=contents, config=config),
+                timeout=self.call_timeout_seconds,
+            )
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, int]:
+        # Only touched from the event loop, so no lock around the counters
+        return {**self._counters, "in_flight": self._in_flight, "waiting": self._waiting, "limit": self.max_concurrency}
+
+
+_ai_gateway: Optional[GeminiGateway] = None
+_ai_gateway_lock = threading.Lock()
+
+
+def get_ai_gateway() -> GeminiGateway:
+    """Per-process gateway, so the concurrency limit covers every AI route of the worker."""
+    global _ai_gateway
+    if _ai_gateway is None:
+        with _ai_gateway_lock:
+            if _ai_gateway is None:
+                settings = get_settings()
+                _ai_gateway = GeminiGateway(
+                    api_key=settings.GEMINI_API_KEY,
+                    model=settings.GEMINI_MODEL,
+                    base_url=settings.GEMINI_BASE_URL or None,
+                    max_concurrency=settings.AI_MAX_CONCURRENCY,
+                    call_timeout_seconds=settings.AI_CALL_TIMEOUT_SECONDS,
+                    deadline_seconds=settings.AI_DEADLINE_SECONDS,
+                    max_retries=settings.AI_MAX_RETRIES,
+                    backoff_seconds=settings.AI_RETRY_BACKOFF_SECONDS,
+                )
+    return _ai_gateway
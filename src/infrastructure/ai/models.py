@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Date, DateTime, Integer, String, Text, UniqueConstraint
+from src.infrastructure.database.sql.database import Base
+
+class ProvinceReport(Base):
+    __tablename__ = "ai_province_reports"
+    __table_args__ = (
+        UniqueConstraint("province_key", "report_date", name="uq_ai_province_reports_key_date"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    province_key = Column(String(100), nullable=False) # Tên tỉnh đã chuẩn hoá (không dấu, bỏ "tỉnh"/"thành phố")
+    report_date = Column(Date, nullable=False)
+    province_name = Column(String(255))
+    payload = Column(Text, nullable=False) # VietnamReport JSON
+    generated_at = Column(DateTime, nullable=False) # UTC
+
+class ProvinceReportLease(Base):
+    """Which worker may regenerate a (province, date) report; the others skip it until leased_until."""
+    __tablename__ = "ai_report_refresh_leases"
+    __table_args__ = (
+        UniqueConstraint("province_key", "report_date", name="uq_ai_report_refresh_leases_key_date"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    province_key = Column(String(100), nullable=False)
+    report_date = Column(Date, nullable=False)
+    leased_until = Column(DateTime, nullable=False) # UTC
@@ -0,0 +1,261 @@
+import asyncio
+import math
+import threading
+import time
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.application.ai.ai_interfaces import IReportCache, ReportGenerator
+from src.application.ai.provinces import canonical_province_name, normalize_province_name
+from src.application.cache.cache_interfaces import ICacheBackend
+from src.config.settings import get_settings
+from src.infrastructure.ai.report_repository import ProvinceReportRepository
+from src.infrastructure.cache.memory_cache import InMemoryTTLCache
+from src.infrastructure.database.sql.database import AsyncSessionLocal
+from src.shared.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ProvinceDemandTracker:
+    """
+    Exponentially decaying request count per province; a request counts half as much
+    after `half_life_seconds`, so the ranking follows current demand.
+    """
+
+    def __init__(self, half_life_seconds: float = 86400, max_provinces: int = 500):
+        self.decay_rate = math.log(2) / half_life_seconds
+        self.max_provinces = max_provinces
+        self._scores: Dict[str, Tuple[float, float, str]] = {} # key -> (score, updated_at, display name)
+        self._lock = threading.Lock()
+
+    def record(self, province_name: str) -> None:
+        # Free text (/weather_place) only counts once it names a known province
+        province_name = canonical_province_name(province_name)
+        if province_name is None:
+            return
+        key = normalize_province_name(province_name)
+        now = time.time()
+        with self._lock:
+            score, updated_at, _ = self._scores.get(key, (0.0, now, province_name))
+            self._scores[key] = (self._decayed(score, updated_at, now) + 1.0, now, province_name)
+            if len(self._scores) > self.max_provinces:
+                weakest = min(self._scores, key=lambda k: self._decayed(self._scores[k][0], self._scores[k][1], now))
+                del self._scores[weakest]
+
+    def top(self, limit: int) -> List[str]:
+        now = time.time()
+        with self._lock:
+            ranked = sorted(
+                self._scores.values(),
+                key=lambda entry: self._decayed(entry[0], entry[1], now),
+                reverse=True
+            )
+        return [name for _, _, name in ranked[:limit]]
+
+    def _decayed(self, score: float, updated_at: float, now: float) -> float:
+        return score * math.exp(-self.decay_rate * (now - updated_at))
+
+
+class ProvinceReportCache(IReportCache):
+    """
+    Cache of AI travel reports keyed by (normalized province, date).
+
+    A report is fresh for `ttl_seconds`; for `stale_seconds` after that it is still served
+    while one background refresh regenerates it. Concurrent misses for the same key share
+    a single generation. With `persist`, reports are also written to `ai_province_reports`
+    so a cold worker reads them from the database instead of calling the model again.
+    """
+
+    def __init__(
+        self,
+        backend: ICacheBackend,
+        ttl_seconds: float = 21600,
+        stale_seconds: float = 21600,
+        persist: bool = True,
+        repository: Optional[ProvinceReportRepository] = None,
+        demand: Optional[ProvinceDemandTracker] = None,
+    ):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.persist = persist
+        self.repository = repository or ProvinceReportRepository()
+        self.demand = demand or ProvinceDemandTracker()
+        self._in_flight: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+        self._background: Set[asyncio.Task] = set()
+        self._counters = {
+            "fresh_hits": 0, "stale_hits": 0, "db_hits": 0, "misses": 0,
+            "coalesced": 0, "generated": 0, "errors": 0,
+        }
+
+    @staticmethod
+    def cache_key(province_name: str, report_date: date) -> str:
+        return f"ai_report:{normalize_province_name(province_name)}:{report_date.isoformat()}"
+
+    async def get_or_generate(self, province_name: str, generate: ReportGenerator) -> Dict[str, Any]:
+        self.demand.record(province_name)
+        report_date = date.today()
+        key = self.cache_key(province_name, report_date)
+
+        entry = await self._get_entry(key, province_name, report_date)
+        if entry is not None:
+            age = time.time() - entry["generated_at"]
+            if age < self.ttl_seconds:
+                self._counters["fresh_hits"] += 1
+                return entry["payload"]
+            if age < self.ttl_seconds + self.stale_seconds:
+                self._counters["stale_hits"] += 1
+                if key not in self._in_flight:
+                    task = self._start_generation(key, province_name, report_date, generate)
+                    self._background.add(task)
+                    task.add_done_callback(self._finish_background)
+                return entry["payload"]
+
+        self._counters["misses"] += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            task = self._start_generation(key, province_name, report_date, generate)
+        else:
+            self._counters["coalesced"] += 1
+        # shield: one caller going away must not cancel the generation the others wait on
+        entry = await asyncio.shield(task)
+        return entry["payload"]
+
+    async def needs_refresh(self, province_name: str, lead_seconds: float = 0) -> bool:
+        """
+        True when today's report is missing or stops being fresh within `lead_seconds`. With
+        `persist`, a report another worker stored since is picked up instead.
+        """
+        report_date = date.today()
+        key = self.cache_key(province_name, report_date)
+        entry = self.backend.get(key)
+        if entry is None or self._refresh_due(entry, lead_seconds):
+            stored = await self._load(province_name, report_date) if self.persist else None
+            if stored is not None and (entry is None or stored["generated_at"] > entry["generated_at"]):
+                self._counters["db_hits"] += 1
+                self.backend.set(key, stored, ttl_seconds=self.ttl_seconds + self.stale_seconds)
+                entry = stored
+        return entry is None or self._refresh_due(entry, lead_seconds)
+
+    def _refresh_due(self, entry: Dict[str, Any], lead_seconds: float) -> bool:
+        return time.time() - entry["generated_at"] >= self.ttl_seconds - lead_seconds
+
+    async def claim_refresh(self, province_name: str, lease_seconds: float) -> bool:
+        """Per-(province, date) lease in the database, so one worker regenerates a report."""
+        if not self.persist:
+            return True
+        try:
+            async with AsyncSessionLocal() as db:
+                return await db.run_sync(
+                    self.repository.claim_refresh, normalize_province_name(province_name), date.today(), lease_seconds
+                )
+        except Exception as e:
+            # Without the lease table every worker refreshes, as before it existed
+            logger.warning(f"Could not take the refresh lease for '{province_name}': {e}")
+            return True
+
+    async def refresh(self, province_name: str, generate: ReportGenerator) -> Dict[str, Any]:
+        """Regenerate today's report now, joining a generation already in flight for it."""
+        report_date = date.today()
+        key = self.cache_key(province_name, report_date)
+        task = self._in_flight.get(key) or self._start_generation(key, province_name, report_date, generate)
+        entry = await asyncio.shield(task)
+        return entry["payload"]
+
+    def top_provinces(self, limit: int) -> List[str]:
+        return self.demand.top(limit)
+
+    async def _get_entry(self, key: str, province_name: str, report_date: date) -> Optional[Dict[str, Any]]:
+        entry = self.backend.get(key)
+        if entry is None and self.persist:
+            entry = await self._load(province_name, report_date)
+            if entry is not None:
+                self._counters["db_hits"] += 1
+                self.backend.set(key, entry, ttl_seconds=self.ttl_seconds + self.stale_seconds)
+        return entry
+
+    def _start_generation(self, key: str, province_name: str, report_date: date, generate: ReportGenerator) -> asyncio.Task:
+        task = asyncio.ensure_future(self._generate_and_store(key, province_name, report_date, generate))
+        self._in_flight[key] = task
+        task.add_done_callback(lambda done: self._finish_generation(key, done))
+        return task
+
+    def _finish_generation(self, key: str, task: asyncio.Task) -> None:
+        self._in_flight.pop(key, None)
+        if not task.cancelled():
+            task.exception() # Marks the error as retrieved when every waiter has gone away
+
+    async def _generate_and_store(self, key: str, province_name: str, report_date: date, generate: ReportGenerator) -> Dict[str, Any]:
+        try:
+            payload = await generate(province_name)
+        except Exception:
+            self._counters["errors"] += 1
+            raise
+        self._counters["generated"] += 1
+        entry = {"payload": payload, "generated_at": time.time()}
+        self.backend.set(key, entry, ttl_seconds=self.ttl_seconds + self.stale_seconds)
+        if self.persist:
+            await self._save(province_name, report_date, entry)
+        return entry
+
+    def _finish_background(self, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Background report refresh failed, serving stale report: {task.exception()}")
+
+    async def _load(self, province_name: str, report_date: date) -> Optional[Dict[str, Any]]:
+        try:
+            async with AsyncSessionLocal() as db:
+                stored = await db.run_sync(
+                    self.repository.get_report, normalize_province_name(province_name), report_date
+                )
+        except Exception as e:
+            logger.warning(f"Could not read cached report for '{province_name}': {e}")
+            return None
+        if stored is None:
+            return None
+        payload, generated_at = stored
+        return {"payload": payload, "generated_at": generated_at.replace(tzinfo=timezone.utc).timestamp()}
+
+    async def _save(self, province_name: str, report_date: date, entry: Dict[str, Any]) -> None:
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.run_sync(
+                    self.repository.save_report,
+                    normalize_province_name(province_name),
+                    report_date,
+                    province_name,
+                    entry["payload"],
+                    datetime.fromtimestamp(entry["generated_at"], timezone.utc).replace(tzinfo=None),
+                )
+        except Exception as e:
+            # The in-memory copy is already in place; only cold workers lose out
+            logger.warning(f"Could not persist report for '{province_name}': {e}")
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._counters, "in_flight": len(self._in_flight), "size": self.backend.stats()["size"]}
+
+
+_report_cache: Optional[ProvinceReportCache] = None
+_report_cache_lock = threading.Lock()
+
+
+def get_report_cache() -> ProvinceReportCache:
+    """Per-process report cache shared by the AI routes and the pre-warm scheduler."""
+    global _report_cache
+    if _report_cache is None:
+        with _report_cache_lock:
+            if _report_cache is None:
+                settings = get_settings()
+                _report_cache = ProvinceReportCache(
+                    InMemoryTTLCache(
+                        max_entries=settings.AI_REPORT_CACHE_MAX_ENTRIES,
+                        ttl_seconds=settings.AI_REPORT_CACHE_TTL_SECONDS + settings.AI_REPORT_CACHE_STALE_SECONDS,
+                    ),
+                    ttl_seconds=settings.AI_REPORT_CACHE_TTL_SECONDS,
+                    stale_seconds=settings.AI_REPORT_CACHE_STALE_SECONDS,
+                    persist=settings.AI_REPORT_CACHE_PERSIST,
+                    demand=ProvinceDemandTracker(half_life_seconds=settings.AI_PREWARM_DEMAND_HALF_LIFE_SECONDS),
+                )
+    return _report_cache
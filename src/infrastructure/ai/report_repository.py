@@ -0,0 +1,73 @@
+import json
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.infrastructure.ai.models import ProvinceReport, ProvinceReportLease
+
+
+class ProvinceReportRepository:
+    def get_report(self, db: Session, province_key: str, report_date: date) -> Optional[Tuple[Dict[str, Any], datetime]]:
+        row = db.query(ProvinceReport).filter(
+            ProvinceReport.province_key == province_key,
+            ProvinceReport.report_date == report_date
+        ).first()
+        if row is None:
+            return None
+        return json.loads(row.payload), row.generated_at
+
+    def save_report(
+        self,
+        db: Session,
+        province_key: str,
+        report_date: date,
+        province_name: str,
+        payload: Dict[str, Any],
+        generated_at: datetime
+    ) -> None:
+        row = db.query(ProvinceReport).filter(
+            ProvinceReport.province_key == province_key,
+            ProvinceReport.report_date == report_date
+        ).first()
+        if row is None:
+            row = ProvinceReport(province_key=province_key, report_date=report_date)
+            db.add(row)
+        row.province_name = province_name
+        row.payload = json.dumps(payload, ensure_ascii=False)
+        row.generated_at = generated_at
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another worker stored the same (province, date) first; its report is as good
+            db.rollback()
+
+    def claim_refresh(self, db: Session, province_key: str, report_date: date, lease_seconds: float) -> bool:
+        """
+        Takes the refresh lease of a (province, date) report for `lease_seconds`. False while
+        another worker holds it, so only one of them spends Gemini calls on the report.
+        """
+        now = datetime.utcnow()
+        leased_until = now + timedelta(seconds=lease_seconds)
+        claimed = db.query(ProvinceReportLease).filter(
+            ProvinceReportLease.province_key == province_key,
+            ProvinceReportLease.report_date == report_date,
+            ProvinceReportLease.leased_until <= now
+        ).update({ProvinceReportLease.leased_until: leased_until}, synchronize_session=False)
+        if claimed:
+            db.commit()
+            return True
+        # First claim of the day for this province; earlier days' leases are no longer needed
+        db.query(ProvinceReportLease).filter(
+            ProvinceReportLease.province_key == province_key,
+            ProvinceReportLease.report_date < report_date
+        ).delete(synchronize_session=False)
+        db.add(ProvinceReportLease(province_key=province_key, report_date=report_date, leased_until=leased_until))
+        try:
+            db.commit()
+            return True
+        except IntegrityError:
+            # The row exists and its lease has not expired: another worker holds it
+            db.rollback()
+            return False
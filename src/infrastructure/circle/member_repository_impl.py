@@ -3,6 +3,10 @@ from src.infrastructure.circle.member_models import CircleMember
 from src.infrastructure.user.models import User
 from src.domain.circle.member_repository_interface import ICircleMemberRepository
 from src.domain.circle.member_entities import CircleMember as CircleMemberEntity
+from src.infrastructure.safety_network.resolver_impl import (
+    invalidate_circle_safety_networks,
+    invalidate_safety_networks,
+)
 from src.application.circle.member_dto import CircleMemberCreate, CircleMemberUpdate
 from typing import List, Optional
 from datetime import datetime
@@ -17,6 +21,12 @@ class CircleMemberRepository(ICircleMemberRepository):
     def get_circle_members_by_circle(self, db: Session, circle_id: int) -> List[CircleMemberEntity]:
         db_circle_members = db.query(CircleMember).filter(CircleMember.circle_id == circle_id).all()
         return [CircleMemberEntity.model_validate(cm.__dict__) for cm in db_circle_members]
+
+    def get_members_by_circle_ids(self, db: Session, circle_ids: List[int]) -> List[CircleMemberEntity]:
+        if not circle_ids:
+            return []
+        db_circle_members = db.query(CircleMember).filter(CircleMember.circle_id.in_(set(circle_ids))).all()
+        return [CircleMemberEntity.model_validate(cm.__dict__) for cm in db_circle_members]
     
     def get_circle_members_as_users(self, db: Session, circle_id: int):
         users = db.query(User)\
@@ -38,22 +48,30 @@ class CircleMemberRepository(ICircleMemberRepository):
         db.add(db_circle_member)
         db.commit()
         db.refresh(db_circle_member)
+        invalidate_circle_safety_networks(db, [db_circle_member.circle_id])
         return CircleMemberEntity.model_validate(db_circle_member.__dict__)
 
     def update_circle_member(self, db: Session, circle_member_id: int, circle_member_data: CircleMemberEntity) -> Optional[CircleMemberEntity]:
         db_circle_member = db.query(CircleMember).filter(CircleMember.id == circle_member_id).first()
         if db_circle_member:
+            previous = (db_circle_member.circle_id, db_circle_member.member_id)
             for key, value in circle_member_data.model_dump(exclude_unset=True).items():
                 setattr(db_circle_member, key, value)
             db.commit()
             db.refresh(db_circle_member)
+            if previous != (db_circle_member.circle_id, db_circle_member.member_id):
+                invalidate_circle_safety_networks(db, [previous[0], db_circle_member.circle_id])
+                invalidate_safety_networks([previous[1]])
             return CircleMemberEntity.model_validate(db_circle_member.__dict__)
         return None
 
     def delete_circle_member(self, db: Session, circle_member_id: int) -> bool:
         db_circle_member = db.query(CircleMember).filter(CircleMember.id == circle_member_id).first()
         if db_circle_member:
+            circle_id, member_id = db_circle_member.circle_id, db_circle_member.member_id
             db.delete(db_circle_member)
             db.commit()
+            invalidate_circle_safety_networks(db, [circle_id])
+            invalidate_safety_networks([member_id])
             return True
         return False
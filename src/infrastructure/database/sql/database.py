@@ -1,4 +1,6 @@
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from src.config.settings import get_settings
@@ -37,6 +39,34 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# Driver async tương ứng với driver sync trong DATABASE_URL
+ASYNC_DRIVERS = {
+    "mysql": "aiomysql",
+    "sqlite": "aiosqlite",
+}
+
+def to_async_database_url(url: str) -> str:
+    """mysql+mysqlconnector://... -> mysql+aiomysql://..., sqlite:///... -> sqlite+aiosqlite:///..."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}'. Set ASYNC_DATABASE_URL explicitly.")
+    return parsed.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+ASYNC_SQLALCHEMY_DATABASE_URL = settings.ASYNC_DATABASE_URL or to_async_database_url(SQLALCHEMY_DATABASE_URL)
+
+# aiosqlite dùng NullPool (chỉ cho dev/test), nên chỉ cấu hình pool cho MySQL
+async_pool_options = {} if make_url(ASYNC_SQLALCHEMY_DATABASE_URL).get_backend_name() == "sqlite" else dict(
+    pool_size=15,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=1800
+)
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, **async_pool_options)
+# expire_on_commit=False: ORM objects returned from run_sync stay readable after the commit
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, class_=AsyncSession, autocommit=False, autoflush=False, expire_on_commit=False)
+
 def get_db():
     db = SessionLocal()
     try:
@@ -44,6 +74,15 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    """
+    AsyncSession per request. Existing repositories and use cases take a sync Session, so
+    routes call them through `await db.run_sync(use_case.method, *args)`: the code runs
+    unchanged on the session's sync facade while every query is awaited on the event loop.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
 def create_db_and_tables():
     create_database_if_not_exists() # Ensure database exists before creating tables
     Base.metadata.create_all(bind=engine)
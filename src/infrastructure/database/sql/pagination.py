@@ -0,0 +1,40 @@
+from typing import List, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Query, Session
+
+from src.domain.pagination.entities import PageRequest
+
+
+def before_cursor(db: Session, model, cursor_id: int, inclusive: bool = False) -> List:
+    """
+    Filters selecting the rows after `cursor_id` in newest-first (created_at, id) order,
+    i.e. the older ones; with `inclusive` the cursor row itself too.
+    """
+    cursor_created_at = db.query(model.created_at).filter(model.id == cursor_id).scalar()
+    id_bound = model.id <= cursor_id if inclusive else model.id < cursor_id
+    if cursor_created_at is None:
+        # The cursor row is gone (or has no timestamp): ids still give a stable order
+        return [id_bound]
+    # Same as `created_at < c OR (created_at = c AND id < cursor)`, written so the
+    # leading `created_at <= c` is usable as the index range bound
+    return [
+        model.created_at <= cursor_created_at,
+        or_(model.created_at < cursor_created_at, id_bound),
+    ]
+
+
+def keyset_page(db: Session, query: Query, model, page: Optional[PageRequest] = None) -> Query:
+    """
+    Newest-first page of `query` ordered by (created_at, id), seeking past the `after` row
+    instead of using OFFSET. With an (owner, created_at, id) index every page is a single
+    index range scan, however deep it is.
+    """
+    page = page or PageRequest()
+    if page.since is not None:
+        query = query.filter(model.created_at >= page.since)
+    if page.until is not None:
+        query = query.filter(model.created_at < page.until)
+    if page.after is not None:
+        query = query.filter(*before_cursor(db, model, page.after))
+    return query.order_by(model.created_at.desc(), model.id.desc()).limit(page.limit)
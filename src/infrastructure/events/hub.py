@@ -0,0 +1,151 @@
+import asyncio
+import itertools
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from src.application.events.event_interfaces import IEventPublisher
+from src.config.settings import get_settings
+from src.infrastructure.geo.spatial_index import GridSpatialIndex
+
+
+class Subscription:
+    """One open stream connection. Events are queued on the event loop that owns the connection."""
+
+    def __init__(self, subscription_id: int, user_id: int, loop: asyncio.AbstractEventLoop, max_queue_size: int):
+        self.id = subscription_id
+        self.user_id = user_id
+        self.loop = loop
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=max_queue_size)
+        self.latitude: Optional[float] = None
+        self.longitude: Optional[float] = None
+        self.radius_km: Optional[float] = None
+        self.dropped = 0
+
+    def _deliver(self, event: Dict[str, Any]) -> None:
+        # Runs on self.loop; a slow client loses its oldest events instead of growing without bound
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def get(self) -> Dict[str, Any]:
+        return await self.queue.get()
+
+
+class InProcessEventHub(IEventPublisher):
+    """
+    Pub/sub between publishers (use cases, job workers) and the stream connections of this worker.
+
+    Subscriptions are looked up by user id for network events and through a grid index of
+    their last known location for nearby events. Publishing is thread-safe; delivery is
+    handed to each subscriber's event loop with call_soon_threadsafe.
+    """
+
+    def __init__(self, max_queue_size: int = 100, max_radius_km: float = 50.0, cell_size_deg: float = 0.05):
+        self.max_queue_size = max_queue_size
+        self.max_radius_km = max_radius_km
+        self._subscriptions: Dict[int, Subscription] = {}
+        self._by_user: Dict[int, Set[int]] = {}
+        self._locations = GridSpatialIndex(cell_size_deg)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._published = 0
+        self._delivered = 0
+
+    def subscribe(self, user_id: int) -> Subscription:
+        """Must be called from the event loop that will consume the subscription."""
+        subscription = Subscription(next(self._ids), user_id, asyncio.get_running_loop(), self.max_queue_size)
+        with self._lock:
+            self._subscriptions[subscription.id] = subscription
+            self._by_user.setdefault(user_id, set()).add(subscription.id)
+        return subscription
+
+    def update_location(self, subscription: Subscription, latitude: float, longitude: float, radius_km: float) -> None:
+        if radius_km <= 0:
+            raise ValueError("Radius must be greater than 0.")
+        with self._lock:
+            if subscription.id not in self._subscriptions:
+                return
+            subscription.latitude = latitude
+            subscription.longitude = longitude
+            subscription.radius_km = min(radius_km, self.max_radius_km)
+            self._locations.upsert(subscription.id, latitude, longitude)
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if self._subscriptions.pop(subscription.id, None) is None:
+                return
+            user_subscriptions = self._by_user.get(subscription.user_id)
+            if user_subscriptions is not None:
+                user_subscriptions.discard(subscription.id)
+                if not user_subscriptions:
+                    del self._by_user[subscription.user_id]
+            self._locations.remove(subscription.id)
+
+    def publish_to_users(self, user_ids: Iterable[int], event: Dict[str, Any]) -> int:
+        with self._lock:
+            targets = [
+                self._subscriptions[subscription_id]
+                for user_id in set(user_ids)
+                for subscription_id in self._by_user.get(user_id, ())
+            ]
+        return self._dispatch(targets, event)
+
+    def publish_nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        event: Dict[str, Any],
+        exclude_user_ids: Iterable[int] = ()
+    ) -> int:
+        excluded = set(exclude_user_ids)
+        targets: List[Subscription] = []
+        with self._lock:
+            for subscription_id, distance in self._locations.query_radius(latitude, longitude, self.max_radius_km):
+                subscription = self._subscriptions[subscription_id]
+                if distance <= subscription.radius_km and subscription.user_id not in excluded:
+                    targets.append(subscription)
+        return self._dispatch(targets, event)
+
+    def _dispatch(self, targets: List[Subscription], event: Dict[str, Any]) -> int:
+        delivered = 0
+        for subscription in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._deliver, event)
+                delivered += 1
+            except RuntimeError:
+                # The connection's loop is already closed; it will unsubscribe on its way out
+                continue
+        with self._lock:
+            self._published += 1
+            self._delivered += delivered
+        return delivered
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "connections": len(self._subscriptions),
+                "users": len(self._by_user),
+                "with_location": len(self._locations),
+                "published": self._published,
+                "delivered": self._delivered,
+                "dropped": sum(s.dropped for s in self._subscriptions.values()),
+            }
+
+
+_event_hub: Optional[InProcessEventHub] = None
+_event_hub_lock = threading.Lock()
+
+
+def get_event_hub() -> InProcessEventHub:
+    """Per-process hub; a broker-backed IEventPublisher can replace it for multi-worker fan-out."""
+    global _event_hub
+    if _event_hub is None:
+        with _event_hub_lock:
+            if _event_hub is None:
+                settings = get_settings()
+                _event_hub = InProcessEventHub(
+                    max_queue_size=settings.STREAM_QUEUE_SIZE,
+                    max_radius_km=settings.STREAM_MAX_RADIUS_KM,
+                )
+    return _event_hub
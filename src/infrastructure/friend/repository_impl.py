@@ -4,6 +4,7 @@ from src.infrastructure.user.models import User as UserModel
 from src.domain.friend.repository_interface import IFriendRepository
 from src.domain.friend.entities import FriendRequest as FriendRequestEntity, Friendship as FriendshipEntity
 from src.domain.user.entities import User as UserEntity
+from src.infrastructure.safety_network.resolver_impl import invalidate_safety_networks
 
 from typing import Optional, List
 from datetime import datetime
@@ -54,6 +55,7 @@ class FriendRepository(IFriendRepository):
         db.add(db_friendship)
         db.commit()
         db.refresh(db_friendship)
+        invalidate_safety_networks([user_id, friend_id])
         return FriendshipEntity.model_validate(db_friendship.__dict__)
 
     def get_friendship(self, db: Session, user_id: int, friend_id: int) -> Optional[FriendshipEntity]:
@@ -70,6 +72,7 @@ class FriendRepository(IFriendRepository):
         if db_friendship:
             db.delete(db_friendship)
             db.commit()
+            invalidate_safety_networks([db_friendship.user_id, db_friendship.friend_id])
             return FriendshipEntity.model_validate(db_friendship.__dict__)
         return None
 
@@ -81,6 +84,7 @@ class FriendRepository(IFriendRepository):
         if db_friendship:
             db.delete(db_friendship)
             db.commit()
+            invalidate_safety_networks([user_id, friend_id])
             return True
         return False
 
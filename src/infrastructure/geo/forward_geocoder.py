@@ -0,0 +1,186 @@
+import asyncio
+import hashlib
+import re
+import threading
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from src.application.cache.cache_interfaces import ICacheBackend
+from src.application.geo.geocoder_interfaces import Coordinates, IForwardGeocoder
+from src.config.settings import get_settings
+from src.infrastructure.cache.memory_cache import InMemoryTTLCache
+from src.infrastructure.database.sql.database import AsyncSessionLocal
+from src.infrastructure.geo.geocode_repository import GeocodeCacheRepository
+from src.shared.utils.logger import get_logger
+from src.shared.utils.rate_limiter import AsyncRateLimiter
+
+logger = get_logger(__name__)
+
+_NOT_FOUND = "not_found" # Cached in memory for names Geoapify could not place
+
+
+def normalize_location_name(location_name: str) -> str:
+    """'Quận 1,  TP.HCM.' and 'quận 1, tp.hcm' map to the same cache entry; accents are kept."""
+    text = unicodedata.normalize("NFC", location_name).casefold()
+    return re.sub(r"\s+", " ", text).strip(" ,.;")
+
+
+class GeoapifyForwardGeocoder(IForwardGeocoder):
+    """
+    Location name -> (lat, lon) through Geoapify's search API, behind a two-tier cache.
+
+    Names are normalized and looked up in an in-memory LRU, then (with `persist`) in the
+    `geocode_cache` table. Only the remaining misses go to Geoapify: concurrently over one
+    pooled AsyncClient, at most `max_concurrency` at a time and `rate_per_second` per
+    second, so a batch takes about as long as its slowest lookup. Names Geoapify cannot
+    place are remembered in memory only, for `negative_ttl_seconds`.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        backend: ICacheBackend,
+        base_url: str = "https://api.geoapify.com",
+        persist: bool = True,
+        repository: Optional[GeocodeCacheRepository] = None,
+        max_concurrency: int = 8,
+        rate_per_second: float = 5.0,
+        timeout_seconds: float = 8.0,
+        negative_ttl_seconds: float = 3600,
+    ):
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be greater than 0.")
+        self.api_key = api_key
+        self.backend = backend
+        self.search_url = f"{base_url.rstrip('/')}/v1/geocode/search"
+        self.persist = persist
+        self.repository = repository or GeocodeCacheRepository()
+        self.max_concurrency = max_concurrency
+        self.timeout_seconds = timeout_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_limiter = AsyncRateLimiter(rate_per_second, burst=max_concurrency)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._counters = {"memory_hits": 0, "db_hits": 0, "lookups": 0, "not_found": 0, "errors": 0}
+
+    @staticmethod
+    def cache_key(location_name: str) -> str:
+        return hashlib.sha256(normalize_location_name(location_name).encode("utf-8")).hexdigest()
+
+    async def geocode_many(self, location_names: Iterable[str]) -> Dict[str, Optional[Coordinates]]:
+        names_by_key: Dict[str, List[str]] = {}
+        for name in location_names:
+            names_by_key.setdefault(self.cache_key(name), []).append(name)
+
+        found: Dict[str, Optional[Coordinates]] = {}
+        for key in names_by_key:
+            cached = self.backend.get(key)
+            if cached is not None:
+                self._counters["memory_hits"] += 1
+                found[key] = None if cached == _NOT_FOUND else tuple(cached)
+
+        missing = [key for key in names_by_key if key not in found]
+        if missing and self.persist:
+            for key, coordinates in (await self._load(missing)).items():
+                self._counters["db_hits"] += 1
+                self.backend.set(key, coordinates)
+                found[key] = coordinates
+            missing = [key for key in missing if key not in found]
+
+        if missing:
+            results = await asyncio.gather(
+                *(self._lookup(names_by_key[key][0]) for key in missing), return_exceptions=True
+            )
+            new_entries: List[Tuple[str, str, float, float]] = []
+            for key, result in zip(missing, results):
+                if isinstance(result, BaseException):
+                    # Not cached: a later batch retries the name
+                    self._counters["errors"] += 1
+                    logger.warning(f"Geocoding '{names_by_key[key][0]}' failed: {result}")
+                    found[key] = None
+                elif result is None:
+                    self._counters["not_found"] += 1
+                    self.backend.set(key, _NOT_FOUND, ttl_seconds=self.negative_ttl_seconds)
+                    found[key] = None
+                else:
+                    self.backend.set(key, result)
+                    found[key] = result
+                    new_entries.append((key, normalize_location_name(names_by_key[key][0]), *result))
+            if new_entries and self.persist:
+                await self._save(new_entries)
+
+        return {name: found[key] for key, names in names_by_key.items() for name in names}
+
+    async def _lookup(self, location_name: str) -> Optional[Coordinates]:
+        async with self._semaphore:
+            await self._rate_limiter.acquire()
+            self._counters["lookups"] += 1
+            params = {"text": location_name, "format": "json", "apiKey": self.api_key, "limit": 1}
+            r = await self._get_client().get(self.search_url, params=params)
+            r.raise_for_status()
+            results = r.json().get("results") or []
+            if not results:
+                return None
+            return float(results[0]["lat"]), float(results[0]["lon"])
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # One keep-alive pool per worker instead of a TLS handshake per lookup
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout_seconds,
+                limits=httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _load(self, keys: List[str]) -> Dict[str, Coordinates]:
+        try:
+            async with AsyncSessionLocal() as db:
+                return await db.run_sync(self.repository.get_many, keys)
+        except Exception as e:
+            logger.warning(f"Could not read geocode cache: {e}")
+            return {}
+
+    async def _save(self, entries: List[Tuple[str, str, float, float]]) -> None:
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.run_sync(self.repository.save_many, entries)
+        except Exception as e:
+            # The in-memory copies are already in place; only other workers lose out
+            logger.warning(f"Could not persist geocode cache entries: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._counters, "size": self.backend.stats()["size"]}
+
+
+_forward_geocoder: Optional[GeoapifyForwardGeocoder] = None
+_forward_geocoder_lock = threading.Lock()
+
+
+def get_forward_geocoder() -> GeoapifyForwardGeocoder:
+    """Per-process geocoder, so the HTTP pool, rate limit and LRU cover every caller of the worker."""
+    global _forward_geocoder
+    if _forward_geocoder is None:
+        with _forward_geocoder_lock:
+            if _forward_geocoder is None:
+                settings = get_settings()
+                _forward_geocoder = GeoapifyForwardGeocoder(
+                    api_key=settings.GEOAPIFY_KEY,
+                    backend=InMemoryTTLCache(
+                        max_entries=settings.GEOCODE_CACHE_MAX_ENTRIES,
+                        ttl_seconds=settings.GEOCODE_CACHE_TTL_SECONDS,
+                    ),
+                    base_url=settings.GEOAPIFY_BASE_URL,
+                    persist=settings.GEOCODE_CACHE_PERSIST,
+                    max_concurrency=settings.GEOCODE_MAX_CONCURRENCY,
+                    rate_per_second=settings.GEOCODE_RATE_PER_SECOND,
+                    timeout_seconds=settings.GEOCODE_TIMEOUT_SECONDS,
+                    negative_ttl_seconds=settings.GEOCODE_NEGATIVE_TTL_SECONDS,
+                )
+    return _forward_geocoder
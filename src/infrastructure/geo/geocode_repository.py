@@ -0,0 +1,31 @@
+from typing import Dict, Iterable, List, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.infrastructure.geo.models import GeocodeCacheEntry
+
+
+class GeocodeCacheRepository:
+    def get_many(self, db: Session, location_hashes: Iterable[str]) -> Dict[str, Tuple[float, float]]:
+        location_hashes = list(location_hashes)
+        if not location_hashes:
+            return {}
+        rows = db.query(GeocodeCacheEntry).filter(GeocodeCacheEntry.location_hash.in_(location_hashes)).all()
+        return {row.location_hash: (row.latitude, row.longitude) for row in rows}
+
+    def save_many(self, db: Session, entries: List[Tuple[str, str, float, float]]) -> None:
+        """Insert (location_hash, location_name, latitude, longitude) rows not stored yet."""
+        if not entries:
+            return
+        existing = set(self.get_many(db, [entry[0] for entry in entries]))
+        db.add_all([
+            GeocodeCacheEntry(location_hash=location_hash, location_name=location_name[:500], latitude=latitude, longitude=longitude)
+            for location_hash, location_name, latitude, longitude in entries
+            if location_hash not in existing
+        ])
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another worker stored one of these names first; the next miss will read its row
+            db.rollback()
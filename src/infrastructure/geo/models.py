@@ -0,0 +1,16 @@
+from sqlalchemy import Column, DateTime, Float, Integer, String, UniqueConstraint
+from sqlalchemy.sql import func
+from src.infrastructure.database.sql.database import Base
+
+class GeocodeCacheEntry(Base):
+    __tablename__ = "geocode_cache"
+    __table_args__ = (
+        UniqueConstraint("location_hash", name="uq_geocode_cache_location_hash"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    location_hash = Column(String(64), nullable=False) # sha256 của tên địa điểm đã chuẩn hoá
+    location_name = Column(String(500), nullable=False) # Tên đã chuẩn hoá
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
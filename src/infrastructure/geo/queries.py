@@ -0,0 +1,116 @@
+from typing import List, Tuple
+
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from src.config.settings import get_settings
+from src.infrastructure.geo.spatial_index import (
+    EARTH_RADIUS_KM,
+    fetch_rows_by_ids,
+    get_spatial_index,
+    haversine_km,
+    radius_km_to_box,
+)
+
+
+def distance_km_expr(model, latitude: float, longitude: float):
+    """SQL Haversine distance (km) between the model's lat/lon columns and a point."""
+    lat_rad = func.radians(latitude)
+    lon_rad = func.radians(longitude)
+    db_lat_rad = func.radians(model.latitude)
+    db_lon_rad = func.radians(model.longitude)
+
+    dlon = db_lon_rad - lon_rad
+    dlat = db_lat_rad - lat_rad
+
+    # func.power(x, 2) instead of x ** 2 to stay portable across dialects
+    a = func.power(func.sin(dlat / 2), 2) + \
+        func.cos(lat_rad) * func.cos(db_lat_rad) * func.power(func.sin(dlon / 2), 2)
+    c = 2 * func.atan2(func.sqrt(a), func.sqrt(1 - a))
+    return EARTH_RADIUS_KM * c
+
+
+def bounding_box_filter(model, lat_min: float, lat_max: float, lon_min: float, lon_max: float):
+    """Range predicates that can use the (latitude, longitude) index."""
+    return (
+        model.latitude.between(lat_min, lat_max),
+        model.longitude.between(lon_min, lon_max),
+    )
+
+
+def select_within_radius_km(db: Session, model, latitude: float, longitude: float, radius_km: float, *criteria):
+    """
+    Bounding-box prefilter on the indexed columns, then the exact Haversine check.
+    Yields (row, distance_km) ordered by distance.
+    """
+    distance = distance_km_expr(model, latitude, longitude).label("distance_km")
+    return (
+        db.query(model, distance)
+        .filter(*bounding_box_filter(model, *radius_km_to_box(latitude, longitude, radius_km)))
+        .filter(distance <= radius_km, *criteria)
+        .order_by(distance)
+    )
+
+
+def select_within_box(db: Session, model, latitude: float, longitude: float, radius_deg: float, *criteria):
+    """Rows inside the `lat/lon ± radius_deg` box, using the (latitude, longitude) index."""
+    return db.query(model).filter(
+        *bounding_box_filter(
+            model,
+            latitude - radius_deg,
+            latitude + radius_deg,
+            longitude - radius_deg,
+            longitude + radius_deg,
+        ),
+        *criteria,
+    )
+
+
+def find_within_radius_km(
+    db: Session,
+    model,
+    latitude: float,
+    longitude: float,
+    radius_km: float,
+    *criteria
+) -> List[Tuple[object, float]]:
+    """(row, distance_km) for rows within radius_km of the point, nearest first."""
+    # The index answers None until its first background build is done; SQL serves until then
+    hits = get_spatial_index(model).query_radius(db, latitude, longitude, radius_km) if get_settings().GEO_INDEX_ENABLED else None
+    if hits is not None:
+        distances = dict(hits)
+        rows = fetch_rows_by_ids(db, model, list(distances), *criteria)
+        return sorted(((row, distances[row.id]) for row in rows), key=lambda pair: pair[1])
+
+    return [(row, distance) for row, distance in select_within_radius_km(db, model, latitude, longitude, radius_km, *criteria)]
+
+
+def find_within_box(
+    db: Session,
+    model,
+    latitude: float,
+    longitude: float,
+    radius_deg: float,
+    *criteria
+) -> List[Tuple[object, float]]:
+    """
+    (row, distance_km) for rows inside the `lat/lon ± radius_deg` box, nearest first.
+    Kept for the endpoints whose `radius` is a degree offset rather than kilometers.
+    """
+    ids = None
+    if get_settings().GEO_INDEX_ENABLED:
+        ids = get_spatial_index(model).query_box(
+            db,
+            latitude - radius_deg,
+            latitude + radius_deg,
+            longitude - radius_deg,
+            longitude + radius_deg,
+        )
+    if ids is not None:
+        rows = fetch_rows_by_ids(db, model, ids, *criteria)
+    else:
+        rows = select_within_box(db, model, latitude, longitude, radius_deg, *criteria).all()
+
+    pairs = [(row, haversine_km(latitude, longitude, row.latitude, row.longitude)) for row in rows]
+    pairs.sort(key=lambda pair: pair[1])
+    return pairs
@@ -0,0 +1,302 @@
+import json
+import math
+import os
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from src.config.settings import get_settings
+from src.shared.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BOUNDARIES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "vn_provinces.geojson")
+
+# GeoJSON order: a ring is a list of (lon, lat); a polygon is an outer ring plus holes
+Ring = Sequence[Sequence[float]]
+Polygon = Sequence[Ring]
+Edge = Tuple[float, float, float, float] # x1, y1, x2, y2
+# Per candidate province: (province, whether the cell center is inside it, edges near the cell)
+BoundaryCell = Tuple[Tuple[int, bool, Tuple[Edge, ...]], ...]
+
+
+class ProvinceLookup(NamedTuple):
+    province_name: Optional[str]
+    # Near a border (or inside overlapping/uncovered slivers of the simplified boundaries):
+    # province_name is only a best guess and should be confirmed with an online geocoder
+    ambiguous: bool
+
+
+class ProvinceReverseGeocoder:
+    """
+    Point -> province from boundary polygons, without network calls.
+
+    Build time: the bounding box of all provinces is cut into a grid. Every cell away from
+    a boundary is resolved once, with a scanline, to the province it lies in (or to nothing).
+    Cells a boundary passes through (widened by `border_tolerance_deg`) keep, per candidate
+    province, the few edges near the cell and whether the cell center is inside it.
+
+    Lookup: most points land in a resolved cell and cost one list access. In a boundary cell
+    the point is inside a province when the segment from the cell center to the point
+    crosses its edges an even number of times from an inside center (odd from an outside
+    one); points within the tolerance of an edge are flagged ambiguous.
+    """
+
+    def __init__(
+        self,
+        provinces: Sequence[Tuple[str, Sequence[Polygon]]],
+        cell_size_deg: float = 0.05,
+        border_tolerance_deg: float = 0.005,
+    ):
+        if cell_size_deg <= 0:
+            raise ValueError("cell_size_deg must be greater than 0.")
+        if not provinces:
+            raise ValueError("At least one province is required.")
+        self.cell_size_deg = cell_size_deg
+        self.border_tolerance_deg = border_tolerance_deg
+        self.names: List[str] = [name for name, _ in provinces]
+
+        province_edges: List[List[Edge]] = []
+        for _, polygons in provinces:
+            edges: List[Edge] = []
+            for polygon in polygons:
+                for ring in polygon:
+                    for (x1, y1), (x2, y2) in zip(ring, list(ring[1:]) + [ring[0]]):
+                        if (x1, y1) != (x2, y2):
+                            edges.append((float(x1), float(y1), float(x2), float(y2)))
+            province_edges.append(edges)
+
+        all_x = [x for edges in province_edges for e in edges for x in (e[0], e[2])]
+        all_y = [y for edges in province_edges for e in edges for y in (e[1], e[3])]
+        pad = border_tolerance_deg + cell_size_deg
+        self.min_x, self.min_y = min(all_x) - pad, min(all_y) - pad
+        self.cols = int(math.ceil((max(all_x) + pad - self.min_x) / cell_size_deg))
+        self.rows = int(math.ceil((max(all_y) + pad - self.min_y) / cell_size_deg))
+
+        self._cells = self._build_cells(province_edges, self._build_row_edges(province_edges))
+
+    def _build_row_edges(self, province_edges: List[List[Edge]]) -> List[Dict[int, List[Edge]]]:
+        """Per grid row, the edges of each province that reach it (for the build-time scanlines)."""
+        row_edges: List[Dict[int, List[Edge]]] = [{} for _ in range(self.rows)]
+        tolerance = self.border_tolerance_deg
+        for province, edges in enumerate(province_edges):
+            for edge in edges:
+                y_low, y_high = min(edge[1], edge[3]) - tolerance, max(edge[1], edge[3]) + tolerance
+                for row in range(self._row_of(y_low), self._row_of(y_high) + 1):
+                    row_edges[row].setdefault(province, []).append(edge)
+        return row_edges
+
+    def _build_cells(self, province_edges: List[List[Edge]], row_edges: List[Dict[int, List[Edge]]]) -> List[Union[int, BoundaryCell]]:
+        tolerance = self.border_tolerance_deg
+        boundary: Dict[int, Dict[int, List[Edge]]] = {}
+        for province, edges in enumerate(province_edges):
+            for edge in edges:
+                x1, y1, x2, y2 = edge
+                col_range = range(self._col_of(min(x1, x2) - tolerance), self._col_of(max(x1, x2) + tolerance) + 1)
+                for row in range(self._row_of(min(y1, y2) - tolerance), self._row_of(max(y1, y2) + tolerance) + 1):
+                    for col in col_range:
+                        boundary.setdefault(row * self.cols + col, {}).setdefault(province, []).append(edge)
+
+        cells: List[Union[int, BoundaryCell]] = [-1] * (self.rows * self.cols)
+        for row in range(self.rows):
+            y = self.min_y + (row + 0.5) * self.cell_size_deg
+            for province, edges in row_edges[row].items():
+                crossings = sorted(
+                    x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+                    for x1, y1, x2, y2 in edges
+                    if (y1 > y) != (y2 > y)
+                )
+                # Even-odd: the centers between crossing pairs are inside the province
+                for x_in, x_out in zip(crossings[::2], crossings[1::2]):
+                    first = max(0, int(math.ceil((x_in - self.min_x) / self.cell_size_deg - 0.5)))
+                    last = min(self.cols - 1, int(math.floor((x_out - self.min_x) / self.cell_size_deg - 0.5)))
+                    for col in range(first, last + 1):
+                        index = row * self.cols + col
+                        if index in boundary:
+                            boundary[index].setdefault(province, [])
+                        else:
+                            cells[index] = province
+        for index, candidates in boundary.items():
+            row, col = divmod(index, self.cols)
+            center_x = self.min_x + (col + 0.5) * self.cell_size_deg
+            center_y = self.min_y + (row + 0.5) * self.cell_size_deg
+            cells[index] = tuple(
+                (province, _contains(row_edges[row].get(province, ()), center_x, center_y), tuple(edges))
+                for province, edges in sorted(candidates.items())
+            )
+        return cells
+
+    def _row_of(self, y: float) -> int:
+        return min(self.rows - 1, max(0, int((y - self.min_y) // self.cell_size_deg)))
+
+    def _col_of(self, x: float) -> int:
+        return min(self.cols - 1, max(0, int((x - self.min_x) // self.cell_size_deg)))
+
+    def lookup(self, latitude: float, longitude: float) -> ProvinceLookup:
+        row = int((latitude - self.min_y) // self.cell_size_deg)
+        col = int((longitude - self.min_x) // self.cell_size_deg)
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return ProvinceLookup(None, False)
+        cell = self._cells[row * self.cols + col]
+        if cell.__class__ is int:
+            return ProvinceLookup(self.names[cell] if cell >= 0 else None, False)
+        return self._resolve_boundary(cell, row, col, longitude, latitude)
+
+    def lookup_many(self, points: Iterable[Tuple[float, float]]) -> List[ProvinceLookup]:
+        """Batch form of lookup for (latitude, longitude) pairs, with the hot path inlined."""
+        cells, names, cols, rows = self._cells, self.names, self.cols, self.rows
+        min_x, min_y, size = self.min_x, self.min_y, self.cell_size_deg
+        outside = ProvinceLookup(None, False)
+        resolved = [ProvinceLookup(name, False) for name in names]
+        results: List[ProvinceLookup] = []
+        append = results.append
+        for latitude, longitude in points:
+            row = int((latitude - min_y) // size)
+            col = int((longitude - min_x) // size)
+            if not (0 <= row < rows and 0 <= col < cols):
+                append(outside)
+                continue
+            cell = cells[row * cols + col]
+            if cell.__class__ is int:
+                append(resolved[cell] if cell >= 0 else outside)
+            else:
+                append(self._resolve_boundary(cell, row, col, longitude, latitude))
+        return results
+
+    def _resolve_boundary(self, cell: BoundaryCell, row: int, col: int, x: float, y: float) -> ProvinceLookup:
+        # The segment from the cell center to the point stays inside the cell, so only the
+        # cell's own edges can cross it: each crossing flips the center's inside/outside state
+        center_x = self.min_x + (col + 0.5) * self.cell_size_deg
+        center_y = self.min_y + (row + 0.5) * self.cell_size_deg
+        limit = self.border_tolerance_deg ** 2
+        inside: List[int] = []
+        near_border = False
+        for province, center_inside, edges in cell:
+            state = center_inside
+            for edge in edges:
+                if _crosses(edge, center_x, center_y, x, y):
+                    state = not state
+                if not near_border and _segment_distance_sq(edge, x, y) <= limit:
+                    near_border = True
+            if state:
+                inside.append(province)
+        if len(inside) == 1:
+            return ProvinceLookup(self.names[inside[0]], near_border)
+        if inside:
+            # Overlapping simplified boundaries
+            return ProvinceLookup(self.names[inside[0]], True)
+        return ProvinceLookup(None, near_border)
+
+    def stats(self) -> Dict[str, int]:
+        boundary = sum(1 for cell in self._cells if cell.__class__ is not int)
+        return {
+            "provinces": len(self.names),
+            "cells": len(self._cells),
+            "boundary_cells": boundary,
+            "resolved_cells": len(self._cells) - boundary,
+        }
+
+
+def _contains(edges: Iterable[Edge], x: float, y: float) -> bool:
+    inside = False
+    for x1, y1, x2, y2 in edges:
+        if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+            inside = not inside
+    return inside
+
+
+def _crosses(edge: Edge, x1: float, y1: float, x2: float, y2: float) -> bool:
+    """Whether the segment (x1, y1)-(x2, y2) crosses the edge."""
+    ax, ay, bx, by = edge
+    side_1 = (bx - ax) * (y1 - ay) - (by - ay) * (x1 - ax)
+    side_2 = (bx - ax) * (y2 - ay) - (by - ay) * (x2 - ax)
+    if (side_1 > 0) == (side_2 > 0):
+        return False
+    side_a = (x2 - x1) * (ay - y1) - (y2 - y1) * (ax - x1)
+    side_b = (x2 - x1) * (by - y1) - (y2 - y1) * (bx - x1)
+    return (side_a > 0) != (side_b > 0)
+
+
+def _segment_distance_sq(edge: Edge, x: float, y: float) -> float:
+    x1, y1, x2, y2 = edge
+    dx, dy = x2 - x1, y2 - y1
+    length_sq = dx * dx + dy * dy
+    t = 0.0 if length_sq == 0 else max(0.0, min(1.0, ((x - x1) * dx + (y - y1) * dy) / length_sq))
+    px, py = x1 + t * dx - x, y1 + t * dy - y
+    return px * px + py * py
+
+
+def load_province_boundaries(path: str, name_property: str = "name") -> List[Tuple[str, List[Polygon]]]:
+    """Read a GeoJSON FeatureCollection of Polygon / MultiPolygon features."""
+    with open(path, "r", encoding="utf-8") as f:
+        collection = json.load(f)
+    provinces: List[Tuple[str, List[Polygon]]] = []
+    for feature in collection.get("features", []):
+        geometry = feature.get("geometry") or {}
+        if geometry.get("type") == "Polygon":
+            polygons = [geometry["coordinates"]]
+        elif geometry.get("type") == "MultiPolygon":
+            polygons = geometry["coordinates"]
+        else:
+            continue
+        provinces.append((feature.get("properties", {})[name_property], polygons))
+    return provinces
+
+
+_reverse_geocoder: Optional[ProvinceReverseGeocoder] = None
+_reverse_geocoder_loaded = False
+_reverse_geocoder_lock = threading.Lock()
+_boundaries_path: Optional[str] = None
+_online_fallbacks = {"missing_boundaries": 0, "near_border": 0}
+
+
+def boundaries_required() -> bool:
+    """GEO_PROVINCE_BOUNDARIES_REQUIRED: refuse to start without the boundary file (off by default)."""
+    return get_settings().GEO_PROVINCE_BOUNDARIES_REQUIRED
+
+
+def get_reverse_geocoder() -> Optional[ProvinceReverseGeocoder]:
+    """
+    Per-process geocoder built from GEO_PROVINCE_BOUNDARIES_PATH (default: the bundled
+    data/vn_provinces.geojson). None when the file is missing, so callers fall back to
+    an online geocoder; the lifespan handler refuses to start in that case when
+    `boundaries_required()`.
+    """
+    global _reverse_geocoder, _reverse_geocoder_loaded, _boundaries_path
+    if not _reverse_geocoder_loaded:
+        with _reverse_geocoder_lock:
+            if not _reverse_geocoder_loaded:
+                settings = get_settings()
+                path = settings.GEO_PROVINCE_BOUNDARIES_PATH or DEFAULT_BOUNDARIES_PATH
+                _boundaries_path = path
+                if os.path.exists(path):
+                    _reverse_geocoder = ProvinceReverseGeocoder(
+                        load_province_boundaries(path),
+                        cell_size_deg=settings.GEO_REVERSE_CELL_SIZE_DEG,
+                        border_tolerance_deg=settings.GEO_REVERSE_BORDER_TOLERANCE_DEG,
+                    )
+                    logger.info(f"Offline reverse geocoder ready: {_reverse_geocoder.stats()}")
+                else:
+                    logger.warning(
+                        f"No province boundaries at {path}; every /api/weather lookup falls back to Geoapify. "
+                        f"Build the file with scripts/build_province_boundaries.py"
+                    )
+                _reverse_geocoder_loaded = True
+    return _reverse_geocoder
+
+
+def record_online_fallback(reason: str) -> None:
+    """Count a lookup that went to the online geocoder ("missing_boundaries" or "near_border")."""
+    with _reverse_geocoder_lock:
+        _online_fallbacks[reason] += 1
+
+
+def get_reverse_geocoder_stats() -> Dict[str, object]:
+    with _reverse_geocoder_lock:
+        stats: Dict[str, object] = {
+            "offline": _reverse_geocoder is not None,
+            "boundaries_path": _boundaries_path,
+            "online_fallbacks": dict(_online_fallbacks),
+        }
+    if _reverse_geocoder is not None:
+        stats.update(_reverse_geocoder.stats())
+    return stats
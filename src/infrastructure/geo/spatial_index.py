@@ -0,0 +1,305 @@
+import math
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from src.config.settings import get_settings
+from src.infrastructure.database.sql.database import SessionLocal
+from src.shared.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometers."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def radius_km_to_box(latitude: float, longitude: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """Smallest lat/lon box (lat_min, lat_max, lon_min, lon_max) that contains the radius."""
+    angular = radius_km / EARTH_RADIUS_KM
+    dlat = math.degrees(angular)
+    cos_lat = math.cos(math.radians(latitude))
+    if math.sin(angular) >= cos_lat:
+        # The circle reaches a pole, so it covers every longitude
+        dlon = 180.0
+    else:
+        dlon = math.degrees(math.asin(math.sin(angular) / cos_lat))
+    return latitude - dlat, latitude + dlat, longitude - dlon, longitude + dlon
+
+
+class GridSpatialIndex:
+    """
+    Uniform lat/lon grid of row ids.
+
+    Each cell maps row id -> (latitude, longitude). A query only visits the cells
+    overlapping the search box, so the cost is roughly O(cells + hits) instead of
+    a full scan of every point.
+    """
+
+    def __init__(self, cell_size_deg: float = 0.05):
+        if cell_size_deg <= 0:
+            raise ValueError("cell_size_deg must be greater than 0.")
+        self.cell_size_deg = cell_size_deg
+        self._cells: Dict[Tuple[int, int], Dict[int, Tuple[float, float]]] = {}
+        self._points: Dict[int, Tuple[float, float]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def _cell_of(self, latitude: float, longitude: float) -> Tuple[int, int]:
+        return math.floor(latitude / self.cell_size_deg), math.floor(longitude / self.cell_size_deg)
+
+    def upsert(self, row_id: int, latitude: float, longitude: float) -> None:
+        with self._lock:
+            self._remove_unlocked(row_id)
+            self._points[row_id] = (latitude, longitude)
+            self._cells.setdefault(self._cell_of(latitude, longitude), {})[row_id] = (latitude, longitude)
+
+    def remove(self, row_id: int) -> None:
+        with self._lock:
+            self._remove_unlocked(row_id)
+
+    def _remove_unlocked(self, row_id: int) -> None:
+        point = self._points.pop(row_id, None)
+        if point is None:
+            return
+        cell_key = self._cell_of(*point)
+        cell = self._cells.get(cell_key)
+        if cell is not None:
+            cell.pop(row_id, None)
+            if not cell:
+                del self._cells[cell_key]
+
+    def bulk_load(self, rows: Iterable[Tuple[int, float, float]]) -> None:
+        """Add many (id, latitude, longitude) rows under a single lock acquisition."""
+        with self._lock:
+            for row_id, latitude, longitude in rows:
+                self._remove_unlocked(row_id)
+                self._points[row_id] = (latitude, longitude)
+                self._cells.setdefault(self._cell_of(latitude, longitude), {})[row_id] = (latitude, longitude)
+
+    def replace_with(self, other: "GridSpatialIndex") -> None:
+        """Swap in the contents of a freshly built index."""
+        with self._lock:
+            self._cells = other._cells
+            self._points = other._points
+
+    def query_box(self, lat_min: float, lat_max: float, lon_min: float, lon_max: float) -> List[int]:
+        """Ids of all points inside the box (bounds inclusive)."""
+        min_x, min_y = self._cell_of(lat_min, lon_min)
+        max_x, max_y = self._cell_of(lat_max, lon_max)
+        result: List[int] = []
+        with self._lock:
+            # Walk whichever is smaller: the cells in the box or the occupied cells
+            if (max_x - min_x + 1) * (max_y - min_y + 1) <= len(self._cells):
+                cell_keys = (
+                    (x, y)
+                    for x in range(min_x, max_x + 1)
+                    for y in range(min_y, max_y + 1)
+                )
+            else:
+                cell_keys = [
+                    key for key in self._cells
+                    if min_x <= key[0] <= max_x and min_y <= key[1] <= max_y
+                ]
+            for x, y in cell_keys:
+                cell = self._cells.get((x, y))
+                if not cell:
+                    continue
+                if min_x < x < max_x and min_y < y < max_y:
+                    # Interior cell: every point is inside the box
+                    result.extend(cell.keys())
+                    continue
+                for row_id, (latitude, longitude) in cell.items():
+                    if lat_min <= latitude <= lat_max and lon_min <= longitude <= lon_max:
+                        result.append(row_id)
+        return result
+
+    def query_radius(self, latitude: float, longitude: float, radius_km: float) -> List[Tuple[int, float]]:
+        """(id, distance_km) of all points within radius_km, nearest first."""
+        lat_min, lat_max, lon_min, lon_max = radius_km_to_box(latitude, longitude, radius_km)
+        hits: List[Tuple[int, float]] = []
+        with self._lock:
+            for row_id in self.query_box(lat_min, lat_max, lon_min, lon_max):
+                point_lat, point_lon = self._points[row_id]
+                distance = haversine_km(latitude, longitude, point_lat, point_lon)
+                if distance <= radius_km:
+                    hits.append((row_id, distance))
+        hits.sort(key=lambda hit: hit[1])
+        return hits
+
+
+class TableSpatialIndex:
+    """
+    Grid index over the (id, latitude, longitude) columns of one table, kept per worker.
+
+    Every query first pulls rows with an id above the highest one seen so far (a cheap
+    primary-key range scan), so inserts from other workers show up immediately. Writes
+    made through this worker's repositories are applied directly.
+
+    Transactions can commit out of id order, so a refresh that sees id 12 may run before
+    id 11 commits. Ids skipped that way are re-checked by every refresh for `gap_seconds`
+    (rolled-back inserts leave ids that never show up, hence the deadline).
+
+    Builds and the periodic rebuild (every `rebuild_seconds`, to pick up deletes and moved
+    points from other workers) load the whole table, so they run on a background thread
+    with their own session. Until the first build is done, queries return None and the
+    caller falls back to SQL.
+    """
+
+    # Out-of-order commits only span the inserts in flight at once, so older ids are not tracked
+    MAX_GAP_IDS = 256
+
+    def __init__(self, model, cell_size_deg: float, rebuild_seconds: float, gap_seconds: float, session_factory=None):
+        self.model = model
+        self.rebuild_seconds = rebuild_seconds
+        self.gap_seconds = gap_seconds
+        self.session_factory = session_factory
+        self.grid = GridSpatialIndex(cell_size_deg)
+        self._max_id = 0
+        self._gaps: Dict[int, float] = {}
+        self._last_rebuild: Optional[float] = None
+        self._rebuilding = False
+        # Guards the fields above only. The async routes run this code as greenlets on the
+        # event-loop thread through run_sync, so no lock may be held across a query: a
+        # second greenlet blocking on it would stop the loop the first one needs to finish.
+        self._state_lock = threading.Lock()
+
+    def _select_points(self, db: Session):
+        return db.query(self.model.id, self.model.latitude, self.model.longitude)
+
+    def _track_gaps_unlocked(self, previous_max_id: int, seen_ids: Iterable[int], now: float) -> None:
+        # Ids between the old and new high-water mark that we did not get may still commit
+        seen = set(seen_ids)
+        for row_id in seen:
+            self._gaps.pop(row_id, None)
+        low = max(previous_max_id + 1, self._max_id - self.MAX_GAP_IDS)
+        deadline = now + self.gap_seconds
+        for row_id in range(low, self._max_id):
+            if row_id not in seen:
+                self._gaps.setdefault(row_id, deadline)
+        for row_id in [row_id for row_id, expires_at in self._gaps.items() if expires_at <= now]:
+            del self._gaps[row_id]
+
+    def rebuild(self, db: Session) -> None:
+        rows = self._select_points(db).all()
+        fresh = GridSpatialIndex(self.grid.cell_size_deg)
+        fresh.bulk_load(rows)
+        max_id = max((row_id for row_id, _, _ in rows), default=0)
+        with self._state_lock:
+            previous_max_id = self._max_id
+            self.grid.replace_with(fresh)
+            # Rows merged by a concurrent refresh after our read are dropped by the swap;
+            # resetting _max_id to what we read makes the next refresh fetch them again
+            self._max_id = max_id
+            self._track_gaps_unlocked(min(previous_max_id, max_id), (row_id for row_id, _, _ in rows), time.monotonic())
+            self._last_rebuild = time.monotonic()
+
+    def _rebuild_in_background(self) -> None:
+        db = self.session_factory()
+        try:
+            self.rebuild(db)
+        except Exception as e:
+            logger.warning(f"Rebuilding the {self.model.__tablename__} spatial index failed: {e}")
+        finally:
+            db.close()
+            with self._state_lock:
+                self._rebuilding = False
+
+    def start_rebuild(self) -> None:
+        """Rebuild on a background thread unless one is already running."""
+        with self._state_lock:
+            if self._rebuilding or self.session_factory is None:
+                return
+            self._rebuilding = True
+        threading.Thread(
+            target=self._rebuild_in_background, name=f"spatial-index-{self.model.__tablename__}", daemon=True
+        ).start()
+
+    def refresh(self, db: Session) -> bool:
+        """Pull rows committed since the last refresh; False while the index is not built yet."""
+        last_rebuild = self._last_rebuild
+        if last_rebuild is None or time.monotonic() - last_rebuild >= self.rebuild_seconds:
+            if self.session_factory is None:
+                self.rebuild(db)
+                return True
+            self.start_rebuild()
+            if last_rebuild is None:
+                return False
+        with self._state_lock:
+            max_id = self._max_id
+            gaps = list(self._gaps)
+        condition = self.model.id > max_id
+        if gaps:
+            condition = or_(condition, self.model.id.in_(gaps))
+        rows = self._select_points(db).filter(condition).all()
+        with self._state_lock:
+            if rows:
+                self.grid.bulk_load(rows)
+            previous_max_id = self._max_id
+            self._max_id = max(self._max_id, max((row_id for row_id, _, _ in rows), default=0))
+            self._track_gaps_unlocked(previous_max_id, (row_id for row_id, _, _ in rows), time.monotonic())
+        return True
+
+    def add(self, row_id: int, latitude: float, longitude: float) -> None:
+        self.grid.upsert(row_id, latitude, longitude)
+
+    def add_many(self, rows: Iterable[Tuple[int, float, float]]) -> None:
+        self.grid.bulk_load(rows)
+
+    def discard(self, row_id: int) -> None:
+        self.grid.remove(row_id)
+
+    def query_radius(self, db: Session, latitude: float, longitude: float, radius_km: float) -> Optional[List[Tuple[int, float]]]:
+        if not self.refresh(db):
+            return None
+        return self.grid.query_radius(latitude, longitude, radius_km)
+
+    def query_box(self, db: Session, lat_min: float, lat_max: float, lon_min: float, lon_max: float) -> Optional[List[int]]:
+        if not self.refresh(db):
+            return None
+        return self.grid.query_box(lat_min, lat_max, lon_min, lon_max)
+
+
+_indexes: Dict[str, TableSpatialIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_spatial_index(model) -> TableSpatialIndex:
+    """Per-process spatial index for a model with `id`, `latitude` and `longitude` columns."""
+    index = _indexes.get(model.__tablename__)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(model.__tablename__)
+            if index is None:
+                settings = get_settings()
+                index = TableSpatialIndex(
+                    model,
+                    cell_size_deg=settings.GEO_INDEX_CELL_SIZE_DEG,
+                    rebuild_seconds=settings.GEO_INDEX_REBUILD_SECONDS,
+                    gap_seconds=settings.GEO_INDEX_GAP_SECONDS,
+                    session_factory=SessionLocal,
+                )
+                _indexes[model.__tablename__] = index
+    return index
+
+
+def fetch_rows_by_ids(db: Session, model, ids: List[int], *criteria, chunk_size: int = 1000) -> list:
+    """Load rows for index hits, chunking the IN list and applying any extra filters."""
+    rows = []
+    for start in range(0, len(ids), chunk_size):
+        chunk = ids[start:start + chunk_size]
+        rows.extend(db.query(model).filter(model.id.in_(chunk), *criteria).all())
+    return rows
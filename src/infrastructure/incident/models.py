@@ -1,10 +1,11 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, Text
+from sqlalchemy import Column, Integer, String, DateTime, Float, Text, Index
 from sqlalchemy.sql import func
 from src.infrastructure.database.sql.database import Base
 
 
 class Incident(Base):
     __tablename__ = "incidents"
+    __table_args__ = (Index("ix_incidents_lat_lon", "latitude", "longitude"),)
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(512), nullable=False)
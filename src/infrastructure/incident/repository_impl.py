@@ -1,11 +1,13 @@
 
 from typing import List, Optional
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import func
 
 from src.domain.incident.entities import Incident as IncidentEntity
 from src.domain.incident.repository_interface import IIncidentRepository
 from src.infrastructure.incident.models import Incident
+from src.infrastructure.geo.spatial_index import get_spatial_index
+from src.infrastructure.geo.queries import find_within_radius_km
 
 
 class IncidentRepository(IIncidentRepository):
@@ -14,8 +16,45 @@ class IncidentRepository(IIncidentRepository):
         db.add(db_incident)
         db.commit()
         db.refresh(db_incident)
+        get_spatial_index(Incident).add(db_incident.id, db_incident.latitude, db_incident.longitude)
         return IncidentEntity.model_validate(db_incident.__dict__)
 
+    def create_many(self, db: Session, incidents: List[IncidentEntity]) -> int:
+        """
+        Insert all incidents with one executemany INSERT in a single transaction, without
+        reading the rows back. The spatial index picks up the new ids on its next query.
+        """
+        rows = [incident.model_dump(exclude={"id", "created_at", "updated_at"}) for incident in incidents]
+        if not rows:
+            return 0
+        try:
+            db.execute(insert(Incident), rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return len(rows)
+
+    def create_batch(self, db: Session, incidents: List[IncidentEntity]) -> List[IncidentEntity]:
+        """
+        Insert all incidents in one transaction and return them with their ids. The ORM
+        batches the INSERTs (multi-row with RETURNING where the dialect supports it), and
+        the spatial index takes every new row under a single lock.
+        """
+        db_incidents = [Incident(**incident.model_dump()) for incident in incidents]
+        if not db_incidents:
+            return []
+        try:
+            db.add_all(db_incidents)
+            db.flush()
+            created = [IncidentEntity.model_validate(db_incident.__dict__) for db_incident in db_incidents]
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        get_spatial_index(Incident).add_many((incident.id, incident.latitude, incident.longitude) for incident in created)
+        return created
+
     def get_by_id(self, db: Session, incident_id: int) -> Optional[IncidentEntity]:
         db_incident = db.query(Incident).filter(Incident.id == incident_id).first()
         if db_incident:
@@ -30,36 +69,16 @@ class IncidentRepository(IIncidentRepository):
         radius: float  # in kilometers
     ) -> List[IncidentEntity]:
         """
-        Get incidents within a certain radius using the Haversine formula.
+        Get incidents within a certain radius (Haversine distance), nearest first.
         """
-        # Earth radius in kilometers
-        earth_radius = 6371
-
-        # Convert latitude and longitude to radians
-        lat_rad = func.radians(latitude)
-        lon_rad = func.radians(longitude)
-        db_lat_rad = func.radians(Incident.latitude)
-        db_lon_rad = func.radians(Incident.longitude)
-
-        # Haversine formula
-        dlon = db_lon_rad - lon_rad
-        dlat = db_lat_rad - lat_rad
-        
-        # FIX: Use func.power(x, 2) instead of x ** 2
-        # You can also use (func.sin(dlat / 2) * func.sin(dlat / 2)) if power causes dialect issues
-        a = func.power(func.sin(dlat / 2), 2) + \
-            func.cos(lat_rad) * func.cos(db_lat_rad) * func.power(func.sin(dlon / 2), 2)
-            
-        c = 2 * func.atan2(func.sqrt(a), func.sqrt(1 - a))
-        distance = earth_radius * c
-
-        incidents = db.query(Incident).filter(distance <= radius).all()
-        return [IncidentEntity.model_validate(i.__dict__) for i in incidents]
+        pairs = find_within_radius_km(db, Incident, latitude, longitude, radius)
+        return [IncidentEntity.model_validate(i.__dict__) for i, _ in pairs]
 
     def delete(self, db: Session, incident_id: int) -> bool:
         db_incident = db.query(Incident).filter(Incident.id == incident_id).first()
         if db_incident:
             db.delete(db_incident)
             db.commit()
+            get_spatial_index(Incident).discard(incident_id)
             return True
         return False
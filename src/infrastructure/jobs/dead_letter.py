@@ -0,0 +1,28 @@
+import json
+
+from sqlalchemy.orm import Session
+
+from src.application.jobs.job_interfaces import Job
+from src.infrastructure.database.sql.database import SessionLocal
+from src.infrastructure.jobs.models import DeadLetterJob
+
+
+class DeadLetterJobRepository:
+    def create(self, db: Session, job: Job, error: str) -> None:
+        db.add(DeadLetterJob(
+            job_id=job.id,
+            name=job.name,
+            payload=json.dumps(job.payload, default=str),
+            attempts=job.attempts,
+            error=error,
+        ))
+        db.commit()
+
+
+def store_dead_letter(job: Job, error: str) -> None:
+    """Dead-letter sink for the worker pool; runs on a worker thread with its own session."""
+    db = SessionLocal()
+    try:
+        DeadLetterJobRepository().create(db, job, error)
+    finally:
+        db.close()
@@ -0,0 +1,49 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from src.application.jobs.job_interfaces import IJobBroker, Job
+
+
+class InMemoryJobBroker(IJobBroker):
+    """Bounded in-process broker; jobs are ordered by `available_at` so retries can be delayed."""
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._heap: List[Tuple[float, int, Job]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    def put(self, job: Job) -> bool:
+        with self._condition:
+            if len(self._heap) >= self.max_size:
+                return False
+            heapq.heappush(self._heap, (job.available_at, next(self._sequence), job))
+            self._condition.notify()
+            return True
+
+    def get(self, timeout: float) -> Optional[Job]:
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                if self._heap and self._heap[0][0] <= now:
+                    return heapq.heappop(self._heap)[2]
+                if now >= deadline:
+                    return None
+                wait = deadline - now
+                if self._heap:
+                    wait = min(wait, self._heap[0][0] - now)
+                self._condition.wait(wait)
+
+    def drain(self) -> List[Job]:
+        with self._condition:
+            jobs = [job for _, _, job in sorted(self._heap)]
+            self._heap.clear()
+            return jobs
+
+    def size(self) -> int:
+        with self._condition:
+            return len(self._heap)
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy.sql import func
+from src.infrastructure.database.sql.database import Base
+
+class DeadLetterJob(Base):
+    __tablename__ = "dead_letter_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(String(32), index=True)
+    name = Column(String(100), index=True)
+    payload = Column(Text) # JSON
+    attempts = Column(Integer, default=0)
+    error = Column(Text)
+    created_at = Column(DateTime, server_default=func.now())
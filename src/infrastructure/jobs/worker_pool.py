@@ -0,0 +1,160 @@
+import random
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+from src.application.jobs.job_interfaces import IJobBroker, IJobQueue, Job, JobHandler
+from src.config.settings import get_settings
+from src.infrastructure.jobs.dead_letter import store_dead_letter
+from src.infrastructure.jobs.memory_broker import InMemoryJobBroker
+from src.shared.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DeadLetterSink = Callable[[Job, str], None]
+
+
+class JobWorkerPool(IJobQueue):
+    """
+    Fixed number of worker threads pulling jobs from a broker.
+
+    A failing job is retried with jittered exponential backoff; after `max_attempts`
+    it is handed to the dead-letter sink. `enqueue` returns False while the pool is
+    stopped or the broker is full, so callers can fall back to running the work inline.
+    """
+
+    def __init__(
+        self,
+        broker: IJobBroker,
+        dead_letter: DeadLetterSink,
+        workers: int = 4,
+        max_attempts: int = 5,
+        backoff_seconds: float = 0.5,
+        max_backoff_seconds: float = 30.0,
+        poll_seconds: float = 0.5,
+    ):
+        if workers <= 0:
+            raise ValueError("workers must be greater than 0.")
+        self.broker = broker
+        self.dead_letter = dead_letter
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.poll_seconds = poll_seconds
+        self._handlers: Dict[str, JobHandler] = {}
+        self._threads: List[threading.Thread] = []
+        self._stopping = threading.Event()
+        self._running = False
+        self._counters_lock = threading.Lock()
+        self._counters = {"enqueued": 0, "rejected": 0, "succeeded": 0, "retried": 0, "dead_lettered": 0}
+
+    def register(self, name: str, handler: JobHandler) -> None:
+        self._handlers[name] = handler
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._stopping.clear()
+        self._threads = [
+            threading.Thread(target=self._work, name=f"job-worker-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+        self._running = True
+        logger.info(f"Job worker pool started ({self.workers} workers)")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Let workers finish what is ready to run, then dead-letter whatever is left."""
+        if not self._running:
+            return
+        self._running = False
+        self._stopping.set()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        self._threads = []
+        for job in self.broker.drain():
+            self._send_to_dead_letter(job, "Worker pool stopped before the job ran")
+        logger.info("Job worker pool stopped")
+
+    def enqueue(self, name: str, payload: Dict[str, Any]) -> bool:
+        if not self._running or name not in self._handlers:
+            return False
+        job = Job(id=uuid.uuid4().hex, name=name, payload=payload, available_at=time.monotonic())
+        accepted = self.broker.put(job)
+        self._count("enqueued" if accepted else "rejected")
+        return accepted
+
+    def stats(self) -> Dict[str, int]:
+        with self._counters_lock:
+            counters = dict(self._counters)
+        counters["queued"] = self.broker.size()
+        counters["workers"] = len(self._threads)
+        return counters
+
+    def _count(self, name: str) -> None:
+        with self._counters_lock:
+            self._counters[name] += 1
+
+    def _work(self) -> None:
+        while True:
+            job = self.broker.get(timeout=self.poll_seconds)
+            if job is None:
+                if self._stopping.is_set():
+                    return
+                continue
+            self._run(job)
+
+    def _run(self, job: Job) -> None:
+        job.attempts += 1
+        try:
+            self._handlers[job.name](job.payload)
+            self._count("succeeded")
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if job.attempts >= self.max_attempts or self._stopping.is_set():
+                logger.error(f"Job {job.name} ({job.id}) failed after {job.attempts} attempts: {error}")
+                self._send_to_dead_letter(job, error)
+                return
+            delay = min(self.max_backoff_seconds, self.backoff_seconds * 2 ** (job.attempts - 1))
+            job.available_at = time.monotonic() + delay * random.uniform(0.5, 1.0)
+            logger.warning(f"Job {job.name} ({job.id}) attempt {job.attempts} failed, retrying: {error}")
+            if self.broker.put(job):
+                self._count("retried")
+            else:
+                self._send_to_dead_letter(job, f"Queue full on retry; last error: {error}")
+
+    def _send_to_dead_letter(self, job: Job, error: str) -> None:
+        self._count("dead_lettered")
+        try:
+            self.dead_letter(job, error)
+        except Exception as e:
+            logger.error(f"Could not store dead-letter job {job.name} ({job.id}): {e}; payload={job.payload}")
+
+
+_job_queue: Optional[JobWorkerPool] = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobWorkerPool:
+    """Per-process job queue; the app starts it in the lifespan handler."""
+    global _job_queue
+    if _job_queue is None:
+        with _job_queue_lock:
+            if _job_queue is None:
+                settings = get_settings()
+                _job_queue = JobWorkerPool(
+                    InMemoryJobBroker(max_size=settings.JOB_QUEUE_MAX_SIZE),
+                    dead_letter=store_dead_letter,
+                    workers=settings.JOB_WORKERS,
+                    max_attempts=settings.JOB_MAX_ATTEMPTS,
+                    backoff_seconds=settings.JOB_RETRY_BACKOFF_SECONDS,
+                )
+    return _job_queue
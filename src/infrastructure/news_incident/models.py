@@ -1,11 +1,14 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, Text, UniqueConstraint
+from sqlalchemy import Column, Integer, String, DateTime, Float, Text, UniqueConstraint, Index
 from sqlalchemy.sql import func
 from src.infrastructure.database.sql.database import Base
 
 
 class NewsIncident(Base):
     __tablename__ = "news_incidents"
-    __table_args__ = (UniqueConstraint("source_url_hash", name="uq_news_incidents_source_url_hash"),)
+    __table_args__ = (
+        UniqueConstraint("source_url_hash", name="uq_news_incidents_source_url_hash"),
+        Index("ix_news_incidents_lat_lon", "latitude", "longitude"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(512), nullable=False)
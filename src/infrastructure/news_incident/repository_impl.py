@@ -1,10 +1,21 @@
-from typing import List
+from typing import Any, Dict, List
 import hashlib
+from sqlalchemy import func
+from sqlalchemy.dialects import mysql, sqlite
 from sqlalchemy.orm import Session
 
 from src.domain.news_incident.entities import NewsIncident as NewsIncidentEntity
 from src.domain.news_incident.repository_interface import INewsIncidentRepository
 from src.infrastructure.news_incident.models import NewsIncident
+from src.infrastructure.geo.spatial_index import get_spatial_index
+from src.infrastructure.geo.queries import find_within_box
+
+UPSERT_CHUNK_SIZE = 500
+# Columns an upsert overwrites on an existing source URL (id and created_at are kept)
+UPSERT_COLUMNS = (
+    "title", "summary", "category", "location_name", "latitude", "longitude",
+    "source_url", "published_at", "severity",
+)
 
 
 class NewsIncidentRepository(INewsIncidentRepository):
@@ -19,6 +30,7 @@ class NewsIncidentRepository(INewsIncidentRepository):
             existing.source_url_hash = source_url_hash
             db.commit()
             db.refresh(existing)
+            get_spatial_index(NewsIncident).add(existing.id, existing.latitude, existing.longitude)
             return NewsIncidentEntity.model_validate(existing.__dict__)
 
         db_incident = NewsIncident(
@@ -36,8 +48,69 @@ class NewsIncidentRepository(INewsIncidentRepository):
         db.add(db_incident)
         db.commit()
         db.refresh(db_incident)
+        get_spatial_index(NewsIncident).add(db_incident.id, db_incident.latitude, db_incident.longitude)
         return NewsIncidentEntity.model_validate(db_incident.__dict__)
 
+    def bulk_upsert(self, db: Session, incidents: List[NewsIncidentEntity]) -> List[NewsIncidentEntity]:
+        """
+        Insert or update every incident by source URL in one statement per chunk, using the
+        uq_news_incidents_source_url_hash constraint, then read the stored rows back with one
+        SELECT per chunk. Returns one row per distinct source URL, in input order. Dialects
+        without a native upsert (anything but MySQL and SQLite) go row by row through
+        `upsert_by_source_url`.
+        """
+        incidents_by_hash: Dict[str, NewsIncidentEntity] = {}
+        for incident in incidents:
+            source_url_hash = hashlib.sha256(incident.source_url.encode("utf-8")).hexdigest()
+            incidents_by_hash[source_url_hash] = incident # The same URL twice in a batch: the last one wins
+        if not incidents_by_hash:
+            return []
+
+        dialect = db.get_bind().dialect.name
+        if dialect not in ("mysql", "sqlite"):
+            return [self.upsert_by_source_url(db, incident) for incident in incidents_by_hash.values()]
+
+        rows_by_hash: Dict[str, Dict[str, Any]] = {}
+        for source_url_hash, incident in incidents_by_hash.items():
+            row = {column: getattr(incident, column) for column in UPSERT_COLUMNS}
+            row["source_url_hash"] = source_url_hash
+            rows_by_hash[source_url_hash] = row
+        rows = list(rows_by_hash.values())
+        try:
+            for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+                db.execute(self._upsert_statement(dialect, rows[start:start + UPSERT_CHUNK_SIZE]))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        hashes = list(rows_by_hash)
+        stored = {
+            row.source_url_hash: row
+            for start in range(0, len(hashes), UPSERT_CHUNK_SIZE)
+            for row in db.query(NewsIncident).filter(
+                NewsIncident.source_url_hash.in_(hashes[start:start + UPSERT_CHUNK_SIZE])
+            ).all()
+        }
+        index = get_spatial_index(NewsIncident)
+        for row in stored.values():
+            index.add(row.id, row.latitude, row.longitude)
+        return [NewsIncidentEntity.model_validate(stored[h].__dict__) for h in rows_by_hash if h in stored]
+
+    def _upsert_statement(self, dialect: str, rows: List[Dict[str, Any]]):
+        if dialect == "mysql":
+            statement = mysql.insert(NewsIncident).values(rows)
+            return statement.on_duplicate_key_update(
+                **{column: statement.inserted[column] for column in UPSERT_COLUMNS}, updated_at=func.now()
+            )
+        if dialect == "sqlite":
+            statement = sqlite.insert(NewsIncident).values(rows)
+            return statement.on_conflict_do_update(
+                index_elements=["source_url_hash"],
+                set_={**{column: statement.excluded[column] for column in UPSERT_COLUMNS}, "updated_at": func.now()},
+            )
+        raise ValueError(f"No native upsert for the '{dialect}' dialect.")
+
     def get_within_radius(
         self,
         db: Session,
@@ -45,13 +118,5 @@ class NewsIncidentRepository(INewsIncidentRepository):
         longitude: float,
         radius: float
     ) -> List[NewsIncidentEntity]:
-        lat_min = latitude - radius
-        lat_max = latitude + radius
-        lon_min = longitude - radius
-        lon_max = longitude + radius
-
-        incidents = db.query(NewsIncident).filter(
-            NewsIncident.latitude.between(lat_min, lat_max),
-            NewsIncident.longitude.between(lon_min, lon_max)
-        ).all()
-        return [NewsIncidentEntity.model_validate(i.__dict__) for i in incidents]
+        pairs = find_within_box(db, NewsIncident, latitude, longitude, radius)
+        return [NewsIncidentEntity.model_validate(i.__dict__) for i, _ in pairs]
@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from src.infrastructure.database.sql.database import Base
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index("ix_notifications_user_created_id", "user_id", "created_at", "id"),
+        Index("ix_notifications_user_read", "user_id", "is_read"),
+        Index("ix_notifications_sender_type_created", "sender_id", "type", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -13,5 +18,21 @@ class Notification(Base):
     type = Column(String(50))
     is_read = Column(Boolean, default=False)
     created_at = Column(DateTime, server_default=func.now())
+    sender_id = Column(Integer, nullable=True)
+    coalesced_count = Column(Integer, nullable=False, default=1, server_default="1")
 
     user = relationship("User", back_populates="notifications")
+
+class NotificationArchive(Base):
+    """Read notifications moved out of `notifications` by the retention job (no foreign keys, primary key only)."""
+    __tablename__ = "notifications_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False) # Same id as in notifications
+    user_id = Column(Integer)
+    title = Column(String(255))
+    message = Column(String(255))
+    type = Column(String(50))
+    created_at = Column(DateTime)
+    sender_id = Column(Integer, nullable=True)
+    coalesced_count = Column(Integer, nullable=False, default=1, server_default="1")
+    archived_at = Column(DateTime, server_default=func.now())
@@ -1,11 +1,49 @@
+from sqlalchemy import delete, exists, false, func, insert, select, true, update
+from sqlalchemy.dialects import mysql, sqlite
 from sqlalchemy.orm import Session
-from src.infrastructure.notification.models import Notification
+from src.infrastructure.notification.models import Notification, NotificationArchive
+from src.infrastructure.user.models import User
 from src.domain.notification.repository_interface import INotificationRepository
 from src.domain.notification.entities import Notification as NotificationEntity
 from src.application.notification.dto import NotificationCreate, NotificationUpdate
-from typing import List, Optional
+from src.domain.pagination.entities import PageRequest
+from src.infrastructure.database.sql.pagination import before_cursor, keyset_page
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+BULK_INSERT_CHUNK_SIZE = 1000
+
+
+def _insert_row(n: NotificationEntity) -> dict:
+    return {
+        "user_id": n.user_id,
+        "title": n.title,
+        "message": n.message,
+        "type": n.type,
+        "is_read": n.is_read,
+        "created_at": n.created_at,
+        "sender_id": n.sender_id,
+        "coalesced_count": n.coalesced_count,
+    }
+
+
+def _archive_insert(dialect: str, columns: List[str], moved):
+    # Ids already in the archive are skipped, so passes running on several workers at once
+    # (or a pass retried after a failed delete) never fail on the primary key
+    if dialect == "mysql":
+        return mysql.insert(NotificationArchive).from_select(columns, moved) \
+            .on_duplicate_key_update(id=NotificationArchive.id)
+    if dialect == "sqlite":
+        return sqlite.insert(NotificationArchive).from_select(columns, moved) \
+            .on_conflict_do_nothing(index_elements=["id"])
+    return insert(NotificationArchive).from_select(columns, moved)
+
+
+def _insert_rows(db: Session, rows: List[dict]) -> None:
+    for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+        db.execute(insert(Notification).values(rows[start:start + BULK_INSERT_CHUNK_SIZE]))
+
 class NotificationRepository(INotificationRepository):
     def get_notification(self, db: Session, notification_id: int) -> Optional[NotificationEntity]:
         db_notification = db.query(Notification).filter(Notification.id == notification_id).first()
@@ -13,10 +51,79 @@ class NotificationRepository(INotificationRepository):
             return NotificationEntity.model_validate(db_notification.__dict__)
         return None
 
-    def get_notifications_by_user(self, db: Session, user_id: int) -> List[NotificationEntity]:
-        db_notifications = db.query(Notification).filter(Notification.user_id == user_id).all()
+    def get_notifications_by_user(self, db: Session, user_id: int, page: Optional[PageRequest] = None) -> List[NotificationEntity]:
+        query = db.query(Notification).filter(Notification.user_id == user_id)
+        db_notifications = keyset_page(db, query, Notification, page).all()
         return [NotificationEntity.model_validate(n.__dict__) for n in db_notifications]
 
+    def count_unread(self, db: Session, user_id: int) -> int:
+        # Answered from ix_notifications_user_read alone
+        return db.query(func.count(Notification.id)).filter(
+            Notification.user_id == user_id, Notification.is_read == false()
+        ).scalar()
+
+    def mark_read(self, db: Session, user_id: int, ids: Optional[List[int]] = None, up_to: Optional[int] = None) -> int:
+        """
+        Marks the user's unread notifications in `ids`, or `up_to` and everything older, as
+        read with a single UPDATE. Ids of other users' notifications are ignored.
+        """
+        criteria = [Notification.user_id == user_id, Notification.is_read == false()]
+        if ids is not None:
+            if not ids:
+                return 0
+            criteria.append(Notification.id.in_(ids))
+        elif up_to is not None:
+            criteria.extend(before_cursor(db, Notification, up_to, inclusive=True))
+        try:
+            result = db.execute(
+                update(Notification).where(*criteria).values(is_read=True),
+                execution_options={"synchronize_session": False},
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return result.rowcount
+
+    def archive_read_notifications(self, db: Session, older_than: datetime, after_id: int, batch_size: int) -> Tuple[int, Optional[int]]:
+        """
+        Looks at the next `batch_size` notifications by id after `after_id` and moves the read
+        ones created before `older_than` to notifications_archive, in one short transaction.
+
+        Returns (archived, last id looked at). The id is None once there is nothing left worth
+        scanning: the end of the table, or a batch that is entirely newer than `older_than`
+        (ids grow with created_at, so the rest of the table is newer too).
+        """
+        scanned = db.query(Notification.id, Notification.is_read, Notification.created_at) \
+            .filter(Notification.id > after_id).order_by(Notification.id).limit(batch_size).all()
+        if not scanned:
+            return 0, None
+        ids = [n.id for n in scanned if n.is_read and n.created_at is not None and n.created_at < older_than]
+        if not ids and all(n.created_at is not None and n.created_at >= older_than for n in scanned):
+            return 0, None
+        archived = 0
+        if ids:
+            columns = ["id", "user_id", "title", "message", "type", "created_at", "sender_id", "coalesced_count"]
+            try:
+                # Re-check is_read so a row marked unread since the scan stays put
+                moved = select(*(getattr(Notification, c) for c in columns)).where(
+                    Notification.id.in_(ids), Notification.is_read == true()
+                )
+                db.execute(_archive_insert(db.get_bind().dialect.name, columns, moved))
+                # Only rows whose copy is in the archive: a reused id whose insert was skipped stays
+                in_archive = exists().where(
+                    NotificationArchive.id == Notification.id, NotificationArchive.created_at == Notification.created_at
+                )
+                archived = db.execute(
+                    delete(Notification).where(Notification.id.in_(ids), Notification.is_read == true(), in_archive),
+                    execution_options={"synchronize_session": False},
+                ).rowcount
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+        return archived, scanned[-1].id
+
     def create_notification(self, db: Session, notification_data: NotificationEntity) -> NotificationEntity:
         db_notification = Notification(
             user_id=notification_data.user_id,
@@ -24,13 +131,90 @@ class NotificationRepository(INotificationRepository):
             message=notification_data.message,
             type=notification_data.type,
             is_read=notification_data.is_read,
-            created_at=notification_data.created_at
+            created_at=notification_data.created_at,
+            sender_id=notification_data.sender_id
         ) # Added missing parenthesis
         db.add(db_notification)
         db.commit()
         db.refresh(db_notification)
         return NotificationEntity.model_validate(db_notification.__dict__)
 
+    def create_notifications_bulk(self, db: Session, notifications: List[NotificationEntity]) -> int:
+        """Insert all notifications with multi-row INSERTs in a single transaction."""
+        rows = [_insert_row(n) for n in notifications]
+        if not rows:
+            return 0
+        try:
+            _insert_rows(db, rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return len(rows)
+
+    def coalesce_notifications_bulk(self, db: Session, notifications: List[NotificationEntity], since: datetime) -> Tuple[int, int]:
+        """
+        Like create_notifications_bulk, but a notification with a sender_id whose recipient
+        still has unread notifications of the same sender and type created since `since`
+        replaces them: they are deleted and the new row (latest title and message) carries
+        their summed coalesced_count. Ids and created_at only move forward, so cursors held
+        by clients (`after`, mark_read `up_to`) never point at content they have not seen.
+        Returns (inserted, coalesced): notifications that started a new entry in the
+        recipient's list, and ones merged into an entry.
+        """
+        # (sender_id, type) -> recipient -> [notifications], in order
+        keyed: Dict[Tuple[int, str], Dict[int, List[NotificationEntity]]] = defaultdict(lambda: defaultdict(list))
+        rows = []
+        for n in notifications:
+            if n.sender_id is None:
+                rows.append(_insert_row(n))
+            else:
+                keyed[(n.sender_id, n.type)][n.user_id].append(n)
+        coalesced = 0
+        replaced = 0
+        try:
+            for sender_id in sorted({sender_id for sender_id, _ in keyed}):
+                # Serializes concurrent fan-outs of one sender (MySQL row lock), so they do
+                # not both miss the unread row and insert twice. Duplicates that still get
+                # through (SQLite ignores FOR UPDATE) are merged by the next repeat below.
+                db.query(User.id).filter(User.id == sender_id).with_for_update().scalar()
+            previous_ids = []
+            for (sender_id, notification_type), by_recipient in keyed.items():
+                previous_counts: Dict[int, int] = defaultdict(int)
+                recipient_ids = list(by_recipient)
+                for start in range(0, len(recipient_ids), BULK_INSERT_CHUNK_SIZE):
+                    for notification_id, recipient_id, count in db.query(
+                        Notification.id, Notification.user_id, Notification.coalesced_count
+                    ).filter(
+                        Notification.sender_id == sender_id,
+                        Notification.type == notification_type,
+                        Notification.is_read == false(),
+                        Notification.created_at >= since,
+                        Notification.user_id.in_(recipient_ids[start:start + BULK_INSERT_CHUNK_SIZE]),
+                    ):
+                        previous_ids.append(notification_id)
+                        previous_counts[recipient_id] += count
+                for recipient_id, repeats in by_recipient.items():
+                    previous = previous_counts.get(recipient_id, 0)
+                    rows.append({**_insert_row(repeats[-1]), "coalesced_count": previous + len(repeats)})
+                    if previous:
+                        replaced += 1
+                        coalesced += len(repeats)
+                    else:
+                        coalesced += len(repeats) - 1
+            # Insert before deleting, so the new rows get higher ids even where ids are reused
+            _insert_rows(db, rows)
+            for start in range(0, len(previous_ids), BULK_INSERT_CHUNK_SIZE):
+                db.execute(
+                    delete(Notification).where(Notification.id.in_(previous_ids[start:start + BULK_INSERT_CHUNK_SIZE])),
+                    execution_options={"synchronize_session": False},
+                )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return len(rows) - replaced, coalesced
+
     def update_notification(self, db: Session, notification_id: int, notification_data: NotificationEntity) -> Optional[NotificationEntity]:
         db_notification = db.query(Notification).filter(Notification.id == notification_id).first()
         if db_notification:
@@ -0,0 +1,157 @@
+import threading
+from typing import Iterable, Optional, Set
+
+from sqlalchemy import case, literal, null, or_, select, union_all
+from sqlalchemy.orm import Session
+
+from src.application.cache.cache_interfaces import ICacheBackend
+from src.config.settings import get_settings
+from src.domain.safety_network.entities import (
+    NETWORK_CIRCLE,
+    NETWORK_FRIEND,
+    NETWORK_OWN_CIRCLE,
+    SafetyNetwork,
+)
+from src.domain.safety_network.repository_interface import ISafetyNetworkResolver
+from src.infrastructure.cache.memory_cache import InMemoryTTLCache
+from src.infrastructure.circle.member_models import CircleMember
+from src.infrastructure.circle.models import Circle
+from src.infrastructure.friend.models import Friendship
+
+
+class SafetyNetworkResolver(ISafetyNetworkResolver):
+    """Friends + active-circle members of a user, resolved with a single UNION ALL."""
+
+    def _network_statement(self, user_id: int):
+        friends_as_user = select(
+            Friendship.friend_id.label("user_id"),
+            literal(NETWORK_FRIEND).label("source"),
+            null().label("circle_id"),
+        ).where(Friendship.user_id == user_id)
+
+        friends_as_friend = select(
+            Friendship.user_id.label("user_id"),
+            literal(NETWORK_FRIEND).label("source"),
+            null().label("circle_id"),
+        ).where(Friendship.friend_id == user_id)
+
+        joined_circles = select(CircleMember.circle_id).where(CircleMember.member_id == user_id)
+        circle_members = (
+            select(
+                CircleMember.member_id.label("user_id"),
+                case(
+                    (Circle.owner_id == user_id, NETWORK_CIRCLE | NETWORK_OWN_CIRCLE),
+                    else_=NETWORK_CIRCLE,
+                ).label("source"),
+                Circle.id.label("circle_id"),
+            )
+            .join(Circle, Circle.id == CircleMember.circle_id)
+            .where(
+                Circle.status == "active",
+                or_(Circle.owner_id == user_id, Circle.id.in_(joined_circles)),
+            )
+        )
+
+        return union_all(friends_as_user, friends_as_friend, circle_members)
+
+    def resolve(self, db: Session, user_id: int) -> SafetyNetwork:
+        members = {}
+        own_circle_ids = set()
+        for member_id, source, circle_id in db.execute(self._network_statement(user_id)):
+            if source & NETWORK_OWN_CIRCLE:
+                own_circle_ids.add(circle_id)
+            if member_id is None or member_id == user_id:
+                continue
+            members[member_id] = members.get(member_id, 0) | source
+
+        return SafetyNetwork(
+            user_id=user_id,
+            active_circle_id=min(own_circle_ids) if own_circle_ids else None,
+            members=members,
+        )
+
+    def invalidate_users(self, user_ids: Iterable[int]) -> None:
+        pass
+
+    def invalidate_circles(self, db: Session, circle_ids: Iterable[int]) -> None:
+        pass
+
+
+class CachedSafetyNetworkResolver(ISafetyNetworkResolver):
+    """Caches resolved networks per user; writes that change a network must invalidate it."""
+
+    def __init__(self, resolver: ISafetyNetworkResolver, cache: ICacheBackend):
+        self.resolver = resolver
+        self.cache = cache
+
+    def resolve(self, db: Session, user_id: int) -> SafetyNetwork:
+        key = _cache_key(user_id)
+        network = self.cache.get(key)
+        if network is None:
+            network = self.resolver.resolve(db, user_id)
+            self.cache.set(key, network)
+        return network
+
+    def invalidate_users(self, user_ids: Iterable[int]) -> None:
+        invalidate_safety_networks(user_ids)
+
+    def invalidate_circles(self, db: Session, circle_ids: Iterable[int]) -> None:
+        invalidate_circle_safety_networks(db, circle_ids)
+
+
+_network_cache: Optional[ICacheBackend] = None
+_network_cache_lock = threading.Lock()
+
+
+def _cache_key(user_id: int) -> str:
+    return f"safety_network:{user_id}"
+
+
+def get_safety_network_cache() -> ICacheBackend:
+    """Per-process cache backend shared by every CachedSafetyNetworkResolver."""
+    global _network_cache
+    if _network_cache is None:
+        with _network_cache_lock:
+            if _network_cache is None:
+                settings = get_settings()
+                _network_cache = InMemoryTTLCache(
+                    max_entries=settings.SAFETY_NETWORK_CACHE_MAX_ENTRIES,
+                    ttl_seconds=settings.SAFETY_NETWORK_CACHE_TTL_SECONDS,
+                )
+    return _network_cache
+
+
+def set_safety_network_cache(cache: ICacheBackend) -> None:
+    """Swap the backend, e.g. for a cache shared between workers."""
+    global _network_cache
+    with _network_cache_lock:
+        _network_cache = cache
+
+
+def get_safety_network_resolver() -> ISafetyNetworkResolver:
+    resolver = SafetyNetworkResolver()
+    if get_settings().SAFETY_NETWORK_CACHE_ENABLED:
+        return CachedSafetyNetworkResolver(resolver, get_safety_network_cache())
+    return resolver
+
+
+def invalidate_safety_networks(user_ids: Iterable[int]) -> None:
+    get_safety_network_cache().delete_many(
+        _cache_key(user_id) for user_id in set(user_ids) if user_id is not None
+    )
+
+
+def circle_user_ids(db: Session, circle_ids: Iterable[int]) -> Set[int]:
+    """Owners and members of the given circles: every user whose network includes them."""
+    circle_ids = set(circle_ids)
+    if not circle_ids:
+        return set()
+    statement = union_all(
+        select(CircleMember.member_id).where(CircleMember.circle_id.in_(circle_ids)),
+        select(Circle.owner_id).where(Circle.id.in_(circle_ids)),
+    )
+    return {user_id for (user_id,) in db.execute(statement) if user_id is not None}
+
+
+def invalidate_circle_safety_networks(db: Session, circle_ids: Iterable[int]) -> None:
+    invalidate_safety_networks(circle_user_ids(db, circle_ids))
@@ -0,0 +1,92 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from src.application.security.security_interfaces import PasswordHasherBusyError
+from src.config.settings import get_settings
+
+
+class PasswordHashingPool:
+    """
+    Runs bcrypt hashes and checks on a dedicated pool of `workers` threads.
+
+    bcrypt releases the GIL while it hashes, so threads run it on other cores while the
+    event loop keeps serving requests. At most `max_pending` calls are queued or running
+    per worker process: past that, `run` raises PasswordHasherBusyError at once instead
+    of letting a login burst queue up for seconds.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 32):
+        if workers <= 0:
+            raise ValueError("workers must be greater than 0.")
+        if max_pending < workers:
+            raise ValueError("max_pending must be at least workers.")
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._max_wait_ms = 0.0
+        self._counters = {"submitted": 0, "rejected": 0, "completed": 0}
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._counters["rejected"] += 1
+                raise PasswordHasherBusyError("Too many sign-in requests, please retry shortly.")
+            self._pending += 1
+            self._counters["submitted"] += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._call, fn, args, time.perf_counter()
+            )
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _call(self, fn: Callable[..., Any], args: tuple, submitted_at: float) -> Any:
+        with self._lock:
+            self._running += 1
+            self._max_wait_ms = max(self._max_wait_ms, (time.perf_counter() - submitted_at) * 1000)
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._counters["completed"] += 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._counters,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "max_wait_ms": round(self._max_wait_ms, 1),
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+            }
+
+
+_password_pool: Optional[PasswordHashingPool] = None
+_password_pool_lock = threading.Lock()
+
+
+def get_password_hashing_pool() -> PasswordHashingPool:
+    """Per-process pool shared by every BcryptPasswordHasher."""
+    global _password_pool
+    if _password_pool is None:
+        with _password_pool_lock:
+            if _password_pool is None:
+                settings = get_settings()
+                _password_pool = PasswordHashingPool(
+                    workers=settings.PASSWORD_HASH_WORKERS or min(4, os.cpu_count() or 1),
+                    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+                )
+    return _password_pool
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from jose import JWTError, jwt
@@ -20,6 +21,7 @@ from src.config.settings import get_settings
 from src.application.user.dto import TokenData
 from src.domain.user.repository_interface import IUserRepository
 from src.infrastructure.user.repository_impl import UserRepository
+from src.infrastructure.security.password_pool import PasswordHashingPool
 from src.shared.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -27,8 +29,9 @@ logger = get_logger(__name__)
 settings = get_settings()
 
 class BcryptPasswordHasher(IPasswordHasher):
-    def __init__(self):
+    def __init__(self, pool: Optional[PasswordHashingPool] = None):
         self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.pool = pool
 
     def verify_password(self, plain_password: str, password_hash: str) -> bool:
         return self.pwd_context.verify(plain_password, password_hash)
@@ -36,6 +39,16 @@ class BcryptPasswordHasher(IPasswordHasher):
     def get_password_hash(self, password: str) -> str:
         return self.pwd_context.hash(password)
 
+    async def verify_password_async(self, plain_password: str, password_hash: str) -> bool:
+        if self.pool is None:
+            return await asyncio.to_thread(self.verify_password, plain_password, password_hash)
+        return await self.pool.run(self.verify_password, plain_password, password_hash)
+
+    async def get_password_hash_async(self, password: str) -> str:
+        if self.pool is None:
+            return await asyncio.to_thread(self.get_password_hash, password)
+        return await self.pool.run(self.get_password_hash, password)
+
 class JwtTokenService(ITokenService):
     def __init__(self, user_repo: IUserRepository):
         self.user_repo = user_repo
@@ -49,10 +62,14 @@ class JwtTokenService(ITokenService):
         to_encode.update({"exp": expire})
         to_encode.update({"sub": str(data.get("sub"))})
         encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-        logger.info(f"Created access token for sub: {data.get('sub')}")
+        logger.debug(f"Created access token for sub: {data.get('sub')}")
         return encoded_jwt
 
-    def verify_token(self, db: Session, token: str) -> Optional[int]:
+    def verify_token(self, token: str) -> int:
+        """
+        Signature and expiry check only: no DB access. The caller loads the user (through
+        the principal cache) and rejects ids that no longer exist.
+        """
         credentials_exception = HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
@@ -61,7 +78,6 @@ class JwtTokenService(ITokenService):
         try:
             payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
             user_id_str: str = payload.get("sub")
-            logger.info(f"Token payload 'sub' (user_id_str): {user_id_str}")
             if user_id_str is None:
                 logger.warning("Token payload 'sub' is None.")
                 raise credentials_exception
@@ -69,17 +85,11 @@ class JwtTokenService(ITokenService):
             try:
                 user_id: int = int(user_id_str)
             except ValueError:
-                logger.error(f"Could not convert user_id_str '{user_id_str}' to int.")
+                logger.warning(f"Could not convert user_id_str '{user_id_str}' to int.")
                 raise credentials_exception
 
             token_data = TokenData(user_id=user_id)
         except JWTError as e:
-            logger.error(f"JWTError during token verification: {e}")
-            raise credentials_exception
-        
-        user = self.user_repo.get_user_by_id(db, token_data.user_id)
-        if user is None:
-            logger.warning(f"User with ID {token_data.user_id} not found in repository.")
+            logger.debug(f"JWTError during token verification: {e}")
             raise credentials_exception
-        logger.info(f"Token successfully validated for user ID: {user.id}")
-        return user.id
+        return token_data.user_id
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from src.infrastructure.database.sql.database import Base
 
 class SOSAlert(Base):
     __tablename__ = "sos_alerts"
+    __table_args__ = (
+        Index("ix_sos_alerts_lat_lon", "latitude", "longitude"),
+        Index("ix_sos_alerts_user_created_id", "user_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -2,6 +2,10 @@ from sqlalchemy.orm import Session
 from src.infrastructure.sos_alert.models import SOSAlert
 from src.domain.sos_alert.repository_interface import ISOSAlertRepository
 from src.domain.sos_alert.entities import SOSAlert as SOSAlertEntity
+from src.infrastructure.geo.spatial_index import get_spatial_index
+from src.infrastructure.geo.queries import find_within_box
+from src.domain.pagination.entities import PageRequest
+from src.infrastructure.database.sql.pagination import keyset_page
 from typing import List, Optional
 
 class SOSAlertRepository(ISOSAlertRepository):
@@ -11,8 +15,9 @@ class SOSAlertRepository(ISOSAlertRepository):
             return SOSAlertEntity.model_validate(db_sos_alert.__dict__)
         return None
 
-    def get_sos_alerts_by_user(self, db: Session, user_id: int) -> List[SOSAlertEntity]:
-        db_sos_alerts = db.query(SOSAlert).filter(SOSAlert.user_id == user_id).all()
+    def get_sos_alerts_by_user(self, db: Session, user_id: int, page: Optional[PageRequest] = None) -> List[SOSAlertEntity]:
+        query = db.query(SOSAlert).filter(SOSAlert.user_id == user_id)
+        db_sos_alerts = keyset_page(db, query, SOSAlert, page).all()
         return [SOSAlertEntity.model_validate(s.__dict__) for s in db_sos_alerts]
 
     def get_sos_alerts_by_user_ids(self, db: Session, user_ids: List[int]) -> List[SOSAlertEntity]:
@@ -28,16 +33,8 @@ class SOSAlertRepository(ISOSAlertRepository):
         longitude: float,
         radius: float
     ) -> List[SOSAlertEntity]:
-        lat_min = latitude - radius
-        lat_max = latitude + radius
-        lon_min = longitude - radius
-        lon_max = longitude + radius
-
-        db_sos_alerts = db.query(SOSAlert).filter(
-            SOSAlert.latitude.between(lat_min, lat_max),
-            SOSAlert.longitude.between(lon_min, lon_max)
-        ).all()
-        return [SOSAlertEntity.model_validate(s.__dict__) for s in db_sos_alerts]
+        pairs = find_within_box(db, SOSAlert, latitude, longitude, radius)
+        return [SOSAlertEntity.model_validate(s.__dict__) for s, _ in pairs]
 
     def create_sos_alert(self, db: Session, sos_alert_data: SOSAlertEntity) -> SOSAlertEntity:
         db_sos_alert = SOSAlert(
@@ -53,6 +50,7 @@ class SOSAlertRepository(ISOSAlertRepository):
         db.add(db_sos_alert)
         db.commit()
         db.refresh(db_sos_alert)
+        get_spatial_index(SOSAlert).add(db_sos_alert.id, db_sos_alert.latitude, db_sos_alert.longitude)
         return SOSAlertEntity.model_validate(db_sos_alert.__dict__)
 
     def update_sos_alert(self, db: Session, sos_alert_id: int, sos_alert_data: SOSAlertEntity) -> Optional[SOSAlertEntity]:
@@ -62,6 +60,7 @@ class SOSAlertRepository(ISOSAlertRepository):
                 setattr(db_sos_alert, key, value)
             db.commit()
             db.refresh(db_sos_alert)
+            get_spatial_index(SOSAlert).add(db_sos_alert.id, db_sos_alert.latitude, db_sos_alert.longitude)
             return SOSAlertEntity.model_validate(db_sos_alert.__dict__)
         return None
 
@@ -70,5 +69,6 @@ class SOSAlertRepository(ISOSAlertRepository):
         if db_sos_alert:
             db.delete(db_sos_alert)
             db.commit()
+            get_spatial_index(SOSAlert).discard(sos_alert_id)
             return True
         return False
@@ -1,10 +1,11 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from src.infrastructure.database.sql.database import Base
 
 class Trip(Base):
     __tablename__ = "trips"
+    __table_args__ = (Index("ix_trips_user_created_id", "user_id", "created_at", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     tripname = Column(String(255), nullable=False)
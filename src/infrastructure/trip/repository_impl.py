@@ -2,6 +2,8 @@ from sqlalchemy.orm import Session
 from src.infrastructure.trip.models import Trip
 from src.domain.trip.repository_interface import ITripRepository
 from src.domain.trip.entities import Trip as TripEntity
+from src.domain.pagination.entities import PageRequest
+from src.infrastructure.database.sql.pagination import keyset_page
 from typing import List, Optional
 
 class TripRepository(ITripRepository):
@@ -11,8 +13,9 @@ class TripRepository(ITripRepository):
             return TripEntity.model_validate(db_trip.__dict__)
         return None
 
-    def get_trips_by_user(self, db: Session, user_id: int) -> List[TripEntity]:
-        db_trips = db.query(Trip).filter(Trip.user_id == user_id).all()
+    def get_trips_by_user(self, db: Session, user_id: int, page: Optional[PageRequest] = None) -> List[TripEntity]:
+        query = db.query(Trip).filter(Trip.user_id == user_id)
+        db_trips = keyset_page(db, query, Trip, page).all()
         return [TripEntity.model_validate(t.__dict__) for t in db_trips]
 
     def create_trip(self, db: Session, trip_data: TripEntity) -> TripEntity:
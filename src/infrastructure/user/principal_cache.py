@@ -0,0 +1,52 @@
+import threading
+from typing import Iterable, Optional
+
+from src.application.cache.cache_interfaces import ICacheBackend
+from src.config.settings import get_settings
+from src.domain.user.entities import User as UserEntity
+from src.infrastructure.cache.memory_cache import InMemoryTTLCache
+
+_principal_cache: Optional[ICacheBackend] = None
+_principal_cache_lock = threading.Lock()
+
+
+def _cache_key(user_id: int) -> str:
+    return f"principal:{user_id}"
+
+
+def get_principal_cache() -> ICacheBackend:
+    """
+    Per-process cache of the authenticated user (the request principal) by user id.
+
+    Writes through UserRepository invalidate the entry; another worker's copy can stay
+    stale for up to PRINCIPAL_CACHE_TTL_SECONDS, so keep the TTL short.
+    """
+    global _principal_cache
+    if _principal_cache is None:
+        with _principal_cache_lock:
+            if _principal_cache is None:
+                settings = get_settings()
+                _principal_cache = InMemoryTTLCache(
+                    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+                    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+                )
+    return _principal_cache
+
+
+def get_cached_principal(user_id: int) -> Optional[UserEntity]:
+    if not get_settings().PRINCIPAL_CACHE_ENABLED:
+        return None
+    user = get_principal_cache().get(_cache_key(user_id))
+    # A copy, so a handler changing its current_user cannot change the cached one
+    return user.model_copy() if user is not None else None
+
+
+def cache_principal(user: UserEntity) -> None:
+    if get_settings().PRINCIPAL_CACHE_ENABLED:
+        get_principal_cache().set(_cache_key(user.id), user.model_copy())
+
+
+def invalidate_principals(user_ids: Iterable[int]) -> None:
+    get_principal_cache().delete_many(
+        _cache_key(user_id) for user_id in set(user_ids) if user_id is not None
+    )
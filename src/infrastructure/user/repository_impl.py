@@ -4,22 +4,30 @@ from sqlalchemy.orm import Session
 from src.infrastructure.user.models import User
 from src.domain.user.repository_interface import IUserRepository
 from src.domain.user.entities import User as UserEntity
+from src.infrastructure.user.principal_cache import invalidate_principals
 from typing import List, Optional
 from bcrypt import hashpw, gensalt
 from datetime import datetime
 
 class UserRepository(IUserRepository):
-    def __init__(self, db: Session):
+    def __init__(self, db: Optional[Session] = None):
+        # Kept for existing callers; every method uses the session it is given
         self.db = db
 
     def get_user_by_id(self, db: Session, user_id: int) -> Optional[UserEntity]:
-        db_user = self.db.query(User).filter(User.id == user_id).first()
+        db_user = db.query(User).filter(User.id == user_id).first()
         if db_user:
             return UserEntity.model_validate(db_user.__dict__)
         return None
 
+    def get_users_by_ids(self, db: Session, user_ids: List[int]) -> List[UserEntity]:
+        if not user_ids:
+            return []
+        db_users = db.query(User).filter(User.id.in_(set(user_ids))).all()
+        return [UserEntity.model_validate(u.__dict__) for u in db_users]
+
     def get_user_by_username(self, db: Session, username: str) -> Optional[UserEntity]:
-        db_user = self.db.query(User).filter(User.username == username).first()
+        db_user = db.query(User).filter(User.username == username).first()
         if db_user:
             return UserEntity.model_validate(db_user.__dict__)
         return None
@@ -36,28 +44,30 @@ class UserRepository(IUserRepository):
             disabled=user_data.disabled,
             created_at=user_data.created_at
         )
-        self.db.add(db_user)
-        self.db.commit()
-        self.db.refresh(db_user)
+        db.add(db_user)
+        db.commit()
+        db.refresh(db_user)
         return UserEntity.model_validate(db_user.__dict__)
 
     def update_user(self, db: Session, user_id: int, user_data: UserEntity) -> Optional[UserEntity]:
-        db_user = self.db.query(User).filter(User.id == user_id).first()
+        db_user = db.query(User).filter(User.id == user_id).first()
         if db_user:
             update_data = user_data.model_dump(exclude_unset=True)
             if "hashed_password" in update_data:
                 update_data["hashed_password"] = hashpw(update_data["hashed_password"].encode('utf-8'), gensalt()).decode('utf-8')
             for key, value in update_data.items():
                 setattr(db_user, key, value)
-            self.db.commit()
-            self.db.refresh(db_user)
+            db.commit()
+            invalidate_principals([user_id])
+            db.refresh(db_user)
             return UserEntity.model_validate(db_user.__dict__)
         return None
 
     def delete_user(self, db: Session, user_id: int) -> bool:
-        db_user = self.db.query(User).filter(User.id == user_id).first()
+        db_user = db.query(User).filter(User.id == user_id).first()
         if db_user:
-            self.db.delete(db_user)
+            db.delete(db_user)
             db.commit()
+            invalidate_principals([user_id])
             return True
         return False
@@ -1,10 +1,11 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text, Index
 from sqlalchemy.sql import func
 from src.infrastructure.database.sql.database import Base
 
 
 class UserReportIncident(Base):
     __tablename__ = "user_report_incidents"
+    __table_args__ = (Index("ix_user_report_incidents_lat_lon", "latitude", "longitude"),)
 
     id = Column(Integer, primary_key=True, index=True)
     reporter_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
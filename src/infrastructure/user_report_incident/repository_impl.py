@@ -4,6 +4,8 @@ from sqlalchemy.orm import Session
 from src.domain.user_report_incident.entities import UserReportIncident as UserReportIncidentEntity
 from src.domain.user_report_incident.repository_interface import IUserReportIncidentRepository
 from src.infrastructure.user_report_incident.models import UserReportIncident
+from src.infrastructure.geo.spatial_index import get_spatial_index
+from src.infrastructure.geo.queries import find_within_box
 
 
 class UserReportIncidentRepository(IUserReportIncidentRepository):
@@ -21,6 +23,7 @@ class UserReportIncidentRepository(IUserReportIncidentRepository):
         db.add(db_incident)
         db.commit()
         db.refresh(db_incident)
+        get_spatial_index(UserReportIncident).add(db_incident.id, db_incident.latitude, db_incident.longitude)
         return UserReportIncidentEntity.model_validate(db_incident.__dict__)
 
     def get_within_radius(
@@ -30,15 +33,8 @@ class UserReportIncidentRepository(IUserReportIncidentRepository):
         longitude: float,
         radius: float
     ) -> List[UserReportIncidentEntity]:
-        lat_min = latitude - radius
-        lat_max = latitude + radius
-        lon_min = longitude - radius
-        lon_max = longitude + radius
-
-        incidents = db.query(UserReportIncident).filter(
+        pairs = find_within_box(
+            db, UserReportIncident, latitude, longitude, radius,
             UserReportIncident.status == "active",
-            UserReportIncident.latitude.between(lat_min, lat_max),
-            UserReportIncident.longitude.between(lon_min, lon_max),
-        ).all()
-        return [UserReportIncidentEntity.model_validate(i.__dict__) for i in incidents]
-
+        )
+        return [UserReportIncidentEntity.model_validate(i.__dict__) for i, _ in pairs]
@@ -6,7 +6,8 @@ from src.application.admin_log.dto import AdminLogCreate, AdminLogUpdate, AdminL
 from src.application.admin_log.use_cases import AdminLogUseCases
 from src.infrastructure.admin_log.repository_impl import AdminLogRepository
 from src.infrastructure.database.sql.database import get_db
-from src.application.dependencies import get_admin_log_use_cases
+from src.application.dependencies import get_admin_log_use_cases, get_page_request
+from src.domain.pagination.entities import PageRequest
 
 router = APIRouter()
 
@@ -33,10 +34,12 @@ def get_admin_log_route(
 @router.get("/admins/{admin_id}/admin_logs", response_model=List[AdminLogInDB])
 def get_admin_logs_by_admin_route(
     admin_id: int,
+    page: PageRequest = Depends(get_page_request),
     admin_log_use_cases: AdminLogUseCases = Depends(get_admin_log_use_cases),
     db: Session = Depends(get_db)
 ):
-    admin_logs = admin_log_use_cases.get_admin_logs_by_admin(db, admin_id)
+    """Newest first; pass the last id as `after` for the next page."""
+    admin_logs = admin_log_use_cases.get_admin_logs_by_admin(db, admin_id, page)
     return [AdminLogInDB.model_validate(log) for log in admin_logs]
 
 @router.put("/admin_logs/{admin_log_id}", response_model=AdminLogInDB)
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from typing import Annotated
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.user.auth_use_cases import (
     LoginUserUseCase,
@@ -9,12 +9,13 @@ from src.application.user.auth_use_cases import (
     LogoutUserUseCase
 )
 from src.application.user.dto import UserLoginDTO, UserRegisterDTO, AuthTokenDTO, UserDTO
+from src.application.security.security_interfaces import PasswordHasherBusyError
 from src.application.dependencies import (
     provide_login_user_use_case,
     provide_register_user_use_case,
     provide_logout_user_use_case,
     get_current_user,
-    get_db_session
+    get_async_db_session
 )
 from src.domain.user.entities import User as UserEntity
 
@@ -32,12 +33,18 @@ async def read_users_me(
 @router.post("/register", response_model=UserDTO, status_code=status.HTTP_201_CREATED)
 async def register(
     user_data: UserRegisterDTO,
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     register_use_case: RegisterUserUseCase = Depends(provide_register_user_use_case)
 ):
     try:
-        new_user = register_use_case.execute(db, user_data)
+        new_user = await register_use_case.execute(db, user_data)
         return new_user
+    except PasswordHasherBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after_seconds)},
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -50,13 +57,19 @@ async def register(
 
 async def login(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     login_use_case: LoginUserUseCase = Depends(provide_login_user_use_case)
 ):
     user_login_dto = UserLoginDTO(username=form_data.username, password=form_data.password)
     try:
-        token = login_use_case.execute(db, user_login_dto)
+        token = await login_use_case.execute(db, user_login_dto)
         return token
+    except PasswordHasherBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after_seconds)},
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -67,8 +80,8 @@ async def login(
 @router.post("/logout", status_code=status.HTTP_200_OK)
 async def logout(
     current_user: UserEntity = Depends(get_current_user),
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     logout_use_case: LogoutUserUseCase = Depends(provide_logout_user_use_case)
 ):
-    logout_use_case.execute(db, current_user.id)
+    await db.run_sync(logout_use_case.execute, current_user.id)
     return {"message": "Successfully logged out"}
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List, Annotated
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.application.dependencies import (
     get_current_user,
-    get_db_session,
+    get_async_db_session,
     get_circle_use_cases,
     get_circle_member_use_cases
 )
@@ -20,7 +20,7 @@ router = APIRouter()
 async def create_circle(
     circle_data: CircleCreate,
     current_user: Annotated[UserEntity, Depends(get_current_user)],
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     circle_use_cases: CircleUseCases = Depends(get_circle_use_cases)
 ):
     """
@@ -29,7 +29,7 @@ async def create_circle(
     Any existing active circles for the user will be set to "inactive".
     """
     try:
-        new_circle = circle_use_cases.create_circle(db, circle_data, current_user.id)
+        new_circle = await db.run_sync(circle_use_cases.create_circle, circle_data, current_user.id)
         return new_circle
     except ValueError as e:
         raise HTTPException(
@@ -40,14 +40,14 @@ async def create_circle(
 @router.get("/circles", response_model=List[CircleInDB])
 async def get_my_circles(
     current_user: Annotated[UserEntity, Depends(get_current_user)],
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     circle_use_cases: CircleUseCases = Depends(get_circle_use_cases)
 ):
     """
     Get all circles owned by the current authenticated user.
     """
     try:
-        circles = circle_use_cases.get_circles_by_owner(db, current_user.id)
+        circles = await db.run_sync(circle_use_cases.get_circles_by_owner, current_user.id)
         return circles
     except Exception as e:
         raise HTTPException(
@@ -59,14 +59,14 @@ async def get_my_circles(
 async def get_specific_circle(
     circle_id: int,
     current_user: Annotated[UserEntity, Depends(get_current_user)],
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     circle_use_cases: CircleUseCases = Depends(get_circle_use_cases)
 ):
     """
     Get details of a specific circle.
     Only the owner can view the circle.
     """
-    circle = circle_use_cases.get_circle(db, circle_id)
+    circle = await db.run_sync(circle_use_cases.get_circle, circle_id)
     if not circle:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Circle not found")
     if circle.owner_id != current_user.id:
@@ -78,20 +78,20 @@ async def update_circle(
     circle_id: int,
     circle_update: CircleUpdate,
     current_user: Annotated[UserEntity, Depends(get_current_user)],
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     circle_use_cases: CircleUseCases = Depends(get_circle_use_cases)
 ):
     """
     Update an existing circle.
     Only the owner can update the circle.
     """
-    existing_circle = circle_use_cases.get_circle(db, circle_id)
+    existing_circle = await db.run_sync(circle_use_cases.get_circle, circle_id)
     if not existing_circle:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Circle not found")
     if existing_circle.owner_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to update this circle")
     
-    updated_circle = circle_use_cases.update_circle(db, circle_id, circle_update)
+    updated_circle = await db.run_sync(circle_use_cases.update_circle, circle_id, circle_update)
     if not updated_circle:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Circle not found after update attempt")
     return updated_circle
@@ -100,20 +100,20 @@ async def update_circle(
 async def delete_circle(
     circle_id: int,
     current_user: Annotated[UserEntity, Depends(get_current_user)],
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     circle_use_cases: CircleUseCases = Depends(get_circle_use_cases)
 ):
     """
     Delete a circle.
     Only the owner can delete the circle.
     """
-    existing_circle = circle_use_cases.get_circle(db, circle_id)
+    existing_circle = await db.run_sync(circle_use_cases.get_circle, circle_id)
     if not existing_circle:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Circle not found")
     if existing_circle.owner_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to delete this circle")
     
-    if not circle_use_cases.delete_circle(db, circle_id):
+    if not await db.run_sync(circle_use_cases.delete_circle, circle_id):
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to delete circle")
 
 @router.post("/circles/{circle_id}/members", response_model=CircleMemberInDB, status_code=status.HTTP_201_CREATED)
@@ -121,7 +121,7 @@ async def add_member_to_circle(
     circle_id: int,
     member_data: CircleMemberCreate,
     current_user: Annotated[UserEntity, Depends(get_current_user)],
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     circle_use_cases: CircleUseCases = Depends(get_circle_use_cases),
     circle_member_use_cases: CircleMemberUseCases = Depends(get_circle_member_use_cases)
 ):
@@ -129,14 +129,14 @@ async def add_member_to_circle(
     Add a member to a specific circle.
     Only the owner can add members.
     """
-    existing_circle = circle_use_cases.get_circle(db, circle_id)
+    existing_circle = await db.run_sync(circle_use_cases.get_circle, circle_id)
     if not existing_circle:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Circle not found")
     if existing_circle.owner_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to add members to this circle")
     
     try:
-        new_member = circle_member_use_cases.create_circle_member(db, member_data)
+        new_member = await db.run_sync(circle_member_use_cases.create_circle_member, member_data)
         return new_member
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -148,7 +148,7 @@ async def remove_member_from_circle(
     circle_id: int,
     member_id: int,
     current_user: Annotated[UserEntity, Depends(get_current_user)],
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     circle_use_cases: CircleUseCases = Depends(get_circle_use_cases),
     circle_member_use_cases: CircleMemberUseCases = Depends(get_circle_member_use_cases)
 ):
@@ -156,20 +156,20 @@ async def remove_member_from_circle(
     Remove a member from a specific circle.
     Only the owner can remove members.
     """
-    existing_circle = circle_use_cases.get_circle(db, circle_id)
+    existing_circle = await db.run_sync(circle_use_cases.get_circle, circle_id)
     if not existing_circle:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Circle not found")
     if existing_circle.owner_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to remove members from this circle")
     
     # Find the CircleMember entity to get its ID
-    circle_members = circle_member_use_cases.get_circle_members_by_circle(db, circle_id)
+    circle_members = await db.run_sync(circle_member_use_cases.get_circle_members_by_circle, circle_id)
     member_to_delete = next((cm for cm in circle_members if cm.member_id == member_id), None)
 
     if not member_to_delete:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Member not found in circle")
 
-    if not circle_member_use_cases.delete_circle_member(db, member_to_delete.id):
+    if not await db.run_sync(circle_member_use_cases.delete_circle_member, member_to_delete.id):
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to delete member from circle")
 
 # ... import traceback
@@ -178,19 +178,19 @@ async def remove_member_from_circle(
 async def get_circle_members(
     circle_id: int,
     current_user: Annotated[UserEntity, Depends(get_current_user)],
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     circle_use_cases: CircleUseCases = Depends(get_circle_use_cases) 
 ):
-    existing_circle = circle_use_cases.get_circle(db, circle_id)
+    existing_circle = await db.run_sync(circle_use_cases.get_circle, circle_id)
     if not existing_circle:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Circle not found")
     
     is_owner = existing_circle.owner_id == current_user.id
-    is_member = circle_use_cases.is_user_in_circle(db, circle_id, current_user.id)
+    is_member = await db.run_sync(circle_use_cases.is_user_in_circle, circle_id, current_user.id)
     
     if not (is_owner or is_member):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
 
-    users = circle_use_cases.get_circle_members_as_users(db, circle_id)
+    users = await db.run_sync(circle_use_cases.get_circle_members_as_users, circle_id)
     
     return [UserDTO.from_orm(user) for user in users]
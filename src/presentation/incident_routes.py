@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from typing import Annotated
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.application.dependencies import get_current_user, get_db_session, get_incidents_use_cases
+from src.application.dependencies import get_current_user, get_async_db_session, get_incidents_use_cases
 from src.application.incident.dto import GetIncidentsRequestDTO, GetIncidentsResponseDTO
 from src.application.incident.use_cases import GetIncidentsUseCase
 from src.domain.user.entities import User as UserEntity
@@ -13,6 +13,9 @@ from src.application.incident.use_cases import DeleteIncidentUseCase
 from src.application.dependencies import get_create_incident_use_case
 from src.application.incident.dto import IncidentCreateDTO, IncidentDTO
 from src.application.incident.use_cases import CreateIncidentUseCase
+from src.application.dependencies import get_create_incidents_batch_use_case
+from src.application.incident.dto import IncidentBatchCreateDTO, IncidentBatchResponseDTO
+from src.application.incident.use_cases import CreateIncidentsBatchUseCase
     
 router = APIRouter()
 
@@ -23,7 +26,7 @@ async def get_incidents(
     latitude: float = Query(...),
     longitude: float = Query(...),
     radius: float = Query(..., gt=0),
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     use_cases: GetIncidentsUseCase = Depends(get_incidents_use_cases),
 ):
     """
@@ -39,7 +42,7 @@ async def get_incidents(
             radius=radius,
             user_id=current_user.id
         )
-        return use_cases.execute(db, request_dto)
+        return await db.run_sync(use_cases.execute, request_dto)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
@@ -54,14 +57,14 @@ async def get_incidents(
 async def delete_incident(
     incident_id: int,
     current_user: Annotated[UserEntity, Depends(get_current_user)],
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     use_case: DeleteIncidentUseCase = Depends(get_delete_incident_use_case),
 ):
     """
     Delete an incident by ID.
     """
     try:
-        deleted = use_case.execute(db, incident_id)
+        deleted = await db.run_sync(use_case.execute, incident_id)
         if not deleted:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Incident not found")
     except HTTPException:
@@ -77,15 +80,35 @@ async def delete_incident(
 async def create_incident(
     incident_data: IncidentCreateDTO,
     current_user: Annotated[UserEntity, Depends(get_current_user)],
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     use_case: CreateIncidentUseCase = Depends(get_create_incident_use_case),
 ):
     """
     Create a new incident report.
     """
     try:
-        return use_case.execute(db, incident_data)
+        return await db.run_sync(use_case.execute, incident_data)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.post("/incidents/batch", response_model=IncidentBatchResponseDTO)
+async def create_incidents_batch(
+    batch_data: IncidentBatchCreateDTO,
+    current_user: Annotated[UserEntity, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_async_db_session),
+    use_case: CreateIncidentsBatchUseCase = Depends(get_create_incidents_batch_use_case),
+):
+    """
+    Create many incident reports in one transaction (up to INCIDENT_BATCH_MAX_ITEMS).
+    Returns a result per item, in request order: invalid items are reported and skipped.
+    """
+    try:
+        return await db.run_sync(use_case.execute, batch_data)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logging.exception("Error creating incident batch")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Depends
+
+from src.application.ai.prewarm import get_report_prewarm_scheduler
+from src.application.dependencies import require_metrics_token
+from src.application.news_incident.extraction_jobs import get_news_extraction_jobs
+from src.application.notification.retention import get_notification_retention_job
+from src.infrastructure.ai.gemini_gateway import get_ai_gateway
+from src.infrastructure.ai.report_cache import get_report_cache
+from src.infrastructure.events.hub import get_event_hub
+from src.infrastructure.geo.forward_geocoder import get_forward_geocoder
+from src.infrastructure.geo.reverse_geocoder import get_reverse_geocoder_stats
+from src.infrastructure.jobs.worker_pool import get_job_queue
+from src.infrastructure.safety_network.resolver_impl import get_safety_network_cache
+from src.infrastructure.security.password_pool import get_password_hashing_pool
+from src.infrastructure.user.principal_cache import get_principal_cache
+
+router = APIRouter()
+
+@router.get("/metrics", dependencies=[Depends(require_metrics_token)])
+def get_metrics_route():
+    """Per-worker counters (each uvicorn worker reports its own numbers)."""
+    return {
+        "safety_network_cache": get_safety_network_cache().stats(),
+        "principal_cache": get_principal_cache().stats(),
+        "password_hashing": get_password_hashing_pool().stats(),
+        "jobs": get_job_queue().stats(),
+        "stream": get_event_hub().stats(),
+        "ai": get_ai_gateway().stats(),
+        "ai_report_cache": get_report_cache().stats(),
+        "ai_prewarm": get_report_prewarm_scheduler().stats(),
+        "geocoder": get_forward_geocoder().stats(),
+        "reverse_geocoder": get_reverse_geocoder_stats(),
+        "news_extraction": get_news_extraction_jobs().stats(),
+        "notification_retention": get_notification_retention_job().stats(),
+    }
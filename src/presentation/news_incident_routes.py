@@ -1,9 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from typing import Annotated, List
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.application.dependencies import get_current_user, get_db_session, get_news_incident_use_cases
-from src.application.news_incident.dto import NewsIncidentExtractRequest, NewsIncidentInDB
+from src.application.dependencies import (
+    get_current_user,
+    get_async_db_session,
+    get_news_extraction_jobs_impl,
+    get_news_incident_use_cases,
+)
+from src.application.news_incident.dto import NewsExtractionJob, NewsIncidentExtractRequest, NewsIncidentInDB
+from src.application.news_incident.extraction_jobs import NewsExtractionJobManager
 from src.application.news_incident.use_cases import NewsIncidentUseCases
 from src.domain.user.entities import User as UserEntity
 
@@ -11,23 +17,35 @@ from src.domain.user.entities import User as UserEntity
 router = APIRouter()
 
 
-@router.post("/news-incidents/extract", response_model=List[NewsIncidentInDB], status_code=status.HTTP_201_CREATED)
+@router.post("/news-incidents/extract", response_model=NewsExtractionJob, status_code=status.HTTP_202_ACCEPTED)
 async def extract_news_incidents(
     body: NewsIncidentExtractRequest,
     current_user: Annotated[UserEntity, Depends(get_current_user)],
-    db: Session = Depends(get_db_session),
-    use_cases: NewsIncidentUseCases = Depends(get_news_incident_use_cases),
+    jobs: NewsExtractionJobManager = Depends(get_news_extraction_jobs_impl),
 ):
     """
-    Extract negative incidents from news sources (AI + search), geocode to lat/long, and store them.
+    Queue an extraction of negative incidents from news sources (AI + search), geocoded to lat/long and stored.
+    Returns the job right away; poll GET /news-incidents/jobs/{job_id} for progress and results.
+    A request for the same (query, days) as a job still queued or running returns that job.
     Requires GEOAPIFY_KEY and GEMINI_API_KEY configured on the server.
     """
-    try:
-        return use_cases.extract_and_store(db, query=body.query, days=body.days, max_items=body.max_items)
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    submitted = jobs.submit(query=body.query, days=body.days, max_items=body.max_items)
+    if submitted is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Extraction queue is full, try again later.")
+    job, _ = submitted
+    return job
+
+
+@router.get("/news-incidents/jobs/{job_id}", response_model=NewsExtractionJob)
+async def get_news_extraction_job(
+    job_id: str,
+    current_user: Annotated[UserEntity, Depends(get_current_user)],
+    jobs: NewsExtractionJobManager = Depends(get_news_extraction_jobs_impl),
+):
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Extraction job not found.")
+    return job
 
 
 @router.get("/news-incidents", response_model=List[NewsIncidentInDB])
@@ -36,11 +54,13 @@ async def get_news_incidents(
     latitude: float = Query(...),
     longitude: float = Query(...),
     radius: float = Query(0.5, gt=0),
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     use_cases: NewsIncidentUseCases = Depends(get_news_incident_use_cases),
 ):
     try:
-        return use_cases.get_news_incidents_within_radius(db, latitude=latitude, longitude=longitude, radius=radius)
+        return await db.run_sync(
+            use_cases.get_news_incidents_within_radius, latitude=latitude, longitude=longitude, radius=radius
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
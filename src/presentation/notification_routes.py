@@ -1,67 +1,90 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from src.application.notification.dto import NotificationCreate, NotificationUpdate, NotificationInDB
+from src.application.notification.dto import (
+    NotificationCreate, NotificationUpdate, NotificationInDB,
+    NotificationMarkReadDTO, NotificationMarkReadResultDTO, NotificationUnreadCountDTO,
+)
 from src.application.notification.use_cases import NotificationUseCases
 from src.infrastructure.notification.repository_impl import NotificationRepository
-from src.infrastructure.database.sql.database import get_db
-from src.application.dependencies import get_notification_use_cases
+from src.application.dependencies import get_async_db_session, get_notification_use_cases, get_current_user, get_page_request
+from src.domain.user.entities import User as UserEntity
+from src.domain.pagination.entities import PageRequest
 
 router = APIRouter()
 
 @router.post("/notifications", response_model=NotificationInDB, status_code=status.HTTP_201_CREATED)
-def create_notification_route(
+async def create_notification_route(
     notification_data: NotificationCreate,
     notification_use_cases: NotificationUseCases = Depends(get_notification_use_cases),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db_session)
 ):
-    notification = notification_use_cases.create_notification(db, notification_data)
+    notification = await db.run_sync(notification_use_cases.create_notification, notification_data)
     return NotificationInDB.model_validate(notification.__dict__)
 
+# Declared before /notifications/{notification_id} so the literal paths are matched first
+@router.get("/notifications/unread_count", response_model=NotificationUnreadCountDTO)
+async def get_unread_count_route(
+    current_user: UserEntity = Depends(get_current_user),
+    notification_use_cases: NotificationUseCases = Depends(get_notification_use_cases),
+    db: AsyncSession = Depends(get_async_db_session)
+):
+    return NotificationUnreadCountDTO(unread_count=await db.run_sync(notification_use_cases.count_unread, current_user.id))
+
+@router.post("/notifications/mark_read", response_model=NotificationMarkReadResultDTO)
+async def mark_notifications_read_route(
+    dto: NotificationMarkReadDTO,
+    current_user: UserEntity = Depends(get_current_user),
+    notification_use_cases: NotificationUseCases = Depends(get_notification_use_cases),
+    db: AsyncSession = Depends(get_async_db_session)
+):
+    """Marks `ids`, or `up_to` and every older notification, of the current user as read."""
+    try:
+        return await db.run_sync(notification_use_cases.mark_read, current_user.id, dto)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
 @router.get("/notifications/{notification_id}", response_model=NotificationInDB)
-def get_notification_route(
+async def get_notification_route(
     notification_id: int,
     notification_use_cases: NotificationUseCases = Depends(get_notification_use_cases),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db_session)
 ):
-    notification = notification_use_cases.get_notification(db, notification_id)
+    notification = await db.run_sync(notification_use_cases.get_notification, notification_id)
     if not notification:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Notification not found")
     return NotificationInDB.model_validate(notification.__dict__)
 
-from src.application.dependencies import get_current_user
-from src.domain.user.entities import User as UserEntity
-
-# ... (rest of the file)
-
 @router.get("/notifications", response_model=List[NotificationInDB])
-def get_notifications_by_user_route(
+async def get_notifications_by_user_route(
     current_user: UserEntity = Depends(get_current_user),
+    page: PageRequest = Depends(get_page_request),
     notification_use_cases: NotificationUseCases = Depends(get_notification_use_cases),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db_session)
 ):
-    notifications = notification_use_cases.get_notifications_by_user(db, current_user.id)
+    """Newest first; pass the last id as `after` for the next page."""
+    notifications = await db.run_sync(notification_use_cases.get_notifications_by_user, current_user.id, page)
     return [NotificationInDB.model_validate(n.__dict__) for n in notifications]
 
 @router.put("/notifications/{notification_id}", response_model=NotificationInDB)
-def update_notification_route(
+async def update_notification_route(
     notification_id: int,
     notification_update: NotificationUpdate,
     notification_use_cases: NotificationUseCases = Depends(get_notification_use_cases),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db_session)
 ):
-    notification = notification_use_cases.update_notification(db, notification_id, notification_update)
+    notification = await db.run_sync(notification_use_cases.update_notification, notification_id, notification_update)
     if not notification:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Notification not found")
     return NotificationInDB.model_validate(notification.__dict__)
 
 @router.delete("/notifications/{notification_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_notification_route(
+async def delete_notification_route(
     notification_id: int,
     notification_use_cases: NotificationUseCases = Depends(get_notification_use_cases),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db_session)
 ):
-    if not notification_use_cases.delete_notification(db, notification_id):
+    if not await db.run_sync(notification_use_cases.delete_notification, notification_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Notification not found")
     return
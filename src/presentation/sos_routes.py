@@ -1,14 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from typing import List, Annotated
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.application.dependencies import (
     get_current_user,
-    get_db_session,
+    get_async_db_session,
     get_sos_alert_use_cases, # Changed from provide_sos_alert_use_cases
-    get_friend_use_cases, # Changed from provide_friend_use_case
-    get_notification_use_cases, # Changed from provide_notification_use_case
     get_circle_use_cases, # Changed from provide_circle_use_cases
-    get_user_report_incident_use_cases
+    get_user_report_incident_use_cases,
+    get_page_request
 )
 from src.application.sos_alert.dto import (
     SOSAlertCreate,
@@ -19,11 +18,9 @@ from src.application.sos_alert.dto import (
 from src.application.sos_alert.use_cases import SOSAlertUseCases # Changed from SOSService
 from src.application.user_report_incident.use_cases import UserReportIncidentUseCases
 from src.application.user_report_incident.dto import UserReportIncidentCreate, UserReportIncidentInDB
-from src.application.friend.use_cases import FriendUseCases
-from src.application.notification.use_cases import NotificationUseCases
-from src.application.notification.dto import NotificationCreate
 from src.application.circle.use_cases import CircleUseCases # Added CircleUseCases
 from src.domain.user.entities import User as UserEntity
+from src.domain.pagination.entities import PageRequest
 from datetime import datetime
 
 router = APIRouter()
@@ -32,7 +29,7 @@ router = APIRouter()
 async def send_sos_alert(
     sos_data: SOSAlertCreate,
     current_user: Annotated[UserEntity, Depends(get_current_user)],
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     sos_alert_use_cases: SOSAlertUseCases = Depends(get_sos_alert_use_cases), # Changed dependency
     circle_use_cases: CircleUseCases = Depends(get_circle_use_cases) # Changed dependency
 ):
@@ -48,7 +45,7 @@ async def send_sos_alert(
             )
         
         # Get the user's active circle
-        active_circles = circle_use_cases.get_circles_by_owner(db, current_user.id)
+        active_circles = await db.run_sync(circle_use_cases.get_circles_by_owner, current_user.id)
         active_circle_id = None
         for circle in active_circles:
             if circle.status == "active":
@@ -64,7 +61,7 @@ async def send_sos_alert(
         # Update sos_data with the active circle_id
         sos_data.circle_id = active_circle_id
 
-        new_sos_alert = sos_alert_use_cases.create_sos_alert(db, sos_data) # Changed method call
+        new_sos_alert = await db.run_sync(sos_alert_use_cases.create_sos_alert, sos_data) # Changed method call
         return new_sos_alert
     except ValueError as e:
         raise HTTPException(
@@ -77,10 +74,8 @@ async def update_sos_alert_status(
     alert_id: int,
     sos_update: SOSAlertUpdate,
     current_user: Annotated[UserEntity, Depends(get_current_user)],
-    db: Session = Depends(get_db_session),
-    sos_alert_use_cases: SOSAlertUseCases = Depends(get_sos_alert_use_cases), # Changed dependency
-    friend_use_case: FriendUseCases = Depends(get_friend_use_cases), # Changed dependency
-    notification_use_case: NotificationUseCases = Depends(get_notification_use_cases) # Changed dependency
+    db: AsyncSession = Depends(get_async_db_session),
+    sos_alert_use_cases: SOSAlertUseCases = Depends(get_sos_alert_use_cases) # Changed dependency
 ):
     """
     Update the status of an SOS alert.
@@ -88,7 +83,7 @@ async def update_sos_alert_status(
     """
     try:
         # First, get the existing SOS alert to check ownership
-        existing_alert = sos_alert_use_cases.get_sos_alert(db, alert_id) # Changed method call
+        existing_alert = await db.run_sync(sos_alert_use_cases.get_sos_alert, alert_id) # Changed method call
         if not existing_alert:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -108,7 +103,7 @@ async def update_sos_alert_status(
         elif sos_update.status != "resolved" and existing_alert.status == "resolved":
             sos_update.resolved_at = None # Clear resolved_at if status changes from resolved
 
-        updated_alert = sos_alert_use_cases.update_sos_alert(db, alert_id, sos_update) # Changed method call
+        updated_alert = await db.run_sync(sos_alert_use_cases.update_sos_alert, alert_id, sos_update) # Changed method call
         if not updated_alert:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -117,16 +112,7 @@ async def update_sos_alert_status(
 
         # If status is resolved, notify friends
         if updated_alert.status == "resolved":
-            friends = friend_use_case.get_friends_by_user_id(db, updated_alert.user_id)
-            for friend in friends:
-                notification_data = NotificationCreate(
-                    user_id=friend.id,
-                    title="SOS Alert Resolved",
-                    message=f"Your friend {current_user.username}'s SOS alert has been resolved.",
-                    type="SOS_RESOLVED",
-                    is_read=False
-                )
-                notification_use_case.create_notification(db, notification_data)
+            await db.run_sync(sos_alert_use_cases.notify_sos_resolved, updated_alert, current_user.username)
 
         return updated_alert
     except ValueError as e:
@@ -138,14 +124,15 @@ async def update_sos_alert_status(
 @router.get("/sos/my_alerts", response_model=List[SOSAlertInDB])
 async def get_my_sos_alerts(
     current_user: Annotated[UserEntity, Depends(get_current_user)],
-    db: Session = Depends(get_db_session),
+    page: PageRequest = Depends(get_page_request),
+    db: AsyncSession = Depends(get_async_db_session),
     sos_alert_use_cases: SOSAlertUseCases = Depends(get_sos_alert_use_cases) # Changed dependency
 ):
     """
-    Get all SOS alerts for the current authenticated user.
+    Get the SOS alerts of the current authenticated user, newest first; pass the last id as `after` for the next page.
     """
     try:
-        alerts = sos_alert_use_cases.get_sos_alerts_by_user(db, current_user.id) # Changed method call
+        alerts = await db.run_sync(sos_alert_use_cases.get_sos_alerts_by_user, current_user.id, page) # Changed method call
         return alerts
     except Exception as e:
         raise HTTPException(
@@ -156,14 +143,14 @@ async def get_my_sos_alerts(
 async def report_incident(
     body: UserReportIncidentCreate,
     current_user: Annotated[UserEntity, Depends(get_current_user)],
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     user_report_incident_use_cases: UserReportIncidentUseCases = Depends(get_user_report_incident_use_cases),
 ):
     """
     User reports an on-map warning (P1).
     """
     try:
-        return user_report_incident_use_cases.create_report(db, reporter_id=current_user.id, data=body)
+        return await db.run_sync(user_report_incident_use_cases.create_report, reporter_id=current_user.id, data=body)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
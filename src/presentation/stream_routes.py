@@ -0,0 +1,128 @@
+import asyncio
+import json
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from src.application.dependencies import authenticate_stream_token
+from src.config.settings import get_settings
+from src.infrastructure.events.hub import Subscription, get_event_hub
+
+router = APIRouter()
+settings = get_settings()
+
+
+def _subscribe(user_id: int, latitude: Optional[float], longitude: Optional[float], radius_km: Optional[float]) -> Subscription:
+    hub = get_event_hub()
+    subscription = hub.subscribe(user_id)
+    if latitude is not None and longitude is not None:
+        hub.update_location(subscription, latitude, longitude, radius_km or settings.STREAM_DEFAULT_RADIUS_KM)
+    return subscription
+
+
+async def _next_event(subscription: Subscription) -> Optional[dict]:
+    """Next event, or None when the heartbeat interval passes without one."""
+    try:
+        return await asyncio.wait_for(subscription.get(), timeout=settings.STREAM_HEARTBEAT_SECONDS)
+    except asyncio.TimeoutError:
+        return None
+
+
+@router.websocket("/stream")
+async def stream_websocket(
+    websocket: WebSocket,
+    token: str = Query(...),
+    latitude: Optional[float] = Query(None),
+    longitude: Optional[float] = Query(None),
+    radius_km: Optional[float] = Query(None, gt=0),
+):
+    """
+    Push SOS created/resolved events from the user's network and new incidents near the
+    given location. Clients can send {"latitude", "longitude", "radius_km"} to move the area.
+    """
+    user = await run_in_threadpool(authenticate_stream_token, token)
+    if user is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    hub = get_event_hub()
+    subscription = _subscribe(user.id, latitude, longitude, radius_km)
+
+    async def send_events():
+        while True:
+            event = await _next_event(subscription)
+            await websocket.send_json(event if event is not None else {"type": "ping"})
+
+    async def receive_location_updates():
+        while True:
+            message = await websocket.receive_json()
+            try:
+                hub.update_location(
+                    subscription,
+                    float(message["latitude"]),
+                    float(message["longitude"]),
+                    float(message.get("radius_km") or subscription.radius_km or settings.STREAM_DEFAULT_RADIUS_KM),
+                )
+            except (KeyError, TypeError, ValueError):
+                await websocket.send_json({"type": "error", "detail": "Expected latitude, longitude and an optional radius_km > 0."})
+
+    tasks = [asyncio.create_task(send_events()), asyncio.create_task(receive_location_updates())]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            # Disconnects surface here as WebSocketDisconnect / closed-socket errors
+            exception = task.exception()
+            if exception is not None and not isinstance(exception, (WebSocketDisconnect, RuntimeError)):
+                raise exception
+    finally:
+        for task in tasks:
+            task.cancel()
+        hub.unsubscribe(subscription)
+
+
+@router.get("/stream/sse")
+async def stream_sse(
+    request: Request,
+    token: Optional[str] = Query(None),
+    latitude: Optional[float] = Query(None),
+    longitude: Optional[float] = Query(None),
+    radius_km: Optional[float] = Query(None, gt=0),
+):
+    """
+    Server-Sent Events fallback for /stream. EventSource cannot set headers, so the token
+    may be passed as a query parameter instead of `Authorization: Bearer`.
+    """
+    authorization = request.headers.get("Authorization", "")
+    if token is None and authorization.lower().startswith("bearer "):
+        token = authorization[7:]
+    user = await run_in_threadpool(authenticate_stream_token, token) if token else None
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    hub = get_event_hub()
+    subscription = _subscribe(user.id, latitude, longitude, radius_km)
+
+    async def event_source():
+        try:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                event = await _next_event(subscription)
+                if event is None:
+                    yield ": ping\n\n"
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event['data'], default=str)}\n\n"
+        finally:
+            hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
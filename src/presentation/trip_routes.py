@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Annotated, List
 from src.application.trip.dto import TripBase, TripDTO
-from src.application.dependencies import get_db_session, get_trip_use_cases, get_current_user
+from src.application.dependencies import get_async_db_session, get_trip_use_cases, get_current_user, get_page_request
+from src.domain.pagination.entities import PageRequest
 from src.domain.trip.entities import Trip as TripEntity
 from src.application.trip.use_cases import TripUseCases
 
@@ -12,13 +13,13 @@ router = APIRouter()
 async def get_trip_by_id(
     trip_id: int,
     current_user: Annotated[TripEntity, Depends(get_current_user)],  # Ensure user is authenticated
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     trip_use_cases: TripUseCases = Depends(get_trip_use_cases)
 ):
     """
     Get trip details by ID.
     """
-    trip = trip_use_cases.get_trip(db, trip_id)
+    trip = await db.run_sync(trip_use_cases.get_trip, trip_id)
     if not trip:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trip not found")
     return TripDTO.from_orm(trip)
@@ -27,52 +28,53 @@ async def get_trip_by_id(
 async def get_trips_by_user(
     user_id: int,
     current_user: Annotated[TripEntity, Depends(get_current_user)],  # Ensure user is authenticated
-    db: Session = Depends(get_db_session),
+    page: PageRequest = Depends(get_page_request),
+    db: AsyncSession = Depends(get_async_db_session),
     trip_use_cases: TripUseCases = Depends(get_trip_use_cases)
 ):
     """
-    Get all trips for a specific user.
+    Get the trips of a specific user, newest first; pass the last id as `after` for the next page.
     """
-    trips = trip_use_cases.get_trips_by_user(db, user_id)
+    trips = await db.run_sync(trip_use_cases.get_trips_by_user, user_id, page)
     return [TripDTO.from_orm(trip) for trip in trips]
 
 @router.post("/trips/", response_model=TripDTO, status_code=status.HTTP_201_CREATED)
 async def create_trip(
     trip_data: TripBase,
     current_user: Annotated[TripEntity, Depends(get_current_user)],  # Ensure user is authenticated
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     trip_use_cases: TripUseCases = Depends(get_trip_use_cases)
 ):
     """
     Create a new trip.
     """
-    trip = trip_use_cases.create_trip(db, trip_data)
+    trip = await db.run_sync(trip_use_cases.create_trip, trip_data)
     return TripDTO.from_orm(trip)
 
 @router.delete("/trips/{trip_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_trip(
     trip_id: int,
     current_user: Annotated[TripEntity, Depends(get_current_user)],  # Ensure user is authenticated
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     trip_use_cases: TripUseCases = Depends(get_trip_use_cases)
 ):
     """
     Delete a trip by ID.
     """
-    trip_use_cases.delete_trip(db, trip_id)
+    await db.run_sync(trip_use_cases.delete_trip, trip_id)
 
 @router.put("/trips/{trip_id}", response_model=TripDTO)
 async def update_trip(
     trip_id: int,
     trip_data: TripBase,
     current_user: Annotated[TripEntity, Depends(get_current_user)],  # Ensure user is authenticated
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     trip_use_cases: TripUseCases = Depends(get_trip_use_cases)
 ):
     """
     Update a trip by ID.
     """
-    updated_trip = trip_use_cases.update_trip(db, trip_id, trip_data)
+    updated_trip = await db.run_sync(trip_use_cases.update_trip, trip_id, trip_data)
     if not updated_trip:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trip not found")
     return TripDTO.from_orm(updated_trip)
\ No newline at end of file
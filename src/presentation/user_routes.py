@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Annotated
 
 from src.application.user.dto import UserDTO
-from src.application.dependencies import get_db_session, provide_user_repository, get_current_user
+from src.application.dependencies import get_async_db_session, provide_user_repository, get_current_user
 from src.domain.user.repository_interface import IUserRepository
 from src.domain.user.entities import User as UserEntity
 
@@ -13,13 +13,13 @@ router = APIRouter()
 async def get_user_by_id(
     user_id: int,
     current_user: Annotated[UserEntity, Depends(get_current_user)], # Ensure user is authenticated
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     user_repo: IUserRepository = Depends(provide_user_repository)
 ):
     """
     Get user details by ID.
     """
-    user = user_repo.get_user_by_id(db, user_id)
+    user = await db.run_sync(user_repo.get_user_by_id, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return UserDTO.from_orm(user)
@@ -28,7 +28,7 @@ async def get_user_by_id(
 async def delete_user(
     user_id: int,
     current_user: Annotated[UserEntity, Depends(get_current_user)], # Ensure user is authenticated
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
     user_repo: IUserRepository = Depends(provide_user_repository)
 ):
     """
@@ -37,5 +37,5 @@ async def delete_user(
     if user_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to delete this user")
     
-    if not user_repo.delete_user(db, user_id):
+    if not await db.run_sync(user_repo.delete_user, user_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found or could not be deleted")
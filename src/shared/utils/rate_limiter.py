@@ -0,0 +1,28 @@
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """Token bucket: `rate_per_second` tokens are added per second, up to `burst`."""
+
+    def __init__(self, rate_per_second: float, burst: float = 1):
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be greater than 0.")
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1) -> None:
+        if tokens > self.burst:
+            raise ValueError("Cannot acquire more tokens than the burst size.")
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate_per_second)
+                self._updated_at = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate_per_second)